@@ -0,0 +1,958 @@
+"""
+----------------------------------------------------
+benchmarks.py
+Timing benchmarks for the data structures.
+----------------------------------------------------
+Author: Qadeer Assan
+ID: 160257370
+Email: assa7370@mylaurier.ca
+_updated_="2026-10-18"
+----------------------------------------------------
+"""
+from os import remove
+from random import Random
+from sys import getrecursionlimit, setrecursionlimit
+from tempfile import NamedTemporaryFile
+from time import perf_counter
+import tracemalloc
+
+from bst_linked import BST
+from copy_policy import POLICIES
+from deque_linked import Deque
+from food import Food
+from food_utilities import read_food, read_foods_linked
+from hash_set_adaptive import HashSet as AdaptiveHashSet
+from hash_set_array import HashSet as ArrayHashSet
+from hash_set_bst import HashSet as BSTHashSet
+from hash_set_open import HashSet as OpenHashSet
+from hash_set_sorted import HashSet as SortedHashSet
+from list_array import List as ArrayList
+from list_linked import List as LinkedList
+from list_unrolled import List as UnrolledList
+from priority_queue_array import PriorityQueue
+from priority_queue_linked import PriorityQueue as LinkedPriorityQueue
+from priority_queue_pairing import PriorityQueue as PairingPriorityQueue
+from queue_array import Queue
+from queue_circular import CircularQueue
+from sorted_list_array import SortedList as ArraySortedList
+from sorted_list_linked import SortedList
+from stack_array import Stack
+from top_k import TopK
+
+# Constants
+SEP = '-' * 40
+
+
+def _time_lookups(bst, keys):
+    """
+    -------------------------------------------------------
+    Times bst.retrieve over every key in keys.
+    Use: per_lookup = _time_lookups(bst, keys)
+    -------------------------------------------------------
+    Preconditions:
+        bst - a non-empty BST (BST)
+        keys - keys to retrieve (list)
+    Postconditions:
+        returns
+        per_lookup - average seconds per retrieve (float)
+    -------------------------------------------------------
+    """
+    start = perf_counter()
+    for key in keys:
+        bst.retrieve(key)
+    return (perf_counter() - start) / len(keys)
+
+
+def bst_balance_benchmark(n=1000000, plain_n=5000, lookups=10000):
+    """
+    -------------------------------------------------------
+    Inserts ascending integers into an AVL balanced BST and a plain
+    BST and compares their heights and retrieve latency.
+    The plain BST degenerates into a linked list on sorted input, so
+    its insertion is O(n^2) and recursion depth is n: it is measured
+    with plain_n values rather than n.
+    Use: bst_balance_benchmark()
+    -------------------------------------------------------
+    Preconditions:
+        n - number of ascending values inserted into the AVL tree (int > 0)
+        plain_n - number of ascending values inserted into the plain
+            tree (int > 0)
+        lookups - number of random keys retrieved from each tree (int > 0)
+    Postconditions:
+        Prints insert time, height, and average retrieve time for each tree.
+    -------------------------------------------------------
+    """
+    rng = Random(0)
+    limit = getrecursionlimit()
+    setrecursionlimit(max(limit, plain_n + 100))
+
+    for label, bst, size in (("AVL BST", BST(balanced=True), n),
+                             ("Plain BST", BST(), plain_n)):
+        start = perf_counter()
+        for value in range(size):
+            bst.insert(value)
+        elapsed = perf_counter() - start
+        keys = [rng.randrange(size) for _ in range(lookups)]
+        per_lookup = _time_lookups(bst, keys)
+        print(SEP)
+        print("{}: n = {:,}".format(label, size))
+        print("Insert:   {:.3f} s".format(elapsed))
+        print("Height:   {}".format(bst._root._height))
+        print("Retrieve: {:.2f} us".format(per_lookup * 1e6))
+
+    setrecursionlimit(limit)
+    return
+
+
+def _adt_workloads(n):
+    """
+    -------------------------------------------------------
+    Returns the add / look / take workload for each ADT: n values are
+    added, looked at n times, then taken out again.
+    Use: workloads = _adt_workloads(n)
+    -------------------------------------------------------
+    Preconditions:
+        n - number of values in each workload (int > 0)
+    Postconditions:
+        returns
+        workloads - (name, constructor, add, look, take) tuples, where
+            constructor takes a copy policy and add/look/take take the
+            ADT and a value (list of tuple)
+    -------------------------------------------------------
+    """
+    workloads = [
+        ("Stack", lambda p: Stack(copy=p),
+         lambda a, v: a.push(v), lambda a, v: a.peek(),
+         lambda a, v: a.pop()),
+        ("Queue", lambda p: Queue(copy=p),
+         lambda a, v: a.insert(v), lambda a, v: a.peek(),
+         lambda a, v: a.remove()),
+        ("CircularQueue", lambda p: CircularQueue(n, copy=p),
+         lambda a, v: a.insert(v), lambda a, v: a.peek(),
+         lambda a, v: a.remove()),
+        ("PriorityQueue", lambda p: PriorityQueue(copy=p),
+         lambda a, v: a.insert(v), lambda a, v: a.peek(),
+         lambda a, v: a.remove()),
+        ("PQ (linked)", lambda p: LinkedPriorityQueue(copy=p),
+         lambda a, v: a.insert(v), lambda a, v: a.peek(),
+         lambda a, v: a.remove()),
+        ("List (array)", lambda p: ArrayList(copy=p),
+         lambda a, v: a.append(v), lambda a, v: a[-1],
+         lambda a, v: a.pop()),
+        ("List (linked)", lambda p: LinkedList(copy=p),
+         lambda a, v: a.insert_front(v), lambda a, v: a.peek(),
+         lambda a, v: a.remove_front()),
+        ("SortedList", lambda p: SortedList(copy=p),
+         lambda a, v: a.insert(v), lambda a, v: a.peek(),
+         lambda a, v: a.remove_front()),
+        ("SL (array)", lambda p: ArraySortedList(copy=p),
+         lambda a, v: a.insert(v), lambda a, v: a.peek(),
+         lambda a, v: a.remove_front()),
+        ("Deque", lambda p: Deque(copy=p),
+         lambda a, v: a.insert_front(v), lambda a, v: a.peek_front(),
+         lambda a, v: a.remove_front()),
+        ("BST", lambda p: BST(copy=p),
+         lambda a, v: a.insert(v), lambda a, v: a.retrieve(v),
+         lambda a, v: a.remove(v)),
+    ]
+    return workloads
+
+
+def copy_policy_benchmark(n=20000):
+    """
+    -------------------------------------------------------
+    Measures the throughput of each ADT under each copy policy, using
+    immutable (int, str) tuples as values.
+    Use: copy_policy_benchmark()
+    -------------------------------------------------------
+    Preconditions:
+        n - number of values added to and removed from each ADT (int > 0)
+    Postconditions:
+        Prints operations per second for each ADT and copy policy.
+    -------------------------------------------------------
+    """
+    rng = Random(0)
+    values = [(i, "value {}".format(i)) for i in range(n)]
+    rng.shuffle(values)
+
+    print("{:<16}".format("ADT") +
+          "".join("{:>12}".format(p) for p in POLICIES) + "   (ops/s)")
+    print(SEP * 2)
+
+    for name, constructor, add, look, take in _adt_workloads(n):
+        line = "{:<16}".format(name)
+
+        for policy in POLICIES:
+            adt = constructor(policy)
+            start = perf_counter()
+            for v in values:
+                add(adt, v)
+            for v in values:
+                look(adt, v)
+            for v in values:
+                take(adt, v)
+            elapsed = perf_counter() - start
+            line += "{:>12,.0f}".format(3 * n / elapsed)
+        print(line)
+    return
+
+
+def memory_report(n=100000):
+    """
+    -------------------------------------------------------
+    Measures the memory used by each ADT per stored element with
+    tracemalloc. Values are preallocated ints stored with the "none"
+    copy policy, so only the structure itself is counted.
+    Use: memory_report()
+    -------------------------------------------------------
+    Preconditions:
+        n - number of values stored in each ADT (int > 0)
+    Postconditions:
+        Prints bytes per element for each ADT.
+    -------------------------------------------------------
+    """
+    rng = Random(0)
+    shuffled = list(range(n))
+    rng.shuffle(shuffled)
+    builders = [
+        ("Stack", lambda: Stack(copy="none"), "push", shuffled),
+        ("Queue", lambda: Queue(copy="none"), "insert", shuffled),
+        ("CircularQueue", lambda: CircularQueue(n, copy="none"), "insert",
+         shuffled),
+        ("PriorityQueue", lambda: PriorityQueue(copy="none"), "insert",
+         shuffled),
+        ("PQ (linked)", lambda: LinkedPriorityQueue(copy="none"), "insert",
+         shuffled),
+        ("List (array)", lambda: ArrayList(copy="none"), "append", shuffled),
+        ("List (linked)", lambda: LinkedList(copy="none"), "insert_front",
+         shuffled),
+        ("List (unrolled)", lambda: UnrolledList(copy="none"), "append",
+         shuffled),
+        ("SortedList", lambda: SortedList(copy="none"), "insert", shuffled),
+        ("SL (array)", lambda: ArraySortedList(copy="none"), "insert",
+         shuffled),
+        ("Deque", lambda: Deque(copy="none"), "insert_front", shuffled),
+        ("BST", lambda: BST(copy="none"), "insert", shuffled),
+    ]
+
+    print("{:<16}{:>16}".format("ADT", "bytes/element"))
+    print(SEP)
+
+    for name, constructor, method, values in builders:
+        tracemalloc.start()
+        adt = constructor()
+        add = getattr(adt, method)
+        for v in values:
+            add(v)
+        used, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print("{:<16}{:>16.1f}".format(name, used / n))
+        del adt, add
+    return
+
+
+def queue_benchmark(sizes=(10000, 1000000, 10000000)):
+    """
+    -------------------------------------------------------
+    Measures Queue insert and remove throughput: n values are inserted
+    and then all n are removed. Values are stored with the "none" copy
+    policy so only the queue itself is measured.
+    Use: queue_benchmark()
+    -------------------------------------------------------
+    Preconditions:
+        sizes - numbers of values to insert and remove (tuple of int > 0)
+    Postconditions:
+        Prints insert and remove operations per second for each size.
+    -------------------------------------------------------
+    """
+    print("{:>12}{:>16}{:>16}".format("n", "insert ops/s", "remove ops/s"))
+    print(SEP * 2)
+
+    for n in sizes:
+        q = Queue(copy="none")
+        start = perf_counter()
+        for i in range(n):
+            q.insert(i)
+        inserted = perf_counter() - start
+
+        start = perf_counter()
+        while not q.is_empty():
+            q.remove()
+        removed = perf_counter() - start
+        print("{:>12,}{:>16,.0f}{:>16,.0f}".format(
+            n, n / inserted, n / removed))
+    return
+
+
+def circular_queue_benchmark(n=1000000, size=1024):
+    """
+    -------------------------------------------------------
+    Compares CircularQueue modes: a FIXED queue preallocated for all n
+    values, a GROW queue starting at size slots, and an OVERWRITE queue
+    of size slots that keeps only the newest values. n values are
+    inserted and then the queue is emptied. Values are stored with the
+    "none" copy policy.
+    Use: circular_queue_benchmark()
+    -------------------------------------------------------
+    Preconditions:
+        n - number of values to insert (int > 0)
+        size - initial size of the GROW and OVERWRITE queues (int > 0)
+    Postconditions:
+        Prints insert and remove operations per second and the final
+        number of slots for each mode.
+    -------------------------------------------------------
+    """
+    print("{:<12}{:>16}{:>16}{:>14}".format(
+        "mode", "insert ops/s", "remove ops/s", "slots"))
+    print(SEP * 2)
+
+    for mode, max_size in ((CircularQueue.FIXED, n),
+                           (CircularQueue.GROW, size),
+                           (CircularQueue.OVERWRITE, size)):
+        cq = CircularQueue(max_size, copy="none", mode=mode)
+        start = perf_counter()
+        for i in range(n):
+            cq.insert(i)
+        inserted = perf_counter() - start
+
+        removes = len(cq)
+        start = perf_counter()
+        while not cq.is_empty():
+            cq.remove()
+        removed = perf_counter() - start
+        print("{:<12}{:>16,.0f}{:>16,.0f}{:>14,}".format(
+            mode, n / inserted, removes / removed, cq._max_size))
+    return
+
+
+def merge_benchmark(queues=1000, size=10000):
+    """
+    -------------------------------------------------------
+    Compares the heap-based array PriorityQueue with the pairing heap
+    PriorityQueue: builds queues priority queues of size random values
+    each, combines them all into one, then removes every value.
+    Values are stored with the "none" copy policy.
+    Use: merge_benchmark()
+    -------------------------------------------------------
+    Preconditions:
+        queues - number of priority queues to combine (int > 1)
+        size - number of values in each priority queue (int > 0)
+    Postconditions:
+        Prints insert, combine, and remove times for each implementation.
+    -------------------------------------------------------
+    """
+    rng = Random(0)
+    n = queues * size
+    values = [rng.random() for _ in range(n)]
+
+    print("{:<12}{:>14}{:>14}{:>14}".format(
+        "heap", "insert s", "combine s", "remove s"))
+    print(SEP * 2)
+
+    for name, constructor in (("array", PriorityQueue),
+                              ("pairing", PairingPriorityQueue)):
+        start = perf_counter()
+        pqs = []
+        for i in range(0, n, size):
+            pq = constructor(copy="none")
+            for v in values[i:i + size]:
+                pq.insert(v)
+            pqs.append(pq)
+        inserted = perf_counter() - start
+
+        start = perf_counter()
+        merged = pqs[0]
+        for pq in pqs[1:]:
+            merged = merged.combine(pq)
+        combined = perf_counter() - start
+
+        start = perf_counter()
+        while not merged.is_empty():
+            merged.remove()
+        removed = perf_counter() - start
+        print("{:<12}{:>14.3f}{:>14.3f}{:>14.3f}".format(
+            name, inserted, combined, removed))
+    return
+
+
+def top_k_benchmark(n=1000000, k=100):
+    """
+    -------------------------------------------------------
+    Compares TopK against sorting the whole stream for finding the k
+    largest of n random values, offering them one at a time and with
+    offer_many. Values are stored with the "none" copy policy.
+    Use: top_k_benchmark()
+    -------------------------------------------------------
+    Preconditions:
+        n - number of values in the stream (int > 0)
+        k - number of values to keep (int > 0)
+    Postconditions:
+        Prints the time of each approach.
+    -------------------------------------------------------
+    """
+    rng = Random(0)
+    values = [rng.random() for _ in range(n)]
+
+    print("{:<16}{:>14}".format("approach", "seconds"))
+    print(SEP)
+
+    start = perf_counter()
+    expected = sorted(values, reverse=True)[:k]
+    print("{:<16}{:>14.3f}".format("sorted", perf_counter() - start))
+
+    start = perf_counter()
+    top = TopK(k, copy="none")
+    for v in values:
+        top.offer(v)
+    assert top.extract() == expected
+    print("{:<16}{:>14.3f}".format("offer", perf_counter() - start))
+
+    start = perf_counter()
+    top = TopK(k, copy="none")
+    top.offer_many(values)
+    assert top.extract() == expected
+    print("{:<16}{:>14.3f}".format("offer_many", perf_counter() - start))
+    return
+
+
+def sorted_list_benchmark(sizes=(10000, 100000, 1000000, 10000000),
+                          linked_max=1000000, lookups=10000):
+    """
+    -------------------------------------------------------
+    Compares the skip list SortedList with the chunked array
+    SortedList: inserts n random values, then times lookups, indexing,
+    and removing every value from the front. The linked list is skipped
+    above linked_max values, where it needs several GB of memory.
+    Values are stored with the "none" copy policy.
+    Use: sorted_list_benchmark()
+    -------------------------------------------------------
+    Preconditions:
+        sizes - numbers of values to insert (tuple of int > 0)
+        linked_max - largest size to run the linked version at (int)
+        lookups - number of find and index operations timed (int > 0)
+    Postconditions:
+        Prints the time of each operation in seconds.
+    -------------------------------------------------------
+    """
+    rng = Random(0)
+
+    print("{:<10}{:>12}{:>10}{:>10}{:>10}{:>10}".format(
+        "list", "n", "insert", "find", "[i]", "remove"))
+    print(SEP * 2)
+
+    for n in sizes:
+        values = [rng.random() for _ in range(n)]
+        keys = [rng.choice(values) for _ in range(lookups)]
+        indexes = [rng.randrange(n) for _ in range(lookups)]
+
+        for name, constructor in (("array", ArraySortedList),
+                                  ("linked", SortedList)):
+            if name == "linked" and n > linked_max:
+                print("{:<10}{:>12,}{:>10}".format(name, n, "skipped"))
+                continue
+            sl = constructor(copy="none")
+
+            start = perf_counter()
+            for v in values:
+                sl.insert(v)
+            inserted = perf_counter() - start
+
+            start = perf_counter()
+            for key in keys:
+                sl.find(key)
+            found = perf_counter() - start
+
+            start = perf_counter()
+            for i in indexes:
+                sl[i]
+            indexed = perf_counter() - start
+
+            start = perf_counter()
+            while not sl.is_empty():
+                sl.remove_front()
+            removed = perf_counter() - start
+            print("{:<10}{:>12,}{:>10.3f}{:>10.3f}{:>10.3f}{:>10.3f}".format(
+                name, n, inserted, found, indexed, removed))
+    return
+
+
+def sorted_set_benchmark(n=1000000, lists=8):
+    """
+    -------------------------------------------------------
+    Times the merge-based set operations of both SortedList
+    implementations on two lists of n random ids each, and a k-way
+    merge_many of lists lists of n // lists ids each.
+    Values are stored with the "none" copy policy.
+    Use: sorted_set_benchmark()
+    -------------------------------------------------------
+    Preconditions:
+        n - number of ids in each list (int > 0)
+        lists - number of lists for merge_many (int > 0)
+    Postconditions:
+        Prints the time of each operation in seconds.
+    -------------------------------------------------------
+    """
+    rng = Random(0)
+    ids1 = sorted(rng.randrange(2 * n) for _ in range(n))
+    ids2 = sorted(rng.randrange(2 * n) for _ in range(n))
+    operations = ("intersection", "union", "difference",
+                  "symmetric_difference")
+
+    print("{:<10}{:>24}{:>10}".format("list", "operation", "seconds"))
+    print(SEP)
+
+    for name, constructor in (("array", ArraySortedList),
+                              ("linked", SortedList)):
+        sl1 = constructor(copy="none")
+        sl1._load(ids1)
+        sl2 = constructor(copy="none")
+        sl2._load(ids2)
+
+        for operation in operations:
+            start = perf_counter()
+            getattr(sl1, operation)(sl2)
+            print("{:<10}{:>24}{:>10.3f}".format(
+                name, operation, perf_counter() - start))
+
+        parts = []
+        for i in range(lists):
+            part = constructor(copy="none")
+            part._load(ids1[i::lists])
+            parts.append(part)
+        start = perf_counter()
+        constructor.merge_many(parts, copy="none")
+        print("{:<10}{:>24}{:>10.3f}".format(
+            name, "merge_many", perf_counter() - start))
+    return
+
+
+def food_load_benchmark(lines=1000000):
+    """
+    -------------------------------------------------------
+    Regression benchmark for the linked List tail pointer: writes a
+    food file of lines lines by repeating foods.txt, then times
+    read_foods_linked (one append per food) and a single extend.
+    Both are linear; before _rear, each append walked the whole list.
+    Use: food_load_benchmark()
+    -------------------------------------------------------
+    Preconditions:
+        lines - number of lines in the food file (int > 0)
+    Postconditions:
+        Prints the load times in seconds.
+    -------------------------------------------------------
+    """
+    with open("foods.txt", "r") as fh:
+        source = [line.rstrip("\n") + "\n" for line in fh if line.strip()]
+
+    with NamedTemporaryFile("w", suffix=".txt", delete=False) as fh:
+        name = fh.name
+        for i in range(lines):
+            fh.write(source[i % len(source)])
+
+    print("{:<16}{:>14}{:>10}".format("load", "foods", "seconds"))
+    print(SEP)
+
+    try:
+        with open(name, "r") as fh:
+            start = perf_counter()
+            foods = read_foods_linked(fh)
+            print("{:<16}{:>14,}{:>10.3f}".format(
+                "append", len(foods), perf_counter() - start))
+            del foods
+
+            fh.seek(0)
+            start = perf_counter()
+            foods = LinkedList(copy="none")
+            foods.extend(read_food(line) for line in fh)
+            print("{:<16}{:>14,}{:>10.3f}".format(
+                "extend", len(foods), perf_counter() - start))
+    finally:
+        remove(name)
+    return
+
+
+def list_benchmark(n=100000, inserts=1000, lookups=1000):
+    """
+    -------------------------------------------------------
+    Compares the array, linked, and unrolled linked Lists: appends n
+    values, inserts values at random middle positions, reads random
+    indexes, then iterates over the whole list.
+    Values are stored with the "none" copy policy.
+    Use: list_benchmark()
+    -------------------------------------------------------
+    Preconditions:
+        n - number of values appended (int > 0)
+        inserts - number of middle inserts (int > 0)
+        lookups - number of index reads (int > 0)
+    Postconditions:
+        Prints the time of each operation in seconds.
+    -------------------------------------------------------
+    """
+    rng = Random(0)
+    positions = [rng.randrange(n // 4, 3 * n // 4) for _ in range(inserts)]
+    indexes = [rng.randrange(n) for _ in range(lookups)]
+
+    print("{:<10}{:>10}{:>10}{:>10}{:>10}".format(
+        "list", "append", "insert", "[i]", "iterate"))
+    print(SEP * 2)
+
+    for name, constructor in (("array", ArrayList),
+                              ("linked", LinkedList),
+                              ("unrolled", UnrolledList)):
+        lst = constructor(copy="none")
+
+        start = perf_counter()
+        for v in range(n):
+            lst.append(v)
+        appended = perf_counter() - start
+
+        start = perf_counter()
+        for i in positions:
+            lst.insert(i, -1)
+        inserted = perf_counter() - start
+
+        start = perf_counter()
+        for i in indexes:
+            lst[i]
+        indexed = perf_counter() - start
+
+        start = perf_counter()
+        for _ in lst:
+            pass
+        iterated = perf_counter() - start
+        print("{:<10}{:>10.3f}{:>10.3f}{:>10.3f}{:>10.3f}".format(
+            name, appended, inserted, indexed, iterated))
+    return
+
+
+def _hash_sets():
+    """
+    -------------------------------------------------------
+    Returns the HashSet implementations to compare.
+    Use: hash_sets = _hash_sets()
+    -------------------------------------------------------
+    Postconditions:
+        returns
+        hash_sets - (name, constructor) pairs, where constructor takes
+            the initial number of slots (list of tuple)
+    -------------------------------------------------------
+    """
+    hash_sets = [
+        ("array", lambda slots: ArrayHashSet(slots, copy="none")),
+        ("sorted", lambda slots: SortedHashSet(slots, copy="none")),
+        ("bst", lambda slots: BSTHashSet(slots, copy="none")),
+        ("open", lambda slots: OpenHashSet(slots, copy="none")),
+        ("adaptive", lambda slots: AdaptiveHashSet(slots, copy="none")),
+    ]
+    return hash_sets
+
+
+def hash_set_benchmark(sizes=(1000000, 10000000), lookups=100000,
+                       slots=1024):
+    """
+    -------------------------------------------------------
+    Compares the HashSet implementations: inserts n random int keys
+    (rehashing as they grow from slots slots), then times lookups of
+    keys that are present (hits) and absent (misses). Memory used per
+    key is measured with tracemalloc on a separate build.
+    Use: hash_set_benchmark()
+    -------------------------------------------------------
+    Preconditions:
+        sizes - numbers of keys to insert (tuple of int > 0)
+        lookups - number of hit and of miss lookups timed (int > 0)
+        slots - initial number of slots (int > 0)
+    Postconditions:
+        Prints insert time, hit and miss latency in microseconds, and
+        bytes per key.
+    -------------------------------------------------------
+    """
+    rng = Random(0)
+
+    print("{:<10}{:>12}{:>10}{:>10}{:>10}{:>10}".format(
+        "hash set", "n", "insert s", "hit us", "miss us", "bytes/key"))
+    print(SEP * 2)
+
+    for n in sizes:
+        keys = rng.sample(range(4 * n), n)
+        hits = [rng.choice(keys) for _ in range(lookups)]
+        # Odd keys are never inserted.
+        misses = [4 * n + 2 * i + 1 for i in range(lookups)]
+
+        for name, constructor in _hash_sets():
+            tracemalloc.start()
+            hs = constructor(slots)
+            for key in keys:
+                hs.insert(key)
+            used, _ = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            del hs
+
+            # Time a second build: tracemalloc slows allocation down.
+            start = perf_counter()
+            hs = constructor(slots)
+            for key in keys:
+                hs.insert(key)
+            inserted = perf_counter() - start
+
+            start = perf_counter()
+            for key in hits:
+                key in hs
+            hit = perf_counter() - start
+
+            start = perf_counter()
+            for key in misses:
+                key in hs
+            miss = perf_counter() - start
+            print("{:<10}{:>12,}{:>10.3f}{:>10.2f}{:>10.2f}{:>10.1f}".format(
+                name, n, inserted, hit / lookups * 1e6,
+                miss / lookups * 1e6, used / n))
+            del hs
+    return
+
+
+def rehash_benchmark(n=10000000):
+    """
+    -------------------------------------------------------
+    Times a single _rehash of each HashSet implementation holding n
+    int keys. Each set is filled without rehashing first, by starting
+    it with enough slots for n keys.
+    Use: rehash_benchmark()
+    -------------------------------------------------------
+    Preconditions:
+        n - number of keys in each hashset (int > 0)
+    Postconditions:
+        Prints the rehash time and time per key.
+    -------------------------------------------------------
+    """
+    rng = Random(0)
+    keys = rng.sample(range(4 * n), n)
+
+    print("{:<10}{:>12}{:>10}{:>10}".format("hash set", "n", "seconds",
+                                            "ns/key"))
+    print(SEP)
+
+    for name, constructor in _hash_sets():
+        if name == "open":
+            hs = constructor(2 * n)
+        elif name == "adaptive":
+            hs = constructor(n // AdaptiveHashSet._LOAD_FACTOR + 1)
+        else:
+            hs = constructor(n // ArrayHashSet._LOAD_FACTOR + 1)
+        for key in keys:
+            hs.insert(key)
+
+        start = perf_counter()
+        hs._rehash()
+        elapsed = perf_counter() - start
+        assert len(hs) == n
+        print("{:<10}{:>12,}{:>10.3f}{:>10.0f}".format(
+            name, n, elapsed, elapsed / n * 1e9))
+        del hs
+    return
+
+
+def incremental_rehash_benchmark(n=1000000):
+    """
+    -------------------------------------------------------
+    Times every insert of n int keys into an array HashSet, rehashing
+    all at once and incrementally, and reports the tail latencies
+    that rehashing causes.
+    Use: incremental_rehash_benchmark()
+    -------------------------------------------------------
+    Preconditions:
+        n - number of keys to insert (int > 0)
+    Postconditions:
+        Prints total time and the p50, p99, p99.99 and worst insert
+        times for each mode.
+    -------------------------------------------------------
+    """
+    rng = Random(0)
+    keys = rng.sample(range(4 * n), n)
+
+    print("{:<14}{:>9}{:>9}{:>9}{:>10}{:>10}".format(
+        "mode", "seconds", "p50 us", "p99 us", "p99.99 us", "max us"))
+    print(SEP)
+
+    for name, incremental in (("all at once", False),
+                              ("incremental", True)):
+        hs = ArrayHashSet(1, copy="none", incremental=incremental)
+        times = [0.0] * n
+
+        for i, key in enumerate(keys):
+            start = perf_counter()
+            hs.insert(key)
+            times[i] = perf_counter() - start
+
+        total = sum(times)
+        times.sort()
+        print("{:<14}{:>9.3f}{:>9.2f}{:>9.2f}{:>10.1f}{:>10.1f}".format(
+            name, total, times[n // 2] * 1e6, times[n * 99 // 100] * 1e6,
+            times[n * 9999 // 10000] * 1e6, times[-1] * 1e6))
+        del hs
+    return
+
+
+def collision_benchmark(n=5000, lookups=5000):
+    """
+    -------------------------------------------------------
+    Inserts n int keys that all have the same hash into each HashSet
+    implementation, then times lookups of them. This is the worst case
+    for list chains and linear probing, each O(n) per operation.
+    Use: collision_benchmark()
+    -------------------------------------------------------
+    Preconditions:
+        n - number of colliding keys (int > 0)
+        lookups - number of lookups timed (int > 0)
+    Postconditions:
+        Prints insert time and lookup latency in microseconds.
+    -------------------------------------------------------
+    """
+    rng = Random(0)
+    # Multiples of the hash modulus all hash to 0.
+    modulus = 2 ** 61 - 1
+    keys = [i * modulus for i in rng.sample(range(4 * n), n)]
+    hits = [rng.choice(keys) for _ in range(lookups)]
+
+    print("{:<10}{:>10}{:>10}{:>10}".format(
+        "hash set", "n", "insert s", "hit us"))
+    print(SEP)
+
+    for name, constructor in _hash_sets():
+        hs = constructor(1024)
+
+        start = perf_counter()
+        for key in keys:
+            hs.insert(key)
+        inserted = perf_counter() - start
+
+        start = perf_counter()
+        for key in hits:
+            key in hs
+        hit = perf_counter() - start
+        print("{:<10}{:>10,}{:>10.3f}{:>10.2f}".format(
+            name, n, inserted, hit / lookups * 1e6))
+        del hs
+    return
+
+
+def _ord_sum_hash(food):
+    """
+    -------------------------------------------------------
+    The previous Food.__hash__: the total of the characters in the
+    name. Anagrams collide, and case and origin are ignored.
+    Use: h = _ord_sum_hash(food)
+    -------------------------------------------------------
+    Preconditions:
+        food - a food (Food)
+    Postconditions:
+        returns
+        value - the total of the characters in the name string (int)
+    -------------------------------------------------------
+    """
+    value = 0
+
+    for c in food.name:
+        value = value + ord(c)
+    return value
+
+
+def _chain_report(label, hashes, slots):
+    """
+    -------------------------------------------------------
+    Prints the distribution of chain lengths when hashes are placed
+    into a chained table of size slots, as a HashSet does.
+    Use: _chain_report(label, hashes, slots)
+    -------------------------------------------------------
+    Preconditions:
+        label - row label (str)
+        hashes - hash values of the keys (list of int)
+        slots - number of slots in the table (int > 0)
+    Postconditions:
+        Prints the number of distinct hashes, the number of slots
+        holding 0, 1, 2, 3-4, 5-8, 9-16 and more than 16 keys, the
+        longest chain, and the average number of keys compared by a
+        successful lookup.
+    -------------------------------------------------------
+    """
+    lengths = [0] * slots
+
+    for h in hashes:
+        lengths[h % slots] += 1
+
+    bins = [0] * 7
+    compared = 0
+
+    for length in lengths:
+        if length <= 2:
+            bins[length] += 1
+        elif length <= 4:
+            bins[3] += 1
+        elif length <= 8:
+            bins[4] += 1
+        elif length <= 16:
+            bins[5] += 1
+        else:
+            bins[6] += 1
+        # Finding the i-th key of a chain compares i keys.
+        compared += length * (length + 1) // 2
+
+    print("{:<22}{:>10,}".format(label, len(set(hashes))), end="")
+    for count in bins:
+        print("{:>10,}".format(count), end="")
+    print("{:>10,}{:>10.1f}".format(max(lengths), compared / len(hashes)))
+    return
+
+
+def food_hash_report(n=1000000, load=1):
+    """
+    -------------------------------------------------------
+    Compares the chain length histograms produced by the previous and
+    the current Food.__hash__ for three data sets: the foods in
+    foods.txt, n foods named after foods.txt with a number appended,
+    and n foods with random eight letter names. The table has one
+    slot per load foods.
+    Use: food_hash_report()
+    -------------------------------------------------------
+    Preconditions:
+        n - number of foods in each synthetic data set (int > 0)
+        load - foods per slot (int > 0)
+    Postconditions:
+        Prints a chain length histogram for each data set and hash,
+        and the time taken to hash every food twice.
+    -------------------------------------------------------
+    """
+    rng = Random(0)
+
+    with open("foods.txt", "r") as fh:
+        foods = [read_food(line.rstrip("\n")) for line in fh if line.strip()]
+
+    letters = "abcdefghijklmnopqrstuvwxyz"
+    data_sets = [
+        ("foods.txt", foods),
+        ("numbered", [Food("{} {}".format(foods[i % len(foods)].name, i),
+                           i % len(Food.ORIGIN), False, 0)
+                      for i in range(n)]),
+        ("random", [Food("".join(rng.choice(letters) for _ in range(8)),
+                         rng.randrange(len(Food.ORIGIN)), False, 0)
+                    for _ in range(n)]),
+    ]
+
+    print("{:<22}{:>10}{:>10}{:>10}{:>10}{:>10}{:>10}{:>10}{:>10}{:>10}"
+          "{:>10}".format("data set / hash", "distinct", "0", "1", "2",
+                          "3-4", "5-8", "9-16", ">16", "longest",
+                          "compared"))
+    print(SEP * 3)
+
+    for name, data in data_sets:
+        slots = max(len(data) // load, 1)
+
+        for label, hash_function in (("ord sum", _ord_sum_hash),
+                                     ("cached", hash)):
+            start = perf_counter()
+            hashes = [hash_function(food) for food in data]
+            hashes = [hash_function(food) for food in data]
+            elapsed = perf_counter() - start
+            _chain_report("{} {}".format(name, label), hashes, slots)
+            print("{:<22}{:>10.3f} s to hash twice".format("", elapsed))
+        print()
+    return
@@ -10,53 +10,85 @@ __updated__ = "2017-08-20"
 -------------------------------------------------------
 """
 # Imports
-from copy import deepcopy
-from queue_array import Queue
+from collections import deque
+from copy_policy import copier
 
 class _BSTNode:
+    __slots__ = ('_data', '_left', '_right', '_height', '_size')
 
     def __init__(self, value):
         """
         -------------------------------------------------------
-        Creates a node containing a copy of value.
+        Creates a node containing value.
         Use: node = _BSTNode(value)
         -------------------------------------------------------
         Preconditions:
             value - data for the node (?)
         Postconditions:
             Initializes a BST node containing value. Child pointers are None,
-            height is 1.
+            height is 1, size is 1.
         -------------------------------------------------------
         """
-        self._data = deepcopy(value)
+        self._data = value
         self._left = None
         self._right = None
         self._height = 1
+        self._size = 1
         return
 
     def _update_height(self):
         """
         -------------------------------------------------------
-        Updates the height of the current node.
+        Updates the height and subtree size of the current node.
         Use: node._update_height()
         -------------------------------------------------------
         Postconditions:
             _height is 1 plus the maximum of the node's (up to) two children.
+            _size is 1 plus the sizes of the node's (up to) two children.
         -------------------------------------------------------
         """
         if self._left is None:
             left_height = 0
+            left_size = 0
         else:
             left_height = self._left._height
+            left_size = self._left._size
 
         if self._right is None:
             right_height = 0
+            right_size = 0
         else:
             right_height = self._right._height
+            right_size = self._right._size
 
         self._height = max(left_height, right_height) + 1
+        self._size = left_size + right_size + 1
         return
 
+    def _balance(self):
+        """
+        -------------------------------------------------------
+        Returns the balance factor of the current node.
+        Use: b = node._balance()
+        -------------------------------------------------------
+        Postconditions:
+            returns
+            balance - the height of the left child minus the height of
+            the right child (int)
+        -------------------------------------------------------
+        """
+        if self._left is None:
+            left_height = 0
+        else:
+            left_height = self._left._height
+
+        if self._right is None:
+            right_height = 0
+        else:
+            right_height = self._right._height
+
+        return left_height - right_height
+
     def __str__(self):
         """
         USE FOR TESTING ONLY
@@ -69,20 +101,143 @@ class _BSTNode:
 
 class BST:
 
-    def __init__(self):
+    def __init__(self, balanced=False, copy="deep"):
         """
         -------------------------------------------------------
         Initializes an empty BST.
         Use: bst = BST()
+        Use: avl = BST(balanced=True)
         -------------------------------------------------------
+        Preconditions:
+            balanced - if True the tree is kept AVL balanced by rotating
+                nodes on insert and remove, so that its height is
+                O(log n) even for sorted input (boolean)
+            copy - copy policy for values stored and returned: "deep",
+                "shallow", or "none" (str)
         Postconditions:
             Initializes an empty bst.
         -------------------------------------------------------
         """
         self._root = None
         self._count = 0
+        self._balanced = balanced
+        self._copy_policy = copy
+        self._copy = copier(copy)
         return
 
+    @classmethod
+    def from_sorted(cls, values, balanced=False, copy="deep"):
+        """
+        -------------------------------------------------------
+        Creates a height-balanced BST from values in ascending order in
+        O(n) time. Repeated values are stored only once.
+        Use: bst = BST.from_sorted(values)
+        -------------------------------------------------------
+        Preconditions:
+            values - an iterable of values in ascending order (iterable)
+            balanced - passed to the new BST (boolean)
+            copy - copy policy passed to the new BST (str)
+        Postconditions:
+            returns
+            bst - a BST containing copies of values (BST)
+        -------------------------------------------------------
+        """
+        bst = cls(balanced=balanced, copy=copy)
+        nodes = []
+
+        for value in values:
+            if len(nodes) == 0 or nodes[-1]._data < value:
+                nodes.append(_BSTNode(bst._copy(value)))
+
+        bst._root = bst._build_balanced(nodes, 0, len(nodes) - 1)
+        bst._count = len(nodes)
+        return bst
+
+    @classmethod
+    def from_iterable(cls, values, balanced=False, copy="deep"):
+        """
+        -------------------------------------------------------
+        Creates a height-balanced BST from values in any order in
+        O(n log n) time. Repeated values are stored only once.
+        Use: bst = BST.from_iterable(values)
+        -------------------------------------------------------
+        Preconditions:
+            values - an iterable of comparable values (iterable)
+            balanced - passed to the new BST (boolean)
+            copy - copy policy passed to the new BST (str)
+        Postconditions:
+            returns
+            bst - a BST containing copies of values (BST)
+        -------------------------------------------------------
+        """
+        return cls.from_sorted(sorted(values), balanced, copy)
+
+    def _build_balanced(self, nodes, first, last):
+        """
+        -------------------------------------------------------
+        Links nodes[first:last + 1] into a height-balanced subtree.
+        Private recursive operation called by from_sorted and bulk_insert.
+        Use: node = self._build_balanced(nodes, first, last)
+        -------------------------------------------------------
+        Preconditions:
+            nodes - bst nodes in ascending order of value (list of _BSTNode)
+            first - index of the first node in the subtree (int)
+            last - index of the last node in the subtree (int)
+        Postconditions:
+            returns
+            node - root of the subtree, None if first > last (_BSTNode)
+        -------------------------------------------------------
+        """
+        if first > last:
+            node = None
+        else:
+            middle = (first + last) // 2
+            node = nodes[middle]
+            node._left = self._build_balanced(nodes, first, middle - 1)
+            node._right = self._build_balanced(nodes, middle + 1, last)
+            node._update_height()
+        return node
+
+    def bulk_insert(self, values):
+        """
+        -------------------------------------------------------
+        Inserts copies of a batch of values into the bst by merging them
+        with the existing nodes and relinking the result into a
+        height-balanced tree. Runs in O(n + m) time when values are
+        already sorted. Existing nodes are reused, not copied.
+        Use: n = bst.bulk_insert(values)
+        -------------------------------------------------------
+        Preconditions:
+            values - an iterable of comparable values (iterable)
+        Postconditions:
+            returns
+            inserted - the number of values inserted. Values already in
+                the bst are not inserted. (int)
+        -------------------------------------------------------
+        """
+        batch = sorted(values)
+        nodes = []
+        inserted = 0
+        i = 0
+
+        for node in self._iter_nodes():
+            while i < len(batch) and batch[i] < node._data:
+                if len(nodes) == 0 or nodes[-1]._data < batch[i]:
+                    nodes.append(_BSTNode(self._copy(batch[i])))
+                    inserted += 1
+                i += 1
+            nodes.append(node)
+
+        while i < len(batch):
+            if len(nodes) == 0 or nodes[-1]._data < batch[i]:
+                nodes.append(_BSTNode(self._copy(batch[i])))
+                inserted += 1
+            i += 1
+
+        self._root = self._build_balanced(nodes, 0, len(nodes) - 1)
+        self._count = len(nodes)
+        return inserted
+
     def is_empty(self):
         """
         -------------------------------------------------------
@@ -145,7 +300,7 @@ class BST:
         """
         if node is None:
             # Base case: add a new node containing the value.
-            node = _BSTNode(value)
+            node = _BSTNode(self._copy(value))
             self._count += 1
             inserted = True
         elif node._data > value:
@@ -161,6 +316,8 @@ class BST:
         if inserted:
             # Update the node height if any of its children have been changed.
             node._update_height()
+            if self._balanced:
+                node = self._rebalance(node)
         return node, inserted
 
     def retrieve(self, key):
@@ -189,7 +346,7 @@ class BST:
                 node = node._right
             elif node._data == key:
                 # for comparison counting
-                value = deepcopy(node._data)
+                value = self._copy(node._data)
         return value
 
     def remove(self, key):
@@ -211,92 +368,163 @@ class BST:
 
         self._root, value = self._remove_aux(self._root, key)
         return value
-# 
-#     def _remove_aux(self, node, key):
-#         """
-#         -------------------------------------------------------
-#         Attempts to find a value matching key in a BST node. Deletes the node
-#         if found and returns the sub-tree root.
-#         Private recursive operation called only by remove.
-#         Use: node, value = self._remove_aux(node, key)
-#         -------------------------------------------------------
-#         Preconditions:
-#             node - a bst node to search for key (_BSTNode)
-#             key - data to search for (?)
-#         Postconditions:
-#             returns
-#             node - the current node or its replacement (_BSTNode)
-#             value - value in node containing key, None otherwise.
-#         -------------------------------------------------------
-#         """
-#         if node is None:
-#             # Base Case: the key is not in the tree.
-#             value = None
-#         elif key < node._data:
-#             # Search the left subtree.
-#             node._left, value = self._remove_aux(node._left, key)
-#         elif key > node._data:
-#             # Search the right subtree.
-#             node._right, value = self._remove_aux(node._right, key)
-#         else:
-#             # Value has been found.
-#             value = node._data
-#             # Replace this node with another node.
-#             if node._left is None:
-#                 # node has no left child or has no children.
-# 
-# # your code here
-# 
-# #             elif node._right is None:
-#                 # node has no right child.
-# 
-# # your code here
-# 
-#             else:
-#                 # Node has two children
-#                 if node._left._right is None:
-#                     # left child is replacement node
-#                     repl_node = node._left
-#                 else:
-#                     # find replacement node in right subtree of left node
-#                     repl_node = self._delete_node_left(
-#                         node._left, node._left._right)
-#                     repl_node._left = node._left
-# 
-#                 repl_node._right = node._right
-#                 node = repl_node
-#                 node._update_height()
-# 
-#             self._count -= 1
-# 
-#         if node is not None and value is not None:
-#             # If the value was found, update the ancestor heights.
-#             node._update_height()
-#         return node, value
-
-    def _delete_node_left(self, parent, child):
+
+    def _remove_aux(self, node, key):
+        """
+        -------------------------------------------------------
+        Attempts to find a value matching key in a BST node. Deletes the node
+        if found and returns the sub-tree root.
+        Private recursive operation called only by remove.
+        Use: node, value = self._remove_aux(node, key)
+        -------------------------------------------------------
+        Preconditions:
+            node - a bst node to search for key (_BSTNode)
+            key - data to search for (?)
+        Postconditions:
+            returns
+            node - the current node or its replacement (_BSTNode)
+            value - value in node containing key, None otherwise.
+        -------------------------------------------------------
+        """
+        if node is None:
+            # Base Case: the key is not in the tree.
+            value = None
+        elif key < node._data:
+            # Search the left subtree.
+            node._left, value = self._remove_aux(node._left, key)
+        elif key > node._data:
+            # Search the right subtree.
+            node._right, value = self._remove_aux(node._right, key)
+        else:
+            # Value has been found.
+            value = node._data
+            # Replace this node with another node.
+            if node._left is None:
+                # node has no left child or has no children.
+                node = node._right
+            elif node._right is None:
+                # node has no right child.
+                node = node._left
+            else:
+                # Node has two children: the replacement node is the node
+                # with the maximum value in the left subtree.
+                left, repl_node = self._delete_node_left(node._left)
+                repl_node._left = left
+                repl_node._right = node._right
+                node = repl_node
+            self._count -= 1
+
+        if node is not None and value is not None:
+            # If the value was found, update the ancestor heights.
+            node._update_height()
+            if self._balanced:
+                node = self._rebalance(node)
+        return node, value
+
+    def _delete_node_left(self, node):
         """
         -------------------------------------------------------
         Finds a replacement node for a node to be removed from the tree.
         Private operation called only by _remove_aux.
-        Use: repl_node = self._delete_node_left(node, node._right)
+        Use: node, repl_node = self._delete_node_left(node._left)
         -------------------------------------------------------
         Preconditions:
-            parent - node to search for largest value (_BSTNode)
-            child - the right node of parent (_BSTNode)
+            node - root of the left subtree of the node to remove (_BSTNode)
         Postconditions:
             returns
-            repl_node - the node that replaces the deleted node. This node 
+            node - the root of the subtree with repl_node unlinked (_BSTNode)
+            repl_node - the node that replaces the deleted node. This node
             is the node with the maximum value in the deleted node's left
             subtree (_BSTNode)
         -------------------------------------------------------
         """
+        if node._right is None:
+            # node is the maximum: unlink it and keep its left subtree.
+            repl_node = node
+            node = node._left
+        else:
+            node._right, repl_node = self._delete_node_left(node._right)
+            # Recursively update all parent node heights
+            node._update_height()
+            if self._balanced:
+                node = self._rebalance(node)
+        return node, repl_node
+
+    def _rotate_left(self, node):
+        """
+        -------------------------------------------------------
+        Rotates the subtree rooted at node to the left.
+        Private operation called only by _rebalance.
+        Use: node = self._rotate_left(node)
+        -------------------------------------------------------
+        Preconditions:
+            node - a bst node with a right child (_BSTNode)
+        Postconditions:
+            returns
+            pivot - the new root of the subtree, formerly node's right
+            child. Heights of node and pivot are updated. (_BSTNode)
+        -------------------------------------------------------
+        """
+        pivot = node._right
+        node._right = pivot._left
+        pivot._left = node
+        node._update_height()
+        pivot._update_height()
+        return pivot
+
+    def _rotate_right(self, node):
+        """
+        -------------------------------------------------------
+        Rotates the subtree rooted at node to the right.
+        Private operation called only by _rebalance.
+        Use: node = self._rotate_right(node)
+        -------------------------------------------------------
+        Preconditions:
+            node - a bst node with a left child (_BSTNode)
+        Postconditions:
+            returns
+            pivot - the new root of the subtree, formerly node's left
+            child. Heights of node and pivot are updated. (_BSTNode)
+        -------------------------------------------------------
+        """
+        pivot = node._left
+        node._left = pivot._right
+        pivot._right = node
+        node._update_height()
+        pivot._update_height()
+        return pivot
+
+    def _rebalance(self, node):
+        """
+        -------------------------------------------------------
+        Restores the AVL property at node by performing a single or
+        double rotation. node's height must already be up to date.
+        Private operation called only by _insert_aux and _remove_aux.
+        Use: node = self._rebalance(node)
+        -------------------------------------------------------
+        Preconditions:
+            node - a bst node whose children are AVL balanced (_BSTNode)
+        Postconditions:
+            returns
+            node - the root of the rebalanced subtree (_BSTNode)
+        -------------------------------------------------------
+        """
+        balance = node._balance()
+
+        if balance > 1:
+            # Left heavy.
+            if node._left._balance() < 0:
+                # Left-right case.
+                node._left = self._rotate_left(node._left)
+            node = self._rotate_right(node)
+        elif balance < -1:
+            # Right heavy.
+            if node._right._balance() > 0:
+                # Right-left case.
+                node._right = self._rotate_right(node._right)
+            node = self._rotate_left(node)
+        return node
 
-        repl_node = self._root
-        # Recursively update all parent node heights
-        parent._update_height()
-        return repl_node
-    
     def balanced(self):
         """
         ---------------------------------------------------------
@@ -425,67 +653,322 @@ class BST:
         return zero, one, two
     
     def inorder(self):
-        l = []
-        l = self._inorder_aux(self._root, l)
-        return l
-    
-    def _inorder_aux(self,node, l):
-        if node is not None:
-            self._inorder_aux(node._left, l)
-            l.append(node._data)
-            self._inorder_aux(node._right, l)
-        return l
+        """
+        -------------------------------------------------------
+        Returns the values in the bst in inorder (sorted) order.
+        Use: values = bst.inorder()
+        -------------------------------------------------------
+        Postconditions:
+            returns
+            values - the bst values in inorder (list)
+        -------------------------------------------------------
+        """
+        return list(self.iter_inorder())
 
     def preorder(self):
-        l = []
-        l = self._preorder_aux(self._root, l)
-        return l
-    
-    def _preorder_aux(self,node, l):
-        if node is not None:
-            l.append(node._data)
-            self._inorder_aux(node._left, list)
-            self._inorder_aux(node._right, list)
-        return list
-    
+        """
+        -------------------------------------------------------
+        Returns the values in the bst in preorder.
+        Use: values = bst.preorder()
+        -------------------------------------------------------
+        Postconditions:
+            returns
+            values - the bst values in preorder (list)
+        -------------------------------------------------------
+        """
+        return list(self.iter_preorder())
+
     def postorder(self):
-        l = []
-        l = self._inorder_aux(self._root, l)
-        return
-    
-    def _postorder_aux(self,node,l):
-        if node is not None:
-            self._inorder_aux(node._left,l)
-            self._inorder_aux(node._right,l)
-            l.append(node._data)
-        return
-    
+        """
+        -------------------------------------------------------
+        Returns the values in the bst in postorder.
+        Use: values = bst.postorder()
+        -------------------------------------------------------
+        Postconditions:
+            returns
+            values - the bst values in postorder (list)
+        -------------------------------------------------------
+        """
+        return list(self.iter_postorder())
+
     def levelorder(self):
-        l=[]
-        l=self._levelorder_aux(self._root,l)
-        return
-    
-    def _levelorder_aux(self,node,l):
-        values = []
+        """
+        -------------------------------------------------------
+        Returns the values in the bst in level order.
+        Use: values = bst.levelorder()
+        -------------------------------------------------------
+        Postconditions:
+            returns
+            values - the bst values in level order (list)
+        -------------------------------------------------------
+        """
+        return list(self.iter_levelorder())
+
+    def iter_inorder(self):
+        """
+        -------------------------------------------------------
+        Generates the values in the bst in inorder (sorted) order.
+        Iterative: uses an explicit stack of at most height nodes.
+        Use: for v in bst.iter_inorder():
+        -------------------------------------------------------
+        Postconditions:
+            yields
+            value - the next value in inorder (?)
+        -------------------------------------------------------
+        """
+        for node in self._iter_nodes():
+            yield node._data
+
+    def _iter_nodes(self):
+        """
+        -------------------------------------------------------
+        Generates the nodes of the bst in inorder (sorted) order.
+        Private operation called by iter_inorder and bulk_insert.
+        Use: for node in self._iter_nodes():
+        -------------------------------------------------------
+        Postconditions:
+            yields
+            node - the next node in inorder (_BSTNode)
+        -------------------------------------------------------
+        """
+        stack = []
+        node = self._root
+
+        while node is not None or len(stack) > 0:
+            # Descend as far left as possible.
+            while node is not None:
+                stack.append(node)
+                node = node._left
+            node = stack.pop()
+            right = node._right
+            yield node
+            node = right
+
+    def iter_preorder(self):
+        """
+        -------------------------------------------------------
+        Generates the values in the bst in preorder.
+        Iterative: uses an explicit stack.
+        Use: for v in bst.iter_preorder():
+        -------------------------------------------------------
+        Postconditions:
+            yields
+            value - the next value in preorder (?)
+        -------------------------------------------------------
+        """
+        if self._root is not None:
+            stack = [self._root]
+
+            while len(stack) > 0:
+                node = stack.pop()
+                yield node._data
+                # Push right first so that the left subtree is visited first.
+                if node._right is not None:
+                    stack.append(node._right)
+                if node._left is not None:
+                    stack.append(node._left)
+
+    def iter_postorder(self):
+        """
+        -------------------------------------------------------
+        Generates the values in the bst in postorder.
+        Iterative: uses an explicit stack of at most height nodes.
+        Use: for v in bst.iter_postorder():
+        -------------------------------------------------------
+        Postconditions:
+            yields
+            value - the next value in postorder (?)
+        -------------------------------------------------------
+        """
+        stack = []
+        node = self._root
+        previous = None
+
+        while node is not None or len(stack) > 0:
+            while node is not None:
+                stack.append(node)
+                node = node._left
+            top = stack[-1]
+
+            if top._right is not None and top._right is not previous:
+                # Visit the right subtree before top.
+                node = top._right
+            else:
+                stack.pop()
+                yield top._data
+                previous = top
 
+    def iter_levelorder(self):
+        """
+        -------------------------------------------------------
+        Generates the values in the bst in level order.
+        Uses a deque so that each node is dequeued in O(1) time.
+        Use: for v in bst.iter_levelorder():
+        -------------------------------------------------------
+        Postconditions:
+            yields
+            value - the next value in level order (?)
+        -------------------------------------------------------
+        """
         if self._root is not None:
-            # Put the nodes for one level into a queue.
-            queue = []
+            queue = deque()
             queue.append(self._root)
 
             while len(queue) > 0:
-                # Add a copy of the data to the sublist
-                node = queue.pop(0)
-                values.append(deepcopy(node._data))
+                node = queue.popleft()
+                yield node._data
 
                 if node._left is not None:
                     queue.append(node._left)
                 if node._right is not None:
                     queue.append(node._right)
-        return values
-            
-        return
-    
+
+    def range(self, lo, hi):
+        """
+        -------------------------------------------------------
+        Generates the values in the bst within lo <= value <= hi in
+        sorted order. Only the nodes on the paths to lo and hi and
+        the nodes in range are visited: O(height + k) for k values.
+        Use: for v in bst.range(lo, hi):
+        -------------------------------------------------------
+        Preconditions:
+            lo - lower bound of the range (?)
+            hi - upper bound of the range (?)
+        Postconditions:
+            yields
+            value - the next value in the range (?)
+        -------------------------------------------------------
+        """
+        stack = []
+        node = self._root
+
+        while node is not None or len(stack) > 0:
+            # Descend left, skipping subtrees that lie entirely below lo.
+            while node is not None:
+                if node._data < lo:
+                    node = node._right
+                else:
+                    stack.append(node)
+                    node = node._left
+
+            if len(stack) > 0:
+                node = stack.pop()
+                if node._data > hi:
+                    # Every remaining value is larger.
+                    stack = []
+                    node = None
+                else:
+                    yield node._data
+                    node = node._right
+
+    def _neighbour(self, key, above, inclusive):
+        """
+        -------------------------------------------------------
+        Finds the closest value to key on one side of key.
+        Private operation called by successor, predecessor, floor
+        and ceiling.
+        Use: value = self._neighbour(key, above, inclusive)
+        -------------------------------------------------------
+        Preconditions:
+            key - data to compare against (?)
+            above - True to search for values above key, False for
+                values below key (boolean)
+            inclusive - True if a value equal to key matches (boolean)
+        Postconditions:
+            returns
+            value - a copy of the closest matching value, None if there
+                is no such value (?)
+        -------------------------------------------------------
+        """
+        node = self._root
+        best = None
+
+        while node is not None:
+            if node._data == key:
+                if inclusive:
+                    best = node
+                    node = None
+                elif above:
+                    node = node._right
+                else:
+                    node = node._left
+            elif node._data > key:
+                if above:
+                    # node is a candidate: look for a closer one.
+                    best = node
+                node = node._left
+            else:
+                if not above:
+                    # node is a candidate: look for a closer one.
+                    best = node
+                node = node._right
+
+        if best is None:
+            value = None
+        else:
+            value = self._copy(best._data)
+        return value
+
+    def successor(self, key):
+        """
+        -------------------------------------------------------
+        Returns the smallest value in the bst greater than key.
+        Use: value = bst.successor(key)
+        -------------------------------------------------------
+        Preconditions:
+            key - data to compare against (?)
+        Postconditions:
+            returns
+            value - a copy of the smallest value > key, None if none (?)
+        -------------------------------------------------------
+        """
+        return self._neighbour(key, True, False)
+
+    def predecessor(self, key):
+        """
+        -------------------------------------------------------
+        Returns the largest value in the bst less than key.
+        Use: value = bst.predecessor(key)
+        -------------------------------------------------------
+        Preconditions:
+            key - data to compare against (?)
+        Postconditions:
+            returns
+            value - a copy of the largest value < key, None if none (?)
+        -------------------------------------------------------
+        """
+        return self._neighbour(key, False, False)
+
+    def ceiling(self, key):
+        """
+        -------------------------------------------------------
+        Returns the smallest value in the bst greater than or equal to key.
+        Use: value = bst.ceiling(key)
+        -------------------------------------------------------
+        Preconditions:
+            key - data to compare against (?)
+        Postconditions:
+            returns
+            value - a copy of the smallest value >= key, None if none (?)
+        -------------------------------------------------------
+        """
+        return self._neighbour(key, True, True)
+
+    def floor(self, key):
+        """
+        -------------------------------------------------------
+        Returns the largest value in the bst less than or equal to key.
+        Use: value = bst.floor(key)
+        -------------------------------------------------------
+        Preconditions:
+            key - data to compare against (?)
+        Postconditions:
+            returns
+            value - a copy of the largest value <= key, None if none (?)
+        -------------------------------------------------------
+        """
+        return self._neighbour(key, False, True)
+
     def max_r(self):
         """
         ---------------------------------------------------------
@@ -544,42 +1027,146 @@ class BST:
             value - the values in the BST node and its children (?)
     -------------------------------------------------------
         """
-        if self._root is not None:
-            # Put the nodes for one level into a queue.
-            queue = []
-            queue.append(self._root)
-    
-            while len(queue) > 0:
-                # Add a copy of the data to the sublist
-                node = queue.pop(0)
-                yield node._data
-    
-                if node._left is not None:
-                    queue.append(node._left)
-                if node._right is not None:
-                    queue.append(node._right)
+        return self.iter_levelorder()
 
-    def count_apply(self, func):
+    def count_apply(self, func, lo=None, hi=None):
         """
         ---------------------------------------------------------
         Returns the number of values in a BST where func(value) is True.
+        If lo and/or hi are given only values within lo <= value <= hi
+        are tested, and subtrees entirely outside that range are skipped.
         Use: number = bst.count_apply(func)
+        Use: number = bst.count_apply(func, lo, hi)
         -------------------------------------------------------
         Preconditions:
             func - a function that given a value in the bst returns
                 True for some condition, otherwise returns False.
+            lo - lower bound of values to test, None for no bound (?)
+            hi - upper bound of values to test, None for no bound (?)
         Postconditions:
             returns
             number - count of nodes in tree where func(value) is True (int)
         ----------------------------------------------------------
         """
-        number = self._count_apply_aux(func, self._root, 0)
+        number = self._count_apply_aux(func, self._root, 0, lo, hi)
+        return number
+
+    def _count_apply_aux(self, func, node, number, lo, hi):
+        if node is not None:
+            above_lo = lo is None or node._data >= lo
+            below_hi = hi is None or node._data <= hi
+
+            if above_lo and below_hi and func(node._data):
+                number += 1
+            if above_lo:
+                # The left subtree may contain values in range.
+                number = self._count_apply_aux(
+                    func, node._left, number, lo, hi)
+            if below_hi:
+                # The right subtree may contain values in range.
+                number = self._count_apply_aux(
+                    func, node._right, number, lo, hi)
+        return number
+
+    def _rank_aux(self, key, inclusive):
+        """
+        -------------------------------------------------------
+        Counts the values less than (or equal to) key using subtree sizes.
+        Private operation called only by rank and count_range.
+        Use: number = self._rank_aux(key, inclusive)
+        -------------------------------------------------------
+        Preconditions:
+            key - data to compare against (?)
+            inclusive - if True values equal to key are counted (boolean)
+        Postconditions:
+            returns
+            number - count of values < key, or <= key if inclusive (int)
+        -------------------------------------------------------
+        """
+        number = 0
+        node = self._root
+
+        while node is not None:
+            if node._data < key or (inclusive and node._data == key):
+                # node and its whole left subtree are counted.
+                number += 1
+                if node._left is not None:
+                    number += node._left._size
+                node = node._right
+            else:
+                node = node._left
+        return number
+
+    def rank(self, key):
+        """
+        -------------------------------------------------------
+        Returns the number of values in the bst that are less than key.
+        If key is in the bst this is its index in sorted order.
+        Runs in O(height) time.
+        Use: n = bst.rank(key)
+        -------------------------------------------------------
+        Preconditions:
+            key - data to compare against (?)
+        Postconditions:
+            returns
+            number - count of values less than key (int)
+        -------------------------------------------------------
+        """
+        number = self._rank_aux(key, False)
+        return number
+
+    def select(self, k):
+        """
+        -------------------------------------------------------
+        Returns a copy of the k-th smallest value in the bst, where the
+        smallest value has k = 0. Runs in O(height) time.
+        Use: value = bst.select(k)
+        -------------------------------------------------------
+        Preconditions:
+            k - the sorted position of the value (0 <= int < len(bst))
+        Postconditions:
+            returns
+            value - a copy of the k-th smallest value in the bst (?)
+        -------------------------------------------------------
+        """
+        assert 0 <= k < self._count, "Invalid select position"
+
+        node = self._root
+        found = False
+
+        while not found:
+            if node._left is None:
+                left_size = 0
+            else:
+                left_size = node._left._size
+
+            if k < left_size:
+                node = node._left
+            elif k > left_size:
+                k -= left_size + 1
+                node = node._right
+            else:
+                found = True
+
+        value = self._copy(node._data)
+        return value
+
+    def count_range(self, lo, hi):
+        """
+        -------------------------------------------------------
+        Returns the number of values in the bst within lo <= value <= hi.
+        Runs in O(height) time.
+        Use: n = bst.count_range(lo, hi)
+        -------------------------------------------------------
+        Preconditions:
+            lo - lower bound of the range (?)
+            hi - upper bound of the range (?)
+        Postconditions:
+            returns
+            number - count of values between lo and hi inclusive (int)
+        -------------------------------------------------------
+        """
+        number = 0
+        if lo <= hi:
+            number = self._rank_aux(hi, True) - self._rank_aux(lo, False)
         return number
-    def _count_apply_aux(self, func, node, number):
-        if func(node._data):
-            number += 1
-        if node._left is not None:
-            number = self._count_apply_aux(func, node._left, number)
-        if node._right is not None:
-            number = self._count_apply_aux(func, node._right, number)
-        return number
\ No newline at end of file
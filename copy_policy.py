@@ -0,0 +1,64 @@
+"""
+-------------------------------------------------------
+copy_policy.py
+Copy policies for values stored in and returned by the ADTs.
+-------------------------------------------------------
+Author:  David Brown
+ID:      999999999
+Email:   dbrown@wlu.ca
+__updated__ = "2026-10-18"
+-------------------------------------------------------
+"""
+# Imports
+from copy import copy as shallowcopy
+from copy import deepcopy
+
+# Constants
+DEEP = "deep"
+SHALLOW = "shallow"
+NONE = "none"
+POLICIES = (DEEP, SHALLOW, NONE)
+
+
+def _no_copy(value):
+    """
+    -------------------------------------------------------
+    Returns value itself. Used for the "none" policy.
+    Use: v = _no_copy(value)
+    -------------------------------------------------------
+    Preconditions:
+        value - a data element (?)
+    Postconditions:
+        returns
+        value - the same object that was passed in (?)
+    -------------------------------------------------------
+    """
+    return value
+
+
+def copier(policy):
+    """
+    -------------------------------------------------------
+    Returns the function an ADT uses to copy values under policy.
+    "deep" copies values with copy.deepcopy (the default for every ADT),
+    "shallow" uses copy.copy, and "none" stores and returns the caller's
+    objects themselves. "none" is safe for immutable values such as
+    ints, strings and tuples of immutable values.
+    Use: self._copy = copier(policy)
+    -------------------------------------------------------
+    Preconditions:
+        policy - one of "deep", "shallow", or "none" (str)
+    Postconditions:
+        returns
+        func - a function that given a value returns its copy (function)
+    -------------------------------------------------------
+    """
+    assert policy in POLICIES, "Invalid copy policy: {}".format(policy)
+
+    if policy == DEEP:
+        func = deepcopy
+    elif policy == SHALLOW:
+        func = shallowcopy
+    else:
+        func = _no_copy
+    return func
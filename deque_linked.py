@@ -10,10 +10,11 @@ __updated__ = "2017-07-08"
 -------------------------------------------------------
 """
 # Imports
-from copy import deepcopy
+from copy_policy import copier
 
 
 class _DequeNode:
+    __slots__ = ('_data', '_prev', '_next')
 
     def __init__(self, value, _prev, _next):
         """
@@ -26,11 +27,11 @@ class _DequeNode:
             _prev - another deque node (_DequeNode)
             _next - another deque node (_DequeNode)
         Postconditions:
-            Initializes a deque node that contains a copy of value
+            Initializes a deque node that contains value
             and links to the previous and next nodes in the deque.
         -------------------------------------------------------
         """
-        self._data = deepcopy(value)
+        self._data = value
         self._prev = _prev
         self._next = _next
         return
@@ -38,12 +39,15 @@ class _DequeNode:
 
 class Deque:
 
-    def __init__(self):
+    def __init__(self, copy="deep"):
         """
         -------------------------------------------------------
         Initializes an empty deque.
         Use: d = deque()
         -------------------------------------------------------
+        Preconditions:
+            copy - copy policy for values stored and returned: "deep",
+                "shallow", or "none" (str)
         Postconditions:
             Initializes an empty deque.
         -------------------------------------------------------
@@ -51,6 +55,8 @@ class Deque:
         self._front = None
         self._rear = None
         self._count = 0
+        self._copy_policy = copy
+        self._copy = copier(copy)
         return
 
     def is_empty(self):
@@ -92,7 +98,7 @@ class Deque:
         -------------------------------------------------------
         """
         temp = self._front
-        node = _DequeNode(deepcopy(value), None, temp)
+        node = _DequeNode(self._copy(value), None, temp)
         self._front = node
         self._count += 1
         if self._rear is None:
@@ -112,7 +118,7 @@ class Deque:
         -------------------------------------------------------
         """
         temp = self._rear
-        node = _DequeNode(deepcopy(value), temp, None)
+        node = _DequeNode(self._copy(value), temp, None)
         self._rear = node
         self._count += 1
         if self._front is None:
@@ -133,7 +139,7 @@ class Deque:
         """
         assert self._front is not None, "Cannot remove from an empty dequeue"
 
-        value = deepcopy(self._front._data)
+        value = self._copy(self._front._data)
         self._front = self._front._next
         if self._front is None:
             self._rear = None
@@ -155,7 +161,7 @@ class Deque:
         """
         assert self._rear is not None, "Cannot remove from an empty dequeue"
 
-        value = deepcopy(self._rear._data)
+        value = self._copy(self._rear._data)
         self._rear = self._rear._prev
         if self._rear is None:
             self._front = None      
@@ -176,7 +182,7 @@ class Deque:
         """
         assert self._front is not None, "Cannot peek at an empty dequeue"
 
-        value = deepcopy(self._front._data)
+        value = self._copy(self._front._data)
         return value
 
     def peek_rear(self):
@@ -193,7 +199,7 @@ class Deque:
         """
         assert self._rear is not None, "Cannot peek at an empty dequeue"
 
-        value = deepcopy(self._rear._data)
+        value = self._copy(self._rear._data)
         
         return value
 
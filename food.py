@@ -47,19 +47,24 @@ class Food:
     def __hash__(self):
         """
         -------------------------------------------------------
-        Generates a hash value from a food name.
+        Generates a hash value from the lower case food name and the
+        origin, the same fields __eq__ compares, so equal foods have
+        equal hashes. The value is cached on the food together with
+        the name and origin it was computed from, and is recomputed
+        only if either has since been changed.
         Use: h = hash(f)
         -------------------------------------------------------
         Postconditions:
             returns
-            value - the total of the characters in the name string (int > 0)
+            value - the hash of the lower case name and origin (int)
         -------------------------------------------------------
         """
-        value = 0
-
-        for c in self.name:
-            value = value + ord(c)
-        return value
+        if self._hash_name is not self.name or \
+                self._hash_origin != self.origin:
+            self._hash_name = self.name
+            self._hash_origin = self.origin
+            self._hash = hash((self.name.lower(), self.origin))
+        return self._hash
     
     def __init__(self, name, origin, is_vegetarian, calories):
         """
@@ -84,6 +89,10 @@ class Food:
         self.origin = origin
         self.is_vegetarian = is_vegetarian
         self.calories = calories
+        # Cache for __hash__: the name and origin it was computed from.
+        self._hash_name = None
+        self._hash_origin = None
+        self._hash = 0
         return
 
     def __str__(self):
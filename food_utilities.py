@@ -97,25 +97,28 @@ def read_foods_linked(file_variable):
         foods.append(food)
     return foods
 
-def read_foods_sorted(file_variable):
+def read_foods_sorted(file_variable, sorted_list=SortedList):
     """
     -------------------------------------------------------
-    Reads a file of food strings into a list of Food objects.
-    Use: foods = read_food(file_variable)
+    Reads a file of food strings into a sorted list of Food objects.
+    Use: foods = read_foods_sorted(file_variable)
+    Use: foods = read_foods_sorted(file_variable, sorted_list_array.SortedList)
     -------------------------------------------------------
     Preconditions:
         file_variable - a file of food data (file)
+        sorted_list - the sorted list class to build, linked by
+            default (class)
     Postconditions:
         returns
-        foods - a list of food objects (list of food)
+        foods - a sorted list of food objects (SortedList of Food)
     -------------------------------------------------------
     """
     file_variable.seek(0)
-    foods = SortedList()
+    foods = sorted_list()
 
     for line in file_variable:
         food = read_food(line)
-        foods.append(food)
+        foods.insert(food)
     return foods
 
 def write_foods(file_variable, foods):
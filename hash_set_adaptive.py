@@ -0,0 +1,327 @@
+"""
+-------------------------------------------------------
+hash_set_adaptive.py
+Adaptive bucket version of the Hash Set ADT.
+-------------------------------------------------------
+Author:  David Brown
+ID:      999999999
+Email:   dbrown@wlu.ca
+__updated__ = "2026-10-18"
+-------------------------------------------------------
+"""
+# Imports
+from bst_linked import BST
+from copy_policy import copier
+
+# Constants
+SEP = '-' * 40
+
+
+class HashSet:
+    """
+    -------------------------------------------------------
+    Constants.
+    -------------------------------------------------------
+    """
+    _LOAD_FACTOR = 2
+    # A list bucket longer than _TREEIFY becomes a tree; a tree bucket
+    # no longer than _UNTREEIFY becomes a list again. The gap stops a
+    # bucket converting back and forth on alternate inserts and removes.
+    _TREEIFY = 8
+    _UNTREEIFY = 6
+
+    def __init__(self, slots, copy="deep"):
+        """
+        -------------------------------------------------------
+        Initializes an empty HashSet of size slots. An empty slot is
+        None. A slot with keys starts as a small Python list searched
+        linearly, and is converted to an AVL balanced BST when it grows
+        past _TREEIFY keys, so heavily colliding keys still cost only
+        O(log n) comparisons. Keys must therefore be ordered as well as
+        hashable.
+        Use: hs = HashSet(slots)
+        -------------------------------------------------------
+        Precondition:
+            slots - number of initial slots in hashset (int > 0)
+            copy - copy policy for values stored and returned: "deep",
+                "shallow", or "none" (str)
+        Postconditions:
+            Initializes an empty HashSet.
+        -------------------------------------------------------
+        """
+        self._slots = slots
+        self._table = [None] * slots
+        self._total = self._LOAD_FACTOR * slots
+        self._count = 0
+        # Number of slots currently holding a BST.
+        self._trees = 0
+        self._copy_policy = copy
+        self._copy = copier(copy)
+        return
+
+    def __len__(self):
+        """
+        -------------------------------------------------------
+        Returns the number of values in the hashset.
+        Use: n = len( hs )
+        -------------------------------------------------------
+        Postconditions:
+            Returns the number of values in the hashset.
+        -------------------------------------------------------
+        """
+        return self._count
+
+    def is_empty(self):
+        """
+        -------------------------------------------------------
+        Determines if the hashset is empty.
+        Use: b = hs.is_empty()
+        -------------------------------------------------------
+        Postconditions:
+            Returns True if the hashset is empty, False otherwise.
+        -------------------------------------------------------
+        """
+        return self._count == 0
+
+    def tree_slots(self):
+        """
+        -------------------------------------------------------
+        Returns the number of slots that have been converted to trees.
+        Use: n = hs.tree_slots()
+        -------------------------------------------------------
+        Postconditions:
+            returns
+            n - number of slots holding a BST (int)
+        -------------------------------------------------------
+        """
+        return self._trees
+
+    def _treeify(self, chain):
+        """
+        -------------------------------------------------------
+        Builds a balanced tree slot from the keys of a list slot.
+        Private helper method - used only by other ADT methods.
+        Use: tree = self._treeify(chain)
+        -------------------------------------------------------
+        Preconditions:
+            chain - distinct keys (list)
+        Postconditions:
+            returns
+            tree - an AVL balanced BST holding the keys of chain,
+                not copied (BST)
+        -------------------------------------------------------
+        """
+        self._trees += 1
+        return BST.from_iterable(chain, balanced=True, copy="none")
+
+    def __contains__(self, key):
+        """
+        ---------------------------------------------------------
+        Determines if the hashset contains key.
+        Use: b = key in hs
+        -------------------------------------------------------
+        Preconditions:
+            key - a comparable data element (?)
+        Postconditions:
+            Returns True if the hashset contains key, False otherwise.
+        -------------------------------------------------------
+        """
+        slot = self._table[hash(key) % self._slots]
+
+        if slot is None:
+            found = False
+        elif type(slot) is list:
+            found = key in slot
+        else:
+            found = slot.retrieve(key) is not None
+        return found
+
+    def insert(self, value):
+        """
+        ---------------------------------------------------------
+        Inserts value into the hashset, allows only one copy of value.
+        Calls _rehash if the hashset _LOAD_FACTOR is exceeded.
+        Use: inserted = hs.insert( value )
+        -------------------------------------------------------
+        Preconditions:
+            value - a comparable data element (?)
+        Postconditions:
+            returns
+            inserted - True if value is inserted, False otherwise.
+        -------------------------------------------------------
+        """
+        i = hash(value) % self._slots
+        slot = self._table[i]
+
+        if slot is None:
+            self._table[i] = [self._copy(value)]
+            inserted = True
+        elif type(slot) is list:
+            inserted = value not in slot
+
+            if inserted:
+                slot.append(self._copy(value))
+
+                if len(slot) > self._TREEIFY:
+                    self._table[i] = self._treeify(slot)
+        else:
+            inserted = slot.insert(self._copy(value))
+
+        if inserted:
+            self._count += 1
+
+            if self._count > self._total:
+                self._rehash()
+        return inserted
+
+    def find(self, key):
+        """
+        ---------------------------------------------------------
+        Returns the value identified by key.
+        Use: value = hs.find( key )
+        -------------------------------------------------------
+        Preconditions:
+            key - a comparable data element (?)
+        Postconditions:
+            returns:
+            value - a copy of the value if it exists in the hashset,
+                None otherwise.
+        -------------------------------------------------------
+        """
+        slot = self._table[hash(key) % self._slots]
+        value = None
+
+        if slot is None:
+            pass
+        elif type(slot) is list:
+            for v in slot:
+                if v == key:
+                    value = v
+                    break
+        else:
+            value = slot.retrieve(key)
+
+        if value is not None:
+            value = self._copy(value)
+        return value
+
+    def remove(self, key):
+        """
+        ---------------------------------------------------------
+        Removes the value matching key from the hashset, if it exists.
+        Use: value = hs.remove( key )
+        -------------------------------------------------------
+        Preconditions:
+            key - a comparable data element (?)
+        Postconditions:
+            returns:
+            value - if it exists in the hashset, None otherwise.
+        -------------------------------------------------------
+        """
+        i = hash(key) % self._slots
+        slot = self._table[i]
+        value = None
+
+        if slot is None:
+            pass
+        elif type(slot) is list:
+            for j in range(len(slot)):
+                if slot[j] == key:
+                    value = slot.pop(j)
+                    break
+
+            if len(slot) == 0:
+                self._table[i] = None
+        else:
+            value = slot.remove(key)
+
+            if len(slot) <= self._UNTREEIFY:
+                self._table[i] = list(slot.iter_inorder())
+                self._trees -= 1
+
+        if value is not None:
+            self._count -= 1
+        return value
+
+    def _rehash(self):
+        """
+        ---------------------------------------------------------
+        Increases the number of slots in the hashset and reallocates the
+        existing data within the hashset to a new table. Each key is
+        hashed once and moved without copying; only the new slots
+        longer than _TREEIFY are built as trees. O(n log n) at worst,
+        O(n) when the keys are spread out.
+        Use: hs._rehash()
+        -------------------------------------------------------
+        Postconditions:
+            Existing data is reallocated amongst the hashset table.
+        -------------------------------------------------------
+        """
+        slots = self._slots * 2 + 1
+        table = [None] * slots
+
+        for slot in self._table:
+            if slot is not None:
+                for key in slot:
+                    i = hash(key) % slots
+                    chain = table[i]
+
+                    if chain is None:
+                        table[i] = [key]
+                    else:
+                        chain.append(key)
+
+        self._trees = 0
+
+        for i in range(slots):
+            chain = table[i]
+
+            if chain is not None and len(chain) > self._TREEIFY:
+                table[i] = self._treeify(chain)
+
+        self._table = table
+        self._slots = slots
+        self._total = self._LOAD_FACTOR * slots
+        return
+
+    def debug(self):
+        """
+        ---------------------------------------------------------
+        Prints the contents of the hashset starting at slot 0,
+        showing the slot currently being printed and whether it is
+        a list or a tree. Used for debugging purposes.
+        Use: hs.debug()
+        -------------------------------------------------------
+        Postconditions:
+            The contents of the hashset are printed and the slots identified.
+        -------------------------------------------------------
+        """
+        for i in range(self._slots):
+            slot = self._table[i]
+
+            if slot is not None:
+                kind = "list" if type(slot) is list else "tree"
+                print("Slot {} ({})".format(i, kind))
+                print()
+                for key in slot:
+                    print(key)
+                    print()
+        return
+
+    def __iter__(self):
+        """
+        USE FOR TESTING ONLY
+        -------------------------------------------------------
+        Generates a Python iterator. Iterates through the values
+        in slot order.
+        Use: for v in hs:
+        -------------------------------------------------------
+        Postconditions:
+            yields
+            value - the next value in the hashset (?)
+        -------------------------------------------------------
+        """
+        for slot in self._table:
+            if slot is not None:
+                for value in slot:
+                    yield value
@@ -10,6 +10,7 @@ __updated__ = "2017-11-14"
 -------------------------------------------------------
 """
 # Imports
+from copy_policy import copier
 # Use any appropriate data structure here.
 from list_array import List
 # Define the new_slot slot creation function.
@@ -26,15 +27,32 @@ class HashSet:
     -------------------------------------------------------
     """
     _LOAD_FACTOR = 20
+    # Per operation during an incremental rehash: new table slots
+    # allocated while it is built, then old slots moved into it.
+    _GROW_SLOTS = 64
+    _MIGRATE_SLOTS = 1
 
-    def __init__(self, slots):
+    def __init__(self, slots, copy="deep", incremental=False):
         """
         -------------------------------------------------------
-        Initializes an empty HashSet of size slots.
+        Initializes an empty HashSet of size slots. The slots store the
+        hashset's own copies, so they use the "none" copy policy and
+        the hashset copies values on the way in and out.
+        In incremental mode a rehash is done in bounded steps, one at
+        the start of each insert, find, remove and membership test.
+        The new table is first allocated _GROW_SLOTS slots at a time
+        while the old table stays in use. Then the two tables coexist
+        and each step moves the next _MIGRATE_SLOTS old slots into the
+        new table, whose slot Lists are created as they are needed.
         Use: hs = HashSet(slots)
+        Use: hs = HashSet(slots, incremental=True)
         -------------------------------------------------------
         Precondition:
             slots - number of initial slots in hashset (int > 0)
+            copy - copy policy for values stored and returned: "deep",
+                "shallow", or "none" (str)
+            incremental - True to spread rehashing across later
+                operations, False to rehash all at once (bool)
         Postconditions:
             Initializes an empty HashSet.
         -------------------------------------------------------
@@ -44,9 +62,21 @@ class HashSet:
         self._total = int(self._slots * self._LOAD_FACTOR)
 
         for _ in range(self._slots):
-            self._table.append(List())
-            
+            self._table.append(List(copy="none"))
+
         self._count = 0
+        self._copy_policy = copy
+        self._copy = copier(copy)
+        self._incremental = incremental
+        # While the new table is being allocated it is _new_table, of
+        # final size _new_slots; every key is still in _table.
+        self._new_table = None
+        self._new_slots = 0
+        # While keys are being moved, keys whose old slot index is
+        # _migrate or more are still in _old_table.
+        self._old_table = None
+        self._old_slots = 0
+        self._migrate = 0
         return
 
     def __len__(self):
@@ -76,17 +106,153 @@ class HashSet:
     def _find_slot(self, key):
         """
         -------------------------------------------------------
-        Returns the slot for a key value.
-        Use: list = hs._find_slot( key )
+        Returns the location of the slot for a key value. While a rehash
+        is in progress this is the old slot if it has not been migrated
+        yet. The slot itself is None if no key has been put in it.
+        Use: table, i = hs._find_slot( key )
         -------------------------------------------------------
         Postconditions:
             returns:
-            slot - list at the position of hash key in self._slots
+            table - the table holding the slot for key (list)
+            i - position of the slot in table (int)
+        -------------------------------------------------------
+        """
+        hashkey = hash(key)
+
+        if self._old_table is not None and \
+                hashkey % self._old_slots >= self._migrate:
+            table = self._old_table
+            i = hashkey % self._old_slots
+        else:
+            table = self._table
+            i = hashkey % self._slots
+        return table, i
+
+    def _migrate_slots(self, k):
+        """
+        -------------------------------------------------------
+        Moves up to k old slots into the new table, and ends the rehash
+        once the last one has moved. Keys are rehashed but not copied.
+        Private helper method - used only by other ADT methods.
+        Use: self._migrate_slots(k)
+        -------------------------------------------------------
+        Preconditions:
+            k - maximum number of old slots to move (int > 0)
+        Postconditions:
+            Up to k more old slots are empty and their keys are in the
+            new table.
+        -------------------------------------------------------
+        """
+        old_table = self._old_table
+        table = self._table
+        slots = self._slots
+        end = min(self._migrate + k, self._old_slots)
+
+        for i in range(self._migrate, end):
+            if old_table[i] is not None:
+                for key in old_table[i]:
+                    j = hash(key) % slots
+                    slot = table[j]
+
+                    if slot is None:
+                        slot = List(copy="none")
+                        table[j] = slot
+                    slot.append(key)
+                old_table[i] = None
+
+        self._migrate = end
+
+        if end == self._old_slots:
+            self._old_table = None
+            self._old_slots = 0
+            self._migrate = 0
+        return
+
+    def _start_rehash(self):
+        """
+        -------------------------------------------------------
+        Starts an incremental rehash with an empty new table, to be
+        grown to twice as many slots by _rehash_step. Does nothing if
+        a rehash is already in progress.
+        Private helper method - used only by other ADT methods.
+        Use: self._start_rehash()
+        -------------------------------------------------------
+        Postconditions:
+            A rehash is in progress.
+        -------------------------------------------------------
+        """
+        if self._new_table is None and self._old_table is None:
+            self._new_table = []
+            self._new_slots = self._slots * 2 + 1
+        return
+
+    def _rehash_step(self):
+        """
+        -------------------------------------------------------
+        Does one bounded step of an incremental rehash: allocates the
+        next _GROW_SLOTS slots of the new table, or once it is full size
+        swaps it in as the table and moves the next _MIGRATE_SLOTS old
+        slots into it.
+        Private helper method - used only by other ADT methods.
+        Use: self._rehash_step()
+        -------------------------------------------------------
+        Preconditions:
+            A rehash is in progress.
+        Postconditions:
+            The rehash is one step further on, or finished.
+        -------------------------------------------------------
+        """
+        new_table = self._new_table
+
+        if new_table is None:
+            self._migrate_slots(self._MIGRATE_SLOTS)
+        else:
+            grow = min(self._GROW_SLOTS, self._new_slots - len(new_table))
+            new_table.extend([None] * grow)
+
+            if len(new_table) == self._new_slots:
+                self._old_table = self._table
+                self._old_slots = self._slots
+                self._migrate = 0
+                self._table = new_table
+                self._slots = self._new_slots
+                self._total = self._LOAD_FACTOR * self._slots
+                self._new_table = None
+                self._new_slots = 0
+        return
+
+    def is_rehashing(self):
+        """
+        -------------------------------------------------------
+        Determines if an incremental rehash is in progress.
+        Use: b = hs.is_rehashing()
+        -------------------------------------------------------
+        Postconditions:
+            Returns True if the new table is being allocated or old
+            slots remain to be moved to it, False otherwise.
         -------------------------------------------------------
         """
-        hashkey = hash(key) % self._slots
-        slot = self._table[hashkey]
-        return slot
+        return self._new_table is not None or self._old_table is not None
+
+    def rehash_remaining(self):
+        """
+        -------------------------------------------------------
+        Returns the number of old slots an incremental rehash has
+        still to move. While the new table is being allocated that is
+        every slot of the current table.
+        Use: n = hs.rehash_remaining()
+        -------------------------------------------------------
+        Postconditions:
+            returns
+            n - old slots left to move, 0 if no rehash is in
+                progress (int)
+        -------------------------------------------------------
+        """
+        if self._new_table is not None:
+            remaining = self._slots
+        else:
+            remaining = self._old_slots - self._migrate
+        return remaining
 
     def __contains__(self, key):
         """
@@ -100,8 +266,12 @@ class HashSet:
             Returns True if the hashset contains key, False otherwise.
         -------------------------------------------------------
         """
-        slot = self._find_slot(key)
-        return key in slot
+        if self._new_table is not None or self._old_table is not None:
+            self._rehash_step()
+
+        table, i = self._find_slot(key)
+        slot = table[i]
+        return slot is not None and key in slot
     
     def insert(self, value):
         """
@@ -117,17 +287,28 @@ class HashSet:
             inserted - True if value is inserted, False otherwise.
         -------------------------------------------------------
         """
-        hash_slot = self._find_slot(value)
+        if self._new_table is not None or self._old_table is not None:
+            self._rehash_step()
+
+        table, i = self._find_slot(value)
+        hash_slot = table[i]
+
+        if hash_slot is None:
+            hash_slot = List(copy="none")
+            table[i] = hash_slot
         
         if value not in hash_slot:
-            hash_slot.append(value)
+            hash_slot.append(self._copy(value))
             inserted = True
             self._count += 1
         else:
             inserted = False
             
         if self._count > self._total:
-            self._rehash()
+            if self._incremental:
+                self._start_rehash()
+            else:
+                self._rehash()
 
         return inserted
 
@@ -141,11 +322,23 @@ class HashSet:
             key - a comparable data element (?)
         Postconditions:
             returns:
-            value - if it exists in the hashset, None otherwise.
+            value - a copy of the value if it exists in the hashset,
+                None otherwise.
         -------------------------------------------------------
         """
-        slot = self._find_slot(key)
-        value = slot.find(key)
+        if self._new_table is not None or self._old_table is not None:
+            self._rehash_step()
+
+        table, i = self._find_slot(key)
+        slot = table[i]
+
+        if slot is None:
+            value = None
+        else:
+            value = slot.find(key)
+
+        if value is not None:
+            value = self._copy(value)
         return value
 
     def remove(self, key):
@@ -161,8 +354,13 @@ class HashSet:
             value - if it exists in the hashset, None otherwise.
         -------------------------------------------------------
         """
-        hash_slot = self._find_slot(key)
-        assert len(hash_slot) > 0, "Cannot remove from empty slot."
+        if self._new_table is not None or self._old_table is not None:
+            self._rehash_step()
+
+        table, i = self._find_slot(key)
+        hash_slot = table[i]
+        assert hash_slot is not None and len(hash_slot) > 0, \
+            "Cannot remove from empty slot."
         
         if key in hash_slot:
             index = hash_slot.index(key)
@@ -177,27 +375,42 @@ class HashSet:
         """
         ---------------------------------------------------------
         Increases the number of slots in the hashset and reallocates the
-        existing data within the hashset to the new table.
+        existing data within the hashset to a new table. Each key is
+        hashed once and moved without copying, and the new table
+        replaces the old one once it is built. O(n).
         Use: hs._rehash()
         -------------------------------------------------------
         Postconditions:
             Existing data is reallocated amongst the hashset table.
         -------------------------------------------------------
         """
+        # Drop a new table still being allocated: it holds no keys.
+        self._new_table = None
+        self._new_slots = 0
+
+        if self._old_table is not None:
+            self._migrate_slots(self._old_slots)
+
         slots = self._slots * 2 + 1
-        add_slots = slots - self._slots
-        for _ in range(add_slots):
-            self._table.append(List())
-            self._slots += 1
+        chains = [[] for _ in range(slots)]
 
         for slot in self._table:
-            for key in slot:
-                new_slot = self._find_slot(key)
+            if slot is not None:
+                for key in slot:
+                    chains[hash(key) % slots].append(key)
+
+        table = []
+
+        for chain in chains:
+            new_slot = List(copy="none")
+
+            for key in chain:
                 new_slot.append(key)
-                index = slot.index(key)
-                slot.pop(index)
+            table.append(new_slot)
+
+        self._table = table
+        self._slots = slots
         self._total = self._LOAD_FACTOR * self._slots
-        
         return
 
     def debug(self):
@@ -210,25 +423,54 @@ class HashSet:
         -------------------------------------------------------
         Postconditions:
             The contents of the hashset are printed and the slots identified.
+            Slots that have never held a key are marked unallocated.
+            During an incremental rehash the old slots not yet moved
+            are printed afterwards.
         -------------------------------------------------------
         """
         for slot in range(len(self._table)):
-            print("Slot {}".format(slot))
+            if self._table[slot] is None:
+                print("Slot {} (unallocated)".format(slot))
+            else:
+                print("Slot {}".format(slot))
             print()
-            for key in self._table[slot]:
-                print(key)
-                print()
+            if self._table[slot] is not None:
+                for key in self._table[slot]:
+                    print(key)
+                    print()
+
+        if self._old_table is not None:
+            for slot in range(self._migrate, self._old_slots):
+                if self._old_table[slot] is not None:
+                    print("Old slot {}".format(slot))
+                    print()
+                    for key in self._old_table[slot]:
+                        print(key)
+                        print()
         return
 
     def print_i(self):
 
         for slot in self._table:
-            slot.print_i()
+            if slot is not None:
+                slot.print_i()
+
+        if self._old_table is not None:
+            for slot in self._old_table[self._migrate:]:
+                if slot is not None:
+                    slot.print_i()
         return
     
     def __iter__(self):
         for slot in self._table:
-            for value in slot:
-                yield value
+            if slot is not None:
+                for value in slot:
+                    yield value
+
+        if self._old_table is not None:
+            for slot in self._old_table[self._migrate:]:
+                if slot is not None:
+                    for value in slot:
+                        yield value
         
         
\ No newline at end of file
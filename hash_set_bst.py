@@ -10,10 +10,10 @@ __updated__ = "2017-11-14"
 -------------------------------------------------------
 """
 # Imports
+from copy_policy import copier
 # Use any appropriate data structure here.
 from bst_linked import BST
 # Define the new_slot slot creation function.
-from word import Word
 # Constants
 SEP = '-' * 40
 
@@ -26,14 +26,20 @@ class HashSet:
     """
     _LOAD_FACTOR = 20
 
-    def __init__(self, slots):
+    def __init__(self, slots, copy="deep"):
         """
         -------------------------------------------------------
-        Initializes an empty HashSet of size slots.
+        Initializes an empty HashSet of size slots. The slots store the
+        hashset's own copies, so they use the "none" copy policy and
+        the hashset copies values on the way in and out. The slots are
+        AVL balanced BSTs, so a slot with many colliding keys is still
+        searched in O(log n).
         Use: hs = HashSet(slots)
         -------------------------------------------------------
         Precondition:
             slots - number of initial slots in hashset (int > 0)
+            copy - copy policy for values stored and returned: "deep",
+                "shallow", or "none" (str)
         Postconditions:
             Initializes an empty HashSet.
         -------------------------------------------------------
@@ -43,9 +49,11 @@ class HashSet:
         self._total = int(self._slots * self._LOAD_FACTOR)
 
         for _ in range(self._slots):
-            self._table.append(BST())
-            
+            self._table.append(BST(balanced=True, copy="none"))
+
         self._count = 0
+        self._copy_policy = copy
+        self._copy = copier(copy)
         return
 
     def __len__(self):
@@ -100,7 +108,7 @@ class HashSet:
         -------------------------------------------------------
         """
         slot = self._find_slot(key)
-        return key in slot
+        return not slot.is_empty() and slot.retrieve(key) is not None
     
     def insert(self, value):
         """
@@ -117,15 +125,12 @@ class HashSet:
         -------------------------------------------------------
         """
         hash_slot = self._find_slot(value)
-        val = Word("no")
-        for i in hash_slot:
-            if i == val:
-                val = Word("yes")
-        if hash_slot.is_empty() and val.word == "no":      
-            hash_slot.insert(value)
+        
+        if hash_slot.is_empty() or hash_slot.retrieve(value) is None:
+            hash_slot.insert(self._copy(value))
             inserted = True
             self._count += 1
-        else: 
+        else:
             inserted = False
             
         if self._count > self._total:
@@ -143,11 +148,18 @@ class HashSet:
             key - a comparable data element (?)
         Postconditions:
             returns:
-            value - if it exists in the hashset, None otherwise.
+            value - a copy of the value if it exists in the hashset,
+                None otherwise.
         -------------------------------------------------------
         """
         slot = self._find_slot(key)
-        value = slot.find(key)
+        value = None
+
+        if not slot.is_empty():
+            value = slot.retrieve(key)
+
+        if value is not None:
+            value = self._copy(value)
         return value
 
     def remove(self, key):
@@ -165,16 +177,20 @@ class HashSet:
         """
         hash_slot = self._find_slot(key)
         assert len(hash_slot) > 0, "Cannot remove from empty slot."
-        key = hash_slot.retrieve(key)
+
         value = hash_slot.remove(key)
-        
+
+        if value is not None:
+            self._count -= 1
         return value
 
     def _rehash(self):
         """
         ---------------------------------------------------------
         Increases the number of slots in the hashset and reallocates the
-        existing data within the hashset to the new table.
+        existing data within the hashset to a new table. Each key is
+        hashed once and moved without copying, and the new table
+        replaces the old one once it is built. O(n).
         Use: hs._rehash()
         -------------------------------------------------------
         Postconditions:
@@ -182,19 +198,24 @@ class HashSet:
         -------------------------------------------------------
         """
         slots = self._slots * 2 + 1
-        add_slots = slots - self._slots
-        for _ in range(add_slots):
-            self._table.append(BST())
-            self._slots += 1
+        chains = [[] for _ in range(slots)]
 
         for slot in self._table:
             for key in slot:
-                new_slot = self._find_slot(key)
-                new_slot.insert(key)
-                index = slot.index(key)
-                slot.pop(index)
+                chains[hash(key) % slots].append(key)
+
+        table = []
+
+        for chain in chains:
+            # Sorted order lets the slot be built in one pass; it is
+            # then kept AVL balanced as keys are inserted and removed.
+            chain.sort()
+            new_slot = BST.from_sorted(chain, balanced=True, copy="none")
+            table.append(new_slot)
+
+        self._table = table
+        self._slots = slots
         self._total = self._LOAD_FACTOR * self._slots
-        
         return
 
     def debug(self):
@@ -0,0 +1,321 @@
+"""
+-------------------------------------------------------
+hash_set_open.py
+Open addressing version of the Hash Set ADT.
+-------------------------------------------------------
+Author:  David Brown
+ID:      999999999
+Email:   dbrown@wlu.ca
+__updated__ = "2026-10-18"
+-------------------------------------------------------
+"""
+# Imports
+from array import array
+
+from copy_policy import copier
+
+# Constants
+SEP = '-' * 40
+# Markers for slots that hold no key.
+_EMPTY = object()
+_DELETED = object()
+
+
+class HashSet:
+    """
+    -------------------------------------------------------
+    Constants.
+    -------------------------------------------------------
+    """
+    # Largest fraction of slots that may hold keys or tombstones.
+    _LOAD_FACTOR = 0.5
+    _MIN_SLOTS = 8
+
+    def __init__(self, slots, copy="deep"):
+        """
+        -------------------------------------------------------
+        Initializes an empty HashSet of at least size slots. Keys are
+        stored directly in the table with linear probing: _keys holds
+        each key and _hashes its cached hash, in two flat parallel
+        arrays. Removed keys leave a tombstone so later probes continue
+        past them; rehashing clears the tombstones.
+        Use: hs = HashSet(slots)
+        -------------------------------------------------------
+        Precondition:
+            slots - number of initial slots in hashset, rounded up to
+                a power of 2 (int > 0)
+            copy - copy policy for values stored and returned: "deep",
+                "shallow", or "none" (str)
+        Postconditions:
+            Initializes an empty HashSet.
+        -------------------------------------------------------
+        """
+        capacity = self._MIN_SLOTS
+
+        while capacity < slots:
+            capacity *= 2
+
+        self._allocate(capacity)
+        self._copy_policy = copy
+        self._copy = copier(copy)
+        return
+
+    def _allocate(self, slots):
+        """
+        -------------------------------------------------------
+        Replaces the table with an empty table of size slots.
+        Private helper method - used only by other ADT methods.
+        Use: self._allocate(slots)
+        -------------------------------------------------------
+        Preconditions:
+            slots - number of slots (int, a power of 2)
+        Postconditions:
+            The table is empty and has slots slots.
+        -------------------------------------------------------
+        """
+        self._slots = slots
+        self._keys = [_EMPTY] * slots
+        self._hashes = array('q', bytes(8 * slots))
+        self._total = int(slots * self._LOAD_FACTOR)
+        self._count = 0
+        # Slots holding a key or a tombstone.
+        self._used = 0
+        return
+
+    def __len__(self):
+        """
+        -------------------------------------------------------
+        Returns the number of values in the hashset.
+        Use: n = len( hs )
+        -------------------------------------------------------
+        Postconditions:
+            Returns the number of values in the hashset.
+        -------------------------------------------------------
+        """
+        return self._count
+
+    def is_empty(self):
+        """
+        -------------------------------------------------------
+        Determines if the hashset is empty.
+        Use: b = hs.is_empty()
+        -------------------------------------------------------
+        Postconditions:
+            Returns True if the hashset is empty, False otherwise.
+        -------------------------------------------------------
+        """
+        return self._count == 0
+
+    def _find_slot(self, key, hashkey):
+        """
+        -------------------------------------------------------
+        Probes the table for key.
+        Private helper method - used only by other ADT methods.
+        Use: i, free = self._find_slot(key, hashkey)
+        -------------------------------------------------------
+        Preconditions:
+            key - a comparable data element (?)
+            hashkey - hash(key) (int)
+        Postconditions:
+            returns
+            i - index of the slot holding key, -1 if key is not in the
+                hashset (int)
+            free - index of the slot key would be inserted into: the
+                first tombstone on the probe path, otherwise the empty
+                slot that ended it; -1 if key was found (int)
+        -------------------------------------------------------
+        """
+        keys = self._keys
+        hashes = self._hashes
+        mask = self._slots - 1
+        # Fold high bits in so that hashes differing only there spread.
+        i = (hashkey ^ (hashkey >> 16)) & mask
+        free = -1
+
+        while True:
+            k = keys[i]
+
+            if k is _EMPTY:
+                if free == -1:
+                    free = i
+                i = -1
+                break
+            elif k is _DELETED:
+                if free == -1:
+                    free = i
+            elif hashes[i] == hashkey and (k is key or k == key):
+                free = -1
+                break
+            i = (i + 1) & mask
+        return i, free
+
+    def __contains__(self, key):
+        """
+        ---------------------------------------------------------
+        Determines if the hashset contains key.
+        Use: b = key in hs
+        -------------------------------------------------------
+        Preconditions:
+            key - a comparable data element (?)
+        Postconditions:
+            Returns True if the hashset contains key, False otherwise.
+        -------------------------------------------------------
+        """
+        i, _ = self._find_slot(key, hash(key))
+        return i != -1
+
+    def insert(self, value):
+        """
+        ---------------------------------------------------------
+        Inserts value into the hashset, allows only one copy of value.
+        Calls _rehash if the hashset _LOAD_FACTOR is exceeded.
+        Use: inserted = hs.insert( value )
+        -------------------------------------------------------
+        Preconditions:
+            value - a comparable data element (?)
+        Postconditions:
+            returns
+            inserted - True if value is inserted, False otherwise.
+        -------------------------------------------------------
+        """
+        hashkey = hash(value)
+        i, free = self._find_slot(value, hashkey)
+
+        if i == -1:
+            if self._keys[free] is _EMPTY:
+                self._used += 1
+            self._keys[free] = self._copy(value)
+            self._hashes[free] = hashkey
+            self._count += 1
+            inserted = True
+
+            if self._used > self._total:
+                self._rehash()
+        else:
+            inserted = False
+        return inserted
+
+    def find(self, key):
+        """
+        ---------------------------------------------------------
+        Returns the value identified by key.
+        Use: value = hs.find( key )
+        -------------------------------------------------------
+        Preconditions:
+            key - a comparable data element (?)
+        Postconditions:
+            returns:
+            value - a copy of the value if it exists in the hashset,
+                None otherwise.
+        -------------------------------------------------------
+        """
+        i, _ = self._find_slot(key, hash(key))
+
+        if i == -1:
+            value = None
+        else:
+            value = self._copy(self._keys[i])
+        return value
+
+    def remove(self, key):
+        """
+        ---------------------------------------------------------
+        Removes the value matching key from the hashset, if it exists.
+        Use: value = hs.remove( key )
+        -------------------------------------------------------
+        Preconditions:
+            key - a comparable data element (?)
+        Postconditions:
+            returns:
+            value - if it exists in the hashset, None otherwise.
+        -------------------------------------------------------
+        """
+        i, _ = self._find_slot(key, hash(key))
+
+        if i == -1:
+            value = None
+        else:
+            value = self._keys[i]
+            # Leave a tombstone: later keys may have probed past i.
+            self._keys[i] = _DELETED
+            self._count -= 1
+        return value
+
+    def _rehash(self):
+        """
+        ---------------------------------------------------------
+        Moves every key into a new table, using the cached hashes and
+        without copying the keys, and drops the tombstones. The table
+        doubles unless most of the used slots were tombstones.
+        Use: hs._rehash()
+        -------------------------------------------------------
+        Postconditions:
+            Existing data is reallocated amongst the hashset table.
+        -------------------------------------------------------
+        """
+        keys = self._keys
+        hashes = self._hashes
+        count = self._count
+        slots = self._slots
+
+        if count * 2 > self._total:
+            slots *= 2
+
+        self._allocate(slots)
+        new_keys = self._keys
+        new_hashes = self._hashes
+        mask = slots - 1
+
+        for i in range(len(keys)):
+            k = keys[i]
+
+            if k is not _EMPTY and k is not _DELETED:
+                hashkey = hashes[i]
+                j = (hashkey ^ (hashkey >> 16)) & mask
+
+                while new_keys[j] is not _EMPTY:
+                    j = (j + 1) & mask
+                new_keys[j] = k
+                new_hashes[j] = hashkey
+
+        self._count = count
+        self._used = count
+        return
+
+    def debug(self):
+        """
+        ---------------------------------------------------------
+        Prints the contents of the hashset starting at slot 0,
+        showing the slot currently being printed. Used for
+        debugging purposes.
+        Use: hs.debug()
+        -------------------------------------------------------
+        Postconditions:
+            The contents of the hashset are printed and the slots identified.
+        -------------------------------------------------------
+        """
+        for slot in range(self._slots):
+            k = self._keys[slot]
+
+            if k is _DELETED:
+                print("Slot {}: <deleted>".format(slot))
+            elif k is not _EMPTY:
+                print("Slot {}: {}".format(slot, k))
+        return
+
+    def __iter__(self):
+        """
+        USE FOR TESTING ONLY
+        -------------------------------------------------------
+        Generates a Python iterator. Iterates through the values
+        in table order.
+        Use: for v in hs:
+        -------------------------------------------------------
+        Postconditions:
+            yields
+            value - the next value in the hashset (?)
+        -------------------------------------------------------
+        """
+        for k in self._keys:
+            if k is not _EMPTY and k is not _DELETED:
+                yield k
@@ -10,6 +10,7 @@ __updated__ = "2017-11-14"
 -------------------------------------------------------
 """
 # Imports
+from copy_policy import copier
 # Use any appropriate data structure here.
 from sorted_list_linked import SortedList
 # Define the new_slot slot creation function.
@@ -26,14 +27,18 @@ class HashSet:
     """
     _LOAD_FACTOR = 20
 
-    def __init__(self, slots):
+    def __init__(self, slots, copy="deep"):
         """
         -------------------------------------------------------
-        Initializes an empty HashSet of size slots.
+        Initializes an empty HashSet of size slots. The slots store the
+        hashset's own copies, so they use the "none" copy policy and
+        the hashset copies values on the way in and out.
         Use: hs = HashSet(slots)
         -------------------------------------------------------
         Precondition:
             slots - number of initial slots in hashset (int > 0)
+            copy - copy policy for values stored and returned: "deep",
+                "shallow", or "none" (str)
         Postconditions:
             Initializes an empty HashSet.
         -------------------------------------------------------
@@ -43,9 +48,11 @@ class HashSet:
         self._total = int(self._slots * self._LOAD_FACTOR)
 
         for _ in range(self._slots):
-            self._table.append(SortedList())
-            
+            self._table.append(SortedList(copy="none"))
+
         self._count = 0
+        self._copy_policy = copy
+        self._copy = copier(copy)
         return
 
     def __len__(self):
@@ -119,7 +126,7 @@ class HashSet:
         hash_slot = self._find_slot(value)
         
         if value not in hash_slot:
-            hash_slot.insert(value)
+            hash_slot.insert(self._copy(value))
             inserted = True
             self._count += 1
         else:
@@ -140,11 +147,18 @@ class HashSet:
             key - a comparable data element (?)
         Postconditions:
             returns:
-            value - if it exists in the hashset, None otherwise.
+            value - a copy of the value if it exists in the hashset,
+                None otherwise.
         -------------------------------------------------------
         """
         slot = self._find_slot(key)
-        value = slot.find(key)
+        value = None
+
+        if not slot.is_empty():
+            value = slot.find(key)
+
+        if value is not None:
+            value = self._copy(value)
         return value
 
     def remove(self, key):
@@ -163,20 +177,19 @@ class HashSet:
         hash_slot = self._find_slot(key)
         assert len(hash_slot) > 0, "Cannot remove from empty slot."
         
-        if key in hash_slot:
-            index = hash_slot.index(key)
-            value = hash_slot.remove(index)
+        value = hash_slot.remove(key)
+
+        if value is not None:
             self._count -= 1
-        else:
-            value = None
-            
         return value
 
     def _rehash(self):
         """
         ---------------------------------------------------------
         Increases the number of slots in the hashset and reallocates the
-        existing data within the hashset to the new table.
+        existing data within the hashset to a new table. Each key is
+        hashed once and moved without copying, and the new table
+        replaces the old one once it is built. O(n).
         Use: hs._rehash()
         -------------------------------------------------------
         Postconditions:
@@ -184,19 +197,24 @@ class HashSet:
         -------------------------------------------------------
         """
         slots = self._slots * 2 + 1
-        add_slots = slots - self._slots
-        for _ in range(add_slots):
-            self._table.append(SortedList())
-            self._slots += 1
+        chains = [[] for _ in range(slots)]
 
         for slot in self._table:
             for key in slot:
-                new_slot = self._find_slot(key)
-                new_slot.insert(key)
-                index = slot.index(key)
-                slot.pop(index)
+                chains[hash(key) % slots].append(key)
+
+        table = []
+
+        for chain in chains:
+            # Sorted order lets the slot be built in one pass.
+            chain.sort()
+            new_slot = SortedList(copy="none")
+            new_slot._load(chain)
+            table.append(new_slot)
+
+        self._table = table
+        self._slots = slots
         self._total = self._LOAD_FACTOR * self._slots
-        
         return
 
     def debug(self):
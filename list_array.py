@@ -9,22 +9,27 @@ Email:   dbrown@wlu.ca
 __updated__ = "2017-08-19"
 -------------------------------------------------------
 """
-from copy import deepcopy
+from copy_policy import copier
 
 
 class List:
 
-    def __init__(self):
+    def __init__(self, copy="deep"):
         """
         -------------------------------------------------------
         Initializes an empty list.
         Use: l = List()
         -------------------------------------------------------
+        Preconditions:
+            copy - copy policy for values stored and returned: "deep",
+                "shallow", or "none" (str)
         Postconditions:
             Initializes an empty list.
         -------------------------------------------------------
         """
         self._values = []
+        self._copy_policy = copy
+        self._copy = copier(copy)
         return
 
     def is_empty(self):
@@ -67,9 +72,9 @@ class List:
         -------------------------------------------------------
         """
         if i < len(self._values):
-            self._values.insert(i, deepcopy(value))
+            self._values.insert(i, self._copy(value))
         else:
-            self._values.append(deepcopy(value))
+            self._values.append(self._copy(value))
         return
 
     def _linear_search(self, key):
@@ -236,7 +241,7 @@ class List:
         """
         assert self._valid_index(i), "Invalid index value"
 
-        self._values[i] = deepcopy(value)
+        self._values[i] = self._copy(value)
 
         return
 
@@ -349,7 +354,7 @@ class List:
         -------------------------------------------------------
         """
         
-        self._values.append(deepcopy(value))
+        self._values.append(self._copy(value))
         return
 
     def pop(self, *args):
@@ -410,7 +415,7 @@ class List:
             and s2. Values do not repeat. q1 and q2 are empty. (Queue)
         -------------------------------------------------------
         """
-        new_list = List()
+        new_list = List(copy=self._copy_policy)
         for i in self._values:
             for v in rs:
                 if i == v:
@@ -502,7 +507,7 @@ class List:
             List and rs. Values do not repeat. (List)
         -------------------------------------------------------
         """
-        new_list = List()
+        new_list = List(copy=self._copy_policy)
         for i in self._values:
             if i not in new_list:
                 new_list.insert(-1, i)
@@ -523,7 +528,7 @@ class List:
             value is added to the front of the list.
         -------------------------------------------------------
         """
-        temp = deepcopy(value)
+        temp = self._copy(value)
         self._values = temp + self._values
         return
 
@@ -558,7 +563,7 @@ class List:
                 are empty (List)
         -------------------------------------------------------
         """
-        new_list = List()
+        new_list = List(copy=self._copy_policy)
         i = 0
         while len(self._values) > 0 or s2.is_empty():
             if len(self._values) > 0:
@@ -583,8 +588,8 @@ class List:
             rs - a new List with <= 50% of the original List (List)
         -------------------------------------------------------
         """
-        ls = List()
-        rs = List()
+        ls = List(copy=self._copy_policy)
+        rs = List(copy=self._copy_policy)
         i = 0
         len_count = len(self._values) // 2
         count = 0
@@ -615,8 +620,8 @@ class List:
                 The List is empty.
         -------------------------------------------------------
         """
-        even = List()
-        odd = List()
+        even = List(copy=self._copy_policy)
+        odd = List(copy=self._copy_policy)
         for i in range(len(self._values)):
             if i == 0 or i % 2 == 0:
                 even.insert(-1, self._values[i])
@@ -642,8 +647,8 @@ class List:
         self is empty. Order of values is new lists is maintained.
         -------------------------------------------------------
         """
-        ls = List()
-        rs = List()
+        ls = List(copy=self._copy_policy)
+        rs = List(copy=self._copy_policy)
         for i in self._values:
             if func(i):
                 ls.append(i)
@@ -9,10 +9,11 @@ Email:   dbrown@wlu.ca
 __updated__ = "2017-08-20"
 -------------------------------------------------------
 """
-from copy import deepcopy
+from copy_policy import copier
 
 
 class _ListNode:
+    __slots__ = ('_data', '_next')
 
     def __init__(self, value, next_):
         """
@@ -24,29 +25,167 @@ class _ListNode:
             _data - data value for node (?)
             _next - another list node (_ListNode)
         Postconditions:
-            Initializes a list node that contains a copy of value
+            Initializes a list node that contains value
             and a link to the next node in the list.
         -------------------------------------------------------
         """
-        self._data = deepcopy(value)
+        self._data = value
         self._next = next_
         return
 
 
+class _ListCursor:
+
+    def __init__(self, source):
+        """
+        -------------------------------------------------------
+        Initializes a cursor positioned before the first node of source.
+        Use: c = l.cursor()
+        -------------------------------------------------------
+        Preconditions:
+            source - the list to move through (List)
+        Postconditions:
+            Initializes a cursor before the front of source.
+        -------------------------------------------------------
+        """
+        self._list = source
+        # _current is the node last returned by next, None before the
+        # front; _previous is the node before it.
+        self._previous = None
+        self._current = None
+        self._removed = False
+        return
+
+    def has_next(self):
+        """
+        -------------------------------------------------------
+        Determines if there is a node after the cursor.
+        Use: b = c.has_next()
+        -------------------------------------------------------
+        Postconditions:
+            returns
+            True if next can be called, False otherwise.
+        -------------------------------------------------------
+        """
+        if self._current is None:
+            following = self._list._front
+        else:
+            following = self._current._next
+        return following is not None
+
+    def next(self):
+        """
+        -------------------------------------------------------
+        Moves the cursor to the next node. O(1).
+        Use: value = c.next()
+        -------------------------------------------------------
+        Postconditions:
+            returns
+            value - a copy of the value in the next node (?)
+        -------------------------------------------------------
+        """
+        assert self.has_next(), "Cannot move past the end of the list"
+
+        if self._current is None:
+            following = self._list._front
+        else:
+            following = self._current._next
+
+        if not self._removed:
+            self._previous = self._current
+        self._current = following
+        self._removed = False
+        value = self._list._copy(following._data)
+        return value
+
+    def insert_after(self, value):
+        """
+        -------------------------------------------------------
+        Inserts a copy of value after the cursor, at the front of the
+        list if the cursor is before the front. The cursor does not
+        move, so next returns the new value. O(1).
+        Use: c.insert_after(value)
+        -------------------------------------------------------
+        Preconditions:
+            value - a data element (?)
+        Postconditions:
+            a copy of value is added to the list after the cursor.
+        -------------------------------------------------------
+        """
+        source = self._list
+
+        if self._current is None:
+            node = _ListNode(source._copy(value), source._front)
+            source._front = node
+        else:
+            node = _ListNode(source._copy(value), self._current._next)
+            self._current._next = node
+
+        if node._next is None:
+            source._rear = node
+        source._count += 1
+        source._finger = None
+        return
+
+    def remove_current(self):
+        """
+        -------------------------------------------------------
+        Removes the node the cursor is on, the node last returned by
+        next. The cursor moves back to the node before it, so next
+        returns the node that followed the one removed. O(1).
+        Use: value = c.remove_current()
+        -------------------------------------------------------
+        Postconditions:
+            returns
+            value - the value removed from the list (?)
+        -------------------------------------------------------
+        """
+        assert self._current is not None and not self._removed, \
+            "Cursor is not on a node"
+
+        source = self._list
+        current = self._current
+
+        if self._previous is None:
+            source._front = current._next
+        else:
+            self._previous._next = current._next
+
+        if current is source._rear:
+            source._rear = self._previous
+        source._count -= 1
+        source._finger = None
+
+        self._current = self._previous
+        self._removed = True
+        return current._data
+
+
 class List:
 
-    def __init__(self):
+    def __init__(self, copy="deep"):
         """
         -------------------------------------------------------
-        Initializes an empty list.
+        Initializes an empty list. _rear points to the last node so
+        append is O(1). _finger caches the last node reached by index,
+        so access at or after it does not start again from the front.
         Use: l = List()
         -------------------------------------------------------
+        Preconditions:
+            copy - copy policy for values stored and returned: "deep",
+                "shallow", or "none" (str)
         Postconditions:
             Initializes an empty list.
         -------------------------------------------------------
         """
         self._front = None
+        self._rear = None
         self._count = 0
+        # The node at index _finger_index, None if not set.
+        self._finger = None
+        self._finger_index = 0
+        self._copy_policy = copy
+        self._copy = copier(copy)
         return
 
     def is_empty(self):
@@ -93,22 +232,34 @@ class List:
             # negative index
             i = self._count + i
 
-        n = 0
-        previous = None
-        current = self._front
+        if i <= 0:
+            i = 0
+            previous = None
+        elif i >= self._count:
+            i = self._count
+            previous = self._rear
+        else:
+            previous = self._node_at(i - 1)
 
-        while n < i and current is not None:
-            # find the proper location in the list
-            previous = current
-            current = current._next
-            n += 1
+        if previous is None:
+            current = self._front
+        else:
+            current = previous._next
+        node = _ListNode(self._copy(value), current)
 
         if previous is None:
             # Insert a new node into the front of the list.
-            self._front = _ListNode(value, self._front)
+            self._front = node
         else:
             # Insert a new node elsewhere in the list
-            previous._next = _ListNode(value, current)
+            previous._next = node
+
+        if current is None:
+            # The new node is the last node.
+            self._rear = node
+
+        if self._finger is not None and self._finger_index >= i:
+            self._finger_index += 1
         self._count += 1
         return
 
@@ -124,7 +275,7 @@ class List:
             value is added to the front of the list.
         -------------------------------------------------------
         """
-        self.insert(0, deepcopy(value))
+        self.insert(0, value)
         return
 
     def _linear_search(self, key):
@@ -199,7 +350,10 @@ class List:
             else:
                 previous._next = current._next
                 #we're removing the node by skipping over the current current data npde
-             
+
+            if current is self._rear:
+                self._rear = previous
+            self._unfinger(current, index)
             self._count -=1
             
         return value
@@ -217,8 +371,13 @@ class List:
         """
         assert self._front is not None, "Cannot remove from an empty list"
 
-        value = self._front._data
-        self._front = self._front._next
+        current = self._front
+        value = current._data
+        self._front = current._next
+
+        if self._front is None:
+            self._rear = None
+        self._unfinger(current, 0)
         self._count -= 1
         return value
 
@@ -260,7 +419,7 @@ class List:
         _,c,_ = self._linear_search(key)
         current = c
         if current is not None:
-            value = deepcopy(current._data)
+            value = self._copy(current._data)
         
         else:
             value = None
@@ -278,7 +437,7 @@ class List:
             value - a copy of the first value in the list (?)
         -------------------------------------------------------
         """
-        value = deepcopy(self._front._data)
+        value = self._copy(self._front._data)
 
         return value
 
@@ -320,6 +479,76 @@ class List:
         n = self._count
         return -n <= i < n
 
+    def _node_at(self, i):
+        """
+        -------------------------------------------------------
+        Finds the node at index i, walking from the finger if it is at
+        or before i, otherwise from the front. The finger is left on
+        the node found, so sequential access is O(1) per step.
+        Private helper method - used only by other ADT methods.
+        Use: node = self._node_at(i)
+        -------------------------------------------------------
+        Preconditions:
+            i - a non-negative index (0 <= int < len(self))
+        Postconditions:
+            returns
+            node - the node at index i (_ListNode)
+        -------------------------------------------------------
+        """
+        if i == self._count - 1:
+            node = self._rear
+        else:
+            if self._finger is not None and self._finger_index <= i:
+                node = self._finger
+                j = self._finger_index
+            else:
+                node = self._front
+                j = 0
+
+            while j < i:
+                node = node._next
+                j += 1
+
+        self._finger = node
+        self._finger_index = i
+        return node
+
+    def _unfinger(self, node, i):
+        """
+        -------------------------------------------------------
+        Updates the finger after node at index i has been removed.
+        Private helper method - used only by other ADT methods.
+        Use: self._unfinger(node, i)
+        -------------------------------------------------------
+        Preconditions:
+            node - the node removed (_ListNode)
+            i - the index node had (int)
+        Postconditions:
+            The finger is cleared if it was on node, and moved back
+            one index if it was after node.
+        -------------------------------------------------------
+        """
+        if self._finger is node:
+            self._finger = None
+        elif self._finger is not None and self._finger_index > i:
+            self._finger_index -= 1
+        return
+
+    def cursor(self):
+        """
+        -------------------------------------------------------
+        Returns a cursor for walking the list and changing it in place.
+        Changing the list other than through the cursor invalidates it.
+        Use: c = l.cursor()
+        -------------------------------------------------------
+        Postconditions:
+            returns
+            c - a cursor positioned before the front of the list
+                (_ListCursor)
+        -------------------------------------------------------
+        """
+        return _ListCursor(self)
+
     def __getitem__(self, i):
         """
         ---------------------------------------------------------
@@ -335,18 +564,12 @@ class List:
         """
         assert self._valid_index(i), "Invalid index value"
 
-        current = self._front
-
         if i < 0:
             # negative index - convert to positive
             i = self._count + i
-        j = 0
 
-        while j < i:
-            current = current._next
-            j += 1
-
-        value = deepcopy(current._data)
+        current = self._node_at(i)
+        value = self._copy(current._data)
         return value
 
     def __setitem__(self, i, value):
@@ -365,18 +588,12 @@ class List:
         """
         assert self._valid_index(i), "Invalid index value"
 
-        current = self._front
-
         if i < 0:
             # negative index - convert to positive
             i = self._count + i
-        j = 0
-
-        while j < i:
-            current = current._next
-            j += 1
 
-        current._data = deepcopy(value)
+        current = self._node_at(i)
+        current._data = self._copy(value)
         return
 
     def __contains__(self, key):
@@ -417,7 +634,7 @@ class List:
             if current._data > max_data:
                 max_data = current._data
             current = current._next 
-        max_data = deepcopy(max_data)
+        max_data = self._copy(max_data)
 
         return max_data
 
@@ -441,7 +658,7 @@ class List:
             if current._data < min_data:
                 min_data = current._data
             current = current._next
-        min_data = deepcopy(min_data)
+        min_data = self._copy(min_data)
 
         return min_data
 
@@ -481,8 +698,65 @@ class List:
             a copy of value is added to the end of the List.
         -------------------------------------------------------
         """
-        # self.insert(self._count, value)
+        node = _ListNode(self._copy(value), None)
 
+        if self._front is None:
+            self._front = node
+        else:
+            self._rear._next = node
+        self._rear = node
+        self._count += 1
+        return
+
+    def extend(self, values):
+        """
+        ---------------------------------------------------------
+        Appends a copy of each value in values to the end of the List.
+        The new nodes are linked together first and then attached to
+        the rear in one step.
+        Use: l.extend(values)
+        -------------------------------------------------------
+        Preconditions:
+            values - an iterable of data elements (iterable)
+        Postconditions:
+            a copy of each value is added to the end of the List, in order.
+        -------------------------------------------------------
+        """
+        front = None
+        rear = None
+        n = 0
+
+        for value in values:
+            node = _ListNode(self._copy(value), None)
+
+            if front is None:
+                front = node
+            else:
+                rear._next = node
+            rear = node
+            n += 1
+
+        if front is not None:
+            if self._front is None:
+                self._front = front
+            else:
+                self._rear._next = front
+            self._rear = rear
+            self._count += n
+        return
+
+    def _set_rear(self):
+        """
+        -------------------------------------------------------
+        Resets _rear to the last node and clears the finger, for code
+        that relinks the nodes directly (e.g. the linked list sorts).
+        Private helper method - used only by other ADT methods.
+        Use: self._set_rear()
+        -------------------------------------------------------
+        Postconditions:
+            _rear is the last node in the list, None if the list is empty.
+        -------------------------------------------------------
+        """
         previous = None
         current = self._front
 
@@ -490,12 +764,8 @@ class List:
             previous = current
             current = current._next
 
-        if previous is None:
-            self._front = _ListNode(deepcopy(value), self._front)
-        else:
-            previous._next = _ListNode(deepcopy(value), current)
-        self._count += 1
-
+        self._rear = previous
+        self._finger = None
         return
 
     def clean(self):
@@ -523,6 +793,10 @@ class List:
                     # to the node after it.
                     previous._next = current._next
                     self._count -= 1
+
+                    if current is self._rear:
+                        self._rear = previous
+                    self._finger = None
                 else:
                     previous = current
                 # Move to the _next node.
@@ -549,28 +823,22 @@ class List:
         assert self._front is not None, "Cannot pop from an empty list"
         assert len(i) <= 1, "No more than 1 argument allowed"
 
-        previous = None
-        current = self._front
-
         if len(i) == 1:
+            index = i[0]
 
-            if i[0] < 0:
+            if index < 0:
                 # index is negative
-                i[0] = self._count + i[0]
-            j = 0
-
-            while j < i[0]:
-                previous = current
-                current = current._next
-                j += 1
+                index = self._count + index
         else:
-            # find and pop the last element
-            j = 0
+            # pop the last element
+            index = self._count - 1
 
-            while j < (self._count - 1):
-                previous = current
-                current = current._next
-                j += 1
+        if index == 0:
+            previous = None
+            current = self._front
+        else:
+            previous = self._node_at(index - 1)
+            current = previous._next
 
         value = current._data
 
@@ -580,6 +848,10 @@ class List:
         else:
             # Update any other node
             previous._next = current._next
+
+        if current is self._rear:
+            self._rear = previous
+        self._unfinger(current, index)
         self._count -= 1
         return value
 
@@ -640,6 +912,9 @@ class List:
         -------------------------------------------------------
         """
         new_front = None
+        # The front node becomes the last node.
+        self._rear = self._front
+        self._finger = None
 
         while self._front is not None:
             temp = self._front._next
@@ -662,6 +937,8 @@ class List:
         return new_front
     
     def reverse_r(self):        
+        self._rear = self._front
+        self._finger = None
         new_front = self.reverse_r_aux(None)
         
         self._front = new_front
@@ -681,8 +958,14 @@ class List:
             The list is empty.
         -------------------------------------------------------
         """
-        even = List()
-        odd = List()
+        even = List(copy=self._copy_policy)
+        odd = List(copy=self._copy_policy)
+
+        # The first node added to each list ends up as its last node.
+        even._rear = self._front
+
+        if self._front is not None:
+            odd._rear = self._front._next
 
         while self._front is not None:
             new_node = self._front
@@ -699,6 +982,8 @@ class List:
         odd._count = self._count // 2
         even._count = self._count - odd._count
         self._count = 0
+        self._rear = None
+        self._finger = None
         return even, odd
     
     def split_alt_r_even_aux(self, even, odd):
@@ -722,8 +1007,8 @@ class List:
         return even, odd
     
     def split_alt_r(self):
-        even = List()
-        odd = List()
+        even = List(copy=self._copy_policy)
+        odd = List(copy=self._copy_policy)
         
         if self._front is not None:
             even, odd = self.split_alt_r_even_aux(even, odd)
@@ -731,6 +1016,8 @@ class List:
         odd._count = self._count // 2
         even._count = self._count - odd._count
         self._count = 0
+        self._rear = None
+        self._finger = None
         even.reverse_r()
         odd.reverse_r()
         return even, odd
@@ -749,7 +1036,7 @@ class List:
                 and rs (List)
         -------------------------------------------------------
         """
-        new_list = List()
+        new_list = List(copy=self._copy_policy)
         temp = rs._front
 
         while temp is not None:
@@ -807,7 +1094,7 @@ class List:
             List and rs. Values do not repeat. (List)
         -------------------------------------------------------
         """
-        new_list = List()
+        new_list = List(copy=self._copy_policy)
         temp = self._front
         temp2 = rs._front
         
@@ -838,7 +1125,7 @@ class List:
             are empty (List)
         -------------------------------------------------------
         """
-        new_list = List()
+        new_list = List(copy=self._copy_policy)
         temp = self._front
         temp2 = rs._front
         
@@ -869,27 +1156,31 @@ class List:
             rs - a new List with <= 50% of the original List (List)
         -------------------------------------------------------
         """
-        ls = List()
-        rs = List()
-        half = self._count // 2
-        i = 0
-        
-        while i < self._count and self._front is not None:
-            if self._front is not None and i <= half:
-                new_node = self._front
-                self._front = self._front._next
-                new_node._next = ls._front
-                ls._front = new_node
-            elif self._front is not None and i > half:
-                new_node = self._front
-                self._front = self._front._next
-                new_node._next = rs._front
-                rs._front = new_node
-            i += 1
-        ls.reverse()
-        rs.reverse()
-        ls._count = self._count // 2
+        ls = List(copy=self._copy_policy)
+        rs = List(copy=self._copy_policy)
+        ls._count = (self._count + 1) // 2
         rs._count = self._count - ls._count
+
+        if ls._count > 0:
+            # Cut the chain after the last node of the first half.
+            previous = self._front
+            i = 1
+
+            while i < ls._count:
+                previous = previous._next
+                i += 1
+
+            ls._front = self._front
+            ls._rear = previous
+
+            if rs._count > 0:
+                rs._front = previous._next
+                rs._rear = self._rear
+            previous._next = None
+
+        self._front = None
+        self._rear = None
+        self._finger = None
         self._count = 0
         return ls, rs
 
@@ -950,4 +1241,10 @@ class List:
             temp = l._next
             l._next = r._next
             r._next = temp
+
+            if l is self._rear:
+                self._rear = r
+            elif r is self._rear:
+                self._rear = l
+            self._finger = None
         return
\ No newline at end of file
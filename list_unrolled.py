@@ -0,0 +1,1072 @@
+"""
+-------------------------------------------------------
+list_unrolled.py
+Unrolled linked version of the list ADT.
+-------------------------------------------------------
+Author:  David Brown
+ID:      999999999
+Email:   dbrown@wlu.ca
+__updated__ = "2026-10-18"
+-------------------------------------------------------
+"""
+from copy_policy import copier
+
+
+class _UNode:
+    __slots__ = ('_values', '_next')
+
+    def __init__(self, values, next_):
+        """
+        -------------------------------------------------------
+        Initializes an unrolled list node.
+        Use: node = _UNode(values, _next)
+        -------------------------------------------------------
+        Preconditions:
+            values - the data values for node, at most _CAPACITY of
+                them (list)
+            next_ - another unrolled list node (_UNode)
+        Postconditions:
+            Initializes a list node that contains values
+            and a link to the next node in the list.
+        -------------------------------------------------------
+        """
+        self._values = values
+        self._next = next_
+        return
+
+
+class _UCursor:
+
+    def __init__(self, source):
+        """
+        -------------------------------------------------------
+        Initializes a cursor positioned before the first value of source.
+        Use: c = l.cursor()
+        -------------------------------------------------------
+        Preconditions:
+            source - the list to move through (List)
+        Postconditions:
+            Initializes a cursor before the front of source.
+        -------------------------------------------------------
+        """
+        self._list = source
+        # The cursor sits before _node._values[_offset]; _node is None
+        # only if the list is empty, and _previous is the node before
+        # _node. The value last returned by next is just before it.
+        self._previous = None
+        self._node = source._front
+        self._offset = 0
+        self._on_value = False
+        return
+
+    def has_next(self):
+        """
+        -------------------------------------------------------
+        Determines if there is a value after the cursor.
+        Use: b = c.has_next()
+        -------------------------------------------------------
+        Postconditions:
+            returns
+            True if next can be called, False otherwise.
+        -------------------------------------------------------
+        """
+        node = self._node
+        return node is not None and \
+            (self._offset < len(node._values) or node._next is not None)
+
+    def next(self):
+        """
+        -------------------------------------------------------
+        Moves the cursor past the next value. O(1).
+        Use: value = c.next()
+        -------------------------------------------------------
+        Postconditions:
+            returns
+            value - a copy of the next value (?)
+        -------------------------------------------------------
+        """
+        assert self.has_next(), "Cannot move past the end of the list"
+
+        if self._offset == len(self._node._values):
+            self._previous = self._node
+            self._node = self._node._next
+            self._offset = 0
+
+        value = self._list._copy(self._node._values[self._offset])
+        self._offset += 1
+        self._on_value = True
+        return value
+
+    def insert_after(self, value):
+        """
+        -------------------------------------------------------
+        Inserts a copy of value after the cursor, at the front of the
+        list if the cursor is before the front. The cursor does not
+        move, so next returns the new value. O(_CAPACITY).
+        Use: c.insert_after(value)
+        -------------------------------------------------------
+        Preconditions:
+            value - a data element (?)
+        Postconditions:
+            a copy of value is added to the list after the cursor.
+        -------------------------------------------------------
+        """
+        source = self._list
+        node = self._node
+
+        if node is None:
+            node = _UNode([source._copy(value)], None)
+            source._front = node
+            source._rear = node
+            self._node = node
+        else:
+            node._values.insert(self._offset, source._copy(value))
+
+            if len(node._values) > source._CAPACITY:
+                # Split a full node in half.
+                half = len(node._values) // 2
+                node._next = _UNode(node._values[half:], node._next)
+                del node._values[half:]
+
+                if node is source._rear:
+                    source._rear = node._next
+
+                if self._offset > half:
+                    self._previous = node
+                    self._node = node._next
+                    self._offset -= half
+        source._count += 1
+        return
+
+    def remove_current(self):
+        """
+        -------------------------------------------------------
+        Removes the value last returned by next. The cursor moves back
+        to before it, so next returns the value that followed the one
+        removed. O(_CAPACITY), except that removing the only value of
+        the rear node walks the list to find the new node before it.
+        Use: value = c.remove_current()
+        -------------------------------------------------------
+        Postconditions:
+            returns
+            value - the value removed from the list (?)
+        -------------------------------------------------------
+        """
+        assert self._on_value, "Cursor is not on a value"
+
+        source = self._list
+        node = self._node
+
+        if len(node._values) == 1 and node._next is not None:
+            # Take in the next node's values so that node does not empty.
+            following = node._next
+            node._values.extend(following._values)
+            node._next = following._next
+
+            if following is source._rear:
+                source._rear = node
+
+        self._offset -= 1
+        value = node._values.pop(self._offset)
+        source._count -= 1
+        self._on_value = False
+
+        if not node._values:
+            # node was the rear node and this was its only value.
+            previous = self._previous
+
+            if previous is None:
+                source._front = None
+                source._rear = None
+                self._node = None
+                self._offset = 0
+            else:
+                previous._next = None
+                source._rear = previous
+                self._node = previous
+                self._offset = len(previous._values)
+                self._previous = None
+                current = source._front
+
+                while current is not previous:
+                    self._previous = current
+                    current = current._next
+        elif len(node._values) < source._CAPACITY // 2 and \
+                node._next is not None and \
+                len(node._values) + len(node._next._values) <= source._CAPACITY:
+            following = node._next
+            node._values.extend(following._values)
+            node._next = following._next
+
+            if following is source._rear:
+                source._rear = node
+        return value
+
+
+class List:
+    """
+    -------------------------------------------------------
+    Constants.
+    -------------------------------------------------------
+    """
+    # Most values a node holds. A node that falls below half of this
+    # is merged with the node after it when they fit together.
+    _CAPACITY = 64
+
+    def __init__(self, copy="deep"):
+        """
+        -------------------------------------------------------
+        Initializes an empty list. Values are stored in a linked list
+        of nodes that each hold a Python list of up to _CAPACITY values,
+        so iteration runs mostly over contiguous arrays and an insert
+        shifts at most one node's values. The API is that of
+        list_linked.List; the recursive _r methods are the iterative
+        ones under their recursive names.
+        Use: l = List()
+        -------------------------------------------------------
+        Preconditions:
+            copy - copy policy for values stored and returned: "deep",
+                "shallow", or "none" (str)
+        Postconditions:
+            Initializes an empty list.
+        -------------------------------------------------------
+        """
+        self._front = None
+        self._rear = None
+        self._count = 0
+        self._copy_policy = copy
+        self._copy = copier(copy)
+        return
+
+    def is_empty(self):
+        """
+        -------------------------------------------------------
+        Determines if the list is empty.
+        Use: b = l.is_empty()
+        -------------------------------------------------------
+        Postconditions:
+            returns
+            True if the list is empty, False otherwise.
+        -------------------------------------------------------
+        """
+        return self._front is None
+
+    def __len__(self):
+        """
+        -------------------------------------------------------
+        Returns the size of the list.
+        Use: n = len(l)
+        -------------------------------------------------------
+        Postconditions:
+            returns
+            the number of values in the list.
+        -------------------------------------------------------
+        """
+        return self._count
+
+    def _load(self, values):
+        """
+        -------------------------------------------------------
+        Replaces the contents of the list with values, without copying.
+        Private helper method - used only by other ADT methods.
+        Use: self._load(values)
+        -------------------------------------------------------
+        Preconditions:
+            values - values in list order (list)
+        Postconditions:
+            The list contains values in order, in full nodes.
+        -------------------------------------------------------
+        """
+        self._front = None
+        self._rear = None
+        self._count = len(values)
+
+        for i in range(0, len(values), self._CAPACITY):
+            node = _UNode(values[i:i + self._CAPACITY], None)
+
+            if self._front is None:
+                self._front = node
+            else:
+                self._rear._next = node
+            self._rear = node
+        return
+
+    def _locate(self, i):
+        """
+        -------------------------------------------------------
+        Finds the node holding the value at index i.
+        Private helper method - used only by other ADT methods.
+        Use: previous, node, offset = self._locate(i)
+        -------------------------------------------------------
+        Preconditions:
+            i - a non-negative index (0 <= int < len(self))
+        Postconditions:
+            returns
+            previous - the node before node, None if node is the
+                front (_UNode)
+            node - the node holding the value at index i (_UNode)
+            offset - the index of the value within node (int)
+        -------------------------------------------------------
+        """
+        previous = None
+        node = self._front
+
+        while i >= len(node._values):
+            i -= len(node._values)
+            previous = node
+            node = node._next
+        return previous, node, i
+
+    def _remove_at(self, previous, node, offset):
+        """
+        -------------------------------------------------------
+        Removes and returns the value at offset in node, unlinking
+        node if it empties and merging it with the next node if it
+        falls below half full and they fit together.
+        Private helper method - used only by other ADT methods.
+        Use: value = self._remove_at(previous, node, offset)
+        -------------------------------------------------------
+        Preconditions:
+            previous - the node before node, None if node is the
+                front (_UNode)
+            node - a node of the list (_UNode)
+            offset - the index of a value within node (int)
+        Postconditions:
+            returns
+            value - the value removed (?)
+        -------------------------------------------------------
+        """
+        value = node._values.pop(offset)
+        self._count -= 1
+
+        if not node._values:
+            if previous is None:
+                self._front = node._next
+            else:
+                previous._next = node._next
+
+            if node is self._rear:
+                self._rear = previous
+        elif len(node._values) < self._CAPACITY // 2 and \
+                node._next is not None and \
+                len(node._values) + len(node._next._values) <= self._CAPACITY:
+            following = node._next
+            node._values.extend(following._values)
+            node._next = following._next
+
+            if following is self._rear:
+                self._rear = node
+        return value
+
+    def insert(self, i, value):
+        """
+        -------------------------------------------------------
+        Inserts a copy of value into the list at index i.
+        Use: l.insert(i, value)
+        -------------------------------------------------------
+        Preconditions:
+            i - index value (int)
+            value - a data element (?)
+        Postconditions:
+            a copy of value is added to index i, all other values are pushed right
+            If i outside of range of length of list, appended to end
+        -------------------------------------------------------
+        """
+        if i < 0:
+            # negative index
+            i = max(self._count + i, 0)
+
+        if i >= self._count:
+            self.append(value)
+        else:
+            _, node, offset = self._locate(i)
+            node._values.insert(offset, self._copy(value))
+            self._count += 1
+
+            if len(node._values) > self._CAPACITY:
+                # Split a full node in half.
+                half = len(node._values) // 2
+                node._next = _UNode(node._values[half:], node._next)
+                del node._values[half:]
+
+                if node is self._rear:
+                    self._rear = node._next
+        return
+
+    def insert_front(self, value):
+        """
+        -------------------------------------------------------
+        Inserts a copy of value into the front of the list.
+        Use: l.insert_front(value)
+        -------------------------------------------------------
+        Preconditions:
+            value - a data element. (?)
+        Postconditions:
+            value is added to the front of the list.
+        -------------------------------------------------------
+        """
+        self.insert(0, value)
+        return
+
+    def append(self, value):
+        """
+        ---------------------------------------------------------
+        Appends a copy of value to the end of the List.
+        Use: l.append(value)
+        -------------------------------------------------------
+        Preconditions:
+            value - a data element (?)
+        Postconditions:
+            a copy of value is added to the end of the List.
+        -------------------------------------------------------
+        """
+        if self._rear is None:
+            self._front = self._rear = _UNode([], None)
+        elif len(self._rear._values) >= self._CAPACITY:
+            self._rear._next = _UNode([], None)
+            self._rear = self._rear._next
+
+        self._rear._values.append(self._copy(value))
+        self._count += 1
+        return
+
+    def extend(self, values):
+        """
+        ---------------------------------------------------------
+        Appends a copy of each value in values to the end of the List.
+        Use: l.extend(values)
+        -------------------------------------------------------
+        Preconditions:
+            values - an iterable of data elements (iterable)
+        Postconditions:
+            a copy of each value is added to the end of the List, in order.
+        -------------------------------------------------------
+        """
+        for value in values:
+            self.append(value)
+        return
+
+    def _linear_search(self, key):
+        """
+        -------------------------------------------------------
+        Searches for the first occurrence of key in the list.
+        Private helper method - used only by other ADT methods.
+        Use: previous, node, offset, i = self._linear_search(key)
+        -------------------------------------------------------
+        Preconditions:
+            key - a partial data element (?)
+        Postconditions:
+            returns
+            previous - the node before node, None if node is the
+                front (_UNode)
+            node - the node containing key, None if key not found (_UNode)
+            offset - the index of key within node, -1 if key not found (int)
+            i - the index of key in the list, -1 if key not found (int)
+        -------------------------------------------------------
+        """
+        previous = None
+        node = self._front
+        i = 0
+
+        while node is not None and key not in node._values:
+            i += len(node._values)
+            previous = node
+            node = node._next
+
+        if node is None:
+            offset = -1
+            i = -1
+        else:
+            offset = node._values.index(key)
+            i += offset
+        return previous, node, offset, i
+
+    def remove(self, key):
+        """
+        -------------------------------------------------------
+        Finds, removes, and returns the value in list that matches key.
+        Use: value = l.remove(key)
+        -------------------------------------------------------
+        Preconditions:
+            key - a partial data element (?)
+        Postconditions:
+            returns
+            value - the full value matching key, otherwise None (?)
+        -------------------------------------------------------
+        """
+        assert self._front is not None, "Cannot remove from an empty list"
+
+        previous, node, offset, _ = self._linear_search(key)
+
+        if node is None:
+            value = None
+        else:
+            value = self._remove_at(previous, node, offset)
+        return value
+
+    def remove_front(self):
+        """
+        -------------------------------------------------------
+        Removes the first value in the list.
+        Use: value = l.remove_front()
+        -------------------------------------------------------
+        Postconditions:
+            returns
+            value - the first value in the list (?)
+        -------------------------------------------------------
+        """
+        assert self._front is not None, "Cannot remove from an empty list"
+
+        value = self._remove_at(None, self._front, 0)
+        return value
+
+    def remove_many(self, key):
+        """
+        -------------------------------------------------------
+        Finds and removes all values in the list that match key.
+        Use: l.remove_many(key)
+        -------------------------------------------------------
+        Preconditions:
+            key - a data element (?)
+        Postconditions:
+            Removes all values matching key.
+        -------------------------------------------------------
+        """
+        assert self._front is not None, "Cannot remove from an empty list"
+
+        values = [value for value in self if value != key]
+
+        if len(values) < self._count:
+            self._load(values)
+        return
+
+    def find(self, key):
+        """
+        -------------------------------------------------------
+        Finds and returns a copy of value in list that matches key.
+        Use: value = l.find(key)
+        -------------------------------------------------------
+        Preconditions:
+            key - a partial data element (?)
+        Postconditions:
+            returns
+            value - a copy of the full value matching key, otherwise None (?)
+        -------------------------------------------------------
+        """
+        _, node, offset, _ = self._linear_search(key)
+
+        if node is not None:
+            value = self._copy(node._values[offset])
+        else:
+            value = None
+        return value
+
+    def peek(self):
+        """
+        -------------------------------------------------------
+        Returns a copy of the first value in list.
+        Use: value = l.peek()
+        -------------------------------------------------------
+        Postconditions:
+            returns
+            value - a copy of the first value in the list (?)
+        -------------------------------------------------------
+        """
+        assert self._front is not None, "Cannot peek at an empty list"
+
+        value = self._copy(self._front._values[0])
+        return value
+
+    def index(self, key):
+        """
+        -------------------------------------------------------
+        Finds location of a value by key in list.
+        Use: n = l.index(key)
+        -------------------------------------------------------
+        Preconditions:
+            key - a partial data element (?)
+        Postconditions:
+            returns
+            i - the index of the location of key in the list, -1 if
+                key is not in the list.
+        -------------------------------------------------------
+        """
+        _, _, _, i = self._linear_search(key)
+        return i
+
+    def _valid_index(self, i):
+        """
+        -------------------------------------------------------
+        Private helper method to validate an index value.
+        Python index values can be positive or negative and range from
+          -len(list) to len(list) - 1
+        Use: assert self._valid_index(i)
+        -------------------------------------------------------
+        Preconditions:
+            i - an index value (int)
+        Postconditions:
+            returns
+            True if i is a valid index, False otherwise.
+        -------------------------------------------------------
+        """
+        n = self._count
+        return -n <= i < n
+
+    def __getitem__(self, i):
+        """
+        ---------------------------------------------------------
+        Returns a copy of the nth element of the list.
+        Use: value = l[i]
+        -------------------------------------------------------
+        Preconditions:
+            i - index of the element to access (int)
+        Postconditions:
+            returns
+            value - the i-th element of list (?)
+        -------------------------------------------------------
+        """
+        assert self._valid_index(i), "Invalid index value"
+
+        if i < 0:
+            # negative index - convert to positive
+            i = self._count + i
+
+        _, node, offset = self._locate(i)
+        value = self._copy(node._values[offset])
+        return value
+
+    def __setitem__(self, i, value):
+        """
+        ---------------------------------------------------------
+        Places a copy of value into the list at position n.
+        Use: l[i] = value
+        -------------------------------------------------------
+        Preconditions:
+            i - index of the element to access (int)
+            value - a data value (?)
+        Postconditions:
+            The i-th element of list contains a copy of value. The
+                existing value at i is overwritten.
+        -------------------------------------------------------
+        """
+        assert self._valid_index(i), "Invalid index value"
+
+        if i < 0:
+            # negative index - convert to positive
+            i = self._count + i
+
+        _, node, offset = self._locate(i)
+        node._values[offset] = self._copy(value)
+        return
+
+    def __contains__(self, key):
+        """
+        ---------------------------------------------------------
+        Determines if the list contains key.
+        Use: b = key in l
+        -------------------------------------------------------
+        Preconditions:
+            key - a partial data element (?)
+        Postconditions:
+            returns
+            True if the list contains key, False otherwise.
+        -------------------------------------------------------
+        """
+        _, node, _, _ = self._linear_search(key)
+        return node is not None
+
+    def max(self):
+        """
+        -------------------------------------------------------
+        Finds the maximum value in list.
+        Use: value = l.max()
+        -------------------------------------------------------
+        Postconditions:
+            returns
+            max_data - a copy of the maximum value in the list (?)
+        -------------------------------------------------------
+        """
+        assert self._front is not None, "Cannot find maximum of an empty list"
+
+        max_data = self._copy(max(self))
+        return max_data
+
+    def min(self):
+        """
+        -------------------------------------------------------
+        Finds the minimum value in list.
+        Use: value = l.min()
+        -------------------------------------------------------
+        Postconditions:
+            returns
+            min_data - a copy of the minimum value in the list (?)
+        -------------------------------------------------------
+        """
+        assert self._front is not None, "Cannot find minimum of an empty list"
+
+        min_data = self._copy(min(self))
+        return min_data
+
+    def count(self, key):
+        """
+        -------------------------------------------------------
+        Finds the number of times key appears in list.
+        Use: n = l.count(key)
+        -------------------------------------------------------
+        Preconditions:
+            key - a partial data element (?)
+        Postconditions:
+            returns
+            number - number of times key appears in list (int)
+        -------------------------------------------------------
+        """
+        number = 0
+        node = self._front
+
+        while node is not None:
+            number += node._values.count(key)
+            node = node._next
+        return number
+
+    def clean(self):
+        """
+        ---------------------------------------------------------
+        Removes duplicates from the list.
+        Use: l.clean()
+        -------------------------------------------------------
+        Postconditions:
+            The list contains one and only one of each value formerly present
+            in the list. The first occurrence of each value is preserved.
+        -------------------------------------------------------
+        """
+        values = []
+
+        for value in self:
+            if value not in values:
+                values.append(value)
+
+        if len(values) < self._count:
+            self._load(values)
+        return
+
+    def pop(self, *i):
+        """
+        -------------------------------------------------------
+        Finds, removes, and returns the value in list whose index matches i.
+        Use: value = l.pop(i)
+        -------------------------------------------------------
+        Preconditions:
+            i - an array of arguments (?)
+                i[0], if it exists, is the index
+        Postconditions:
+            returns
+            value - if i exists, the value at position i, otherwise the last
+                value in the list, value is removed from the list (?)
+        -------------------------------------------------------
+        """
+        assert self._front is not None, "Cannot pop from an empty list"
+        assert len(i) <= 1, "No more than 1 argument allowed"
+
+        if len(i) == 1:
+            assert self._valid_index(i[0]), "Invalid index value"
+            index = i[0]
+
+            if index < 0:
+                # index is negative
+                index = self._count + index
+        else:
+            # pop the last element
+            index = self._count - 1
+
+        previous, node, offset = self._locate(index)
+        value = self._remove_at(previous, node, offset)
+        return value
+
+    def identical(self, rs):
+        """
+        ---------------------------------------------------------
+        Determines whether two lists are identical.
+        Use: b = l.identical(rs)
+        -------------------------------------------------------
+        Preconditions:
+            rs - another list (List)
+        Postconditions:
+            returns
+            is_identical - True if this list contains the same values as rs
+                in the same order, otherwise False.
+        -------------------------------------------------------
+        """
+        is_identical = self._count == rs._count
+
+        if is_identical:
+            for v1, v2 in zip(self, rs):
+                if v1 != v2:
+                    is_identical = False
+                    break
+        return is_identical
+
+    def identical_r(self, rs):
+        """
+        ---------------------------------------------------------
+        Determines whether two lists are identical. The same as
+        identical.
+        Use: b = l.identical_r(rs)
+        -------------------------------------------------------
+        Preconditions:
+            rs - another list (List)
+        Postconditions:
+            returns
+            is_identical - True if this list contains the same values as rs
+                in the same order, otherwise False.
+        -------------------------------------------------------
+        """
+        return self.identical(rs)
+
+    def reverse(self):
+        """
+        -------------------------------------------------------
+        Reverses the order of the elements in list.
+        Use: l.reverse()
+        -------------------------------------------------------
+        Postconditions:
+            The contents of list are reversed in order with respect
+            to their order before the method was called.
+        -------------------------------------------------------
+        """
+        new_front = None
+        # The front node becomes the last node.
+        self._rear = self._front
+
+        while self._front is not None:
+            node = self._front
+            self._front = node._next
+            node._values.reverse()
+            node._next = new_front
+            new_front = node
+
+        self._front = new_front
+        return
+
+    def reverse_r(self):
+        """
+        -------------------------------------------------------
+        Reverses the order of the elements in list. The same as
+        reverse.
+        Use: l.reverse_r()
+        -------------------------------------------------------
+        Postconditions:
+            The contents of list are reversed in order with respect
+            to their order before the method was called.
+        -------------------------------------------------------
+        """
+        self.reverse()
+        return
+
+    def split(self):
+        """
+        -------------------------------------------------------
+        Splits list into two parts. ls contains the first half,
+        rs the second half. Current list is empty.
+        Use: ls, rs = l.split()
+        -------------------------------------------------------
+        Postconditions:
+            returns
+            ls - a new List with >= 50% of the original List (List)
+            rs - a new List with <= 50% of the original List (List)
+        -------------------------------------------------------
+        """
+        ls = List(copy=self._copy_policy)
+        rs = List(copy=self._copy_policy)
+        ls._count = (self._count + 1) // 2
+        rs._count = self._count - ls._count
+
+        if ls._count > 0:
+            # Cut the node holding the last value of the first half.
+            _, node, offset = self._locate(ls._count - 1)
+            tail = node._values[offset + 1:]
+            del node._values[offset + 1:]
+
+            if tail:
+                rs._front = _UNode(tail, node._next)
+            else:
+                rs._front = node._next
+
+            if rs._front is not None:
+                if node is self._rear:
+                    rs._rear = rs._front
+                else:
+                    rs._rear = self._rear
+
+            node._next = None
+            ls._front = self._front
+            ls._rear = node
+
+        self._front = None
+        self._rear = None
+        self._count = 0
+        return ls, rs
+
+    def split_alt(self):
+        """
+        -------------------------------------------------------
+        Split a list into two parts. even contains the even indexed
+        elements, odd contains the odd indexed elements.
+        Values keep their order.
+        Use: even, odd = l.split_alt()
+        -------------------------------------------------------
+        Postconditions:
+            returns
+            even - the even indexed elements of the list (List)
+            odd - the odd indexed elements of the list (List)
+            The list is empty.
+        -------------------------------------------------------
+        """
+        even = List(copy=self._copy_policy)
+        odd = List(copy=self._copy_policy)
+        values = list(self)
+        even._load(values[0::2])
+        odd._load(values[1::2])
+        self._load([])
+        return even, odd
+
+    def split_alt_r(self):
+        """
+        -------------------------------------------------------
+        Split a list into two parts. The same as split_alt.
+        Use: even, odd = l.split_alt_r()
+        -------------------------------------------------------
+        Postconditions:
+            returns
+            even - the even indexed elements of the list (List)
+            odd - the odd indexed elements of the list (List)
+            The list is empty.
+        -------------------------------------------------------
+        """
+        return self.split_alt()
+
+    def combine(self, rs):
+        """
+        -------------------------------------------------------
+        Combines contents of two lists into a third.
+        Use: new_list = l1.combine(rs)
+        -------------------------------------------------------
+        Preconditions:
+            rs - an unrolled linked List (List)
+        Postconditions:
+            returns
+            new_list - the contents of the current List and rs
+            are interlaced into new_list - current List and rs
+            are empty (List)
+        -------------------------------------------------------
+        """
+        new_list = List(copy=self._copy_policy)
+        left = list(self)
+        right = list(rs)
+        n = min(len(left), len(right))
+        values = [None] * (2 * n)
+        values[0::2] = left[:n]
+        values[1::2] = right[:n]
+        values.extend(left[n:])
+        values.extend(right[n:])
+        new_list._load(values)
+        self._load([])
+        rs._load([])
+        return new_list
+
+    def intersection(self, rs):
+        """
+        -------------------------------------------------------
+        Copies only the values common to both the current list and rs
+        to a new list.
+        Use: new_list = l.intersection(rs)
+        -------------------------------------------------------
+        Preconditions:
+            rs - another list (List)
+        Postconditions:
+            returns
+            new_list - contains one copy of values common to current list
+                and rs (List)
+        -------------------------------------------------------
+        """
+        new_list = List(copy=self._copy_policy)
+
+        for value in self:
+            if value in rs and value not in new_list:
+                new_list.append(value)
+        return new_list
+
+    def intersection_r(self, rs):
+        """
+        -------------------------------------------------------
+        Copies only the values common to both the current list and rs
+        to a new list. The same as intersection.
+        Use: new_list = l.intersection_r(rs)
+        -------------------------------------------------------
+        Preconditions:
+            rs - another list (List)
+        Postconditions:
+            returns
+            new_list - contains one copy of values common to current list
+                and rs (List)
+        -------------------------------------------------------
+        """
+        return self.intersection(rs)
+
+    def union(self, rs):
+        """
+        -------------------------------------------------------
+        Returns a list that contains all values in both
+        the current List and rs.
+        Use: new_list = l.union(rs)
+        -------------------------------------------------------
+        Preconditions:
+            rs - another list (List)
+        Postconditions:
+            returns
+            new_list - contains all values found in both the current
+            List and rs. Values do not repeat. (List)
+        -------------------------------------------------------
+        """
+        new_list = List(copy=self._copy_policy)
+
+        for value in self:
+            if value not in new_list:
+                new_list.append(value)
+        for value in rs:
+            if value not in new_list:
+                new_list.append(value)
+        return new_list
+
+    def cursor(self):
+        """
+        -------------------------------------------------------
+        Returns a cursor for walking the list and changing it in place.
+        Changing the list other than through the cursor invalidates it.
+        Use: c = l.cursor()
+        -------------------------------------------------------
+        Postconditions:
+            returns
+            c - a cursor positioned before the front of the list
+                (_UCursor)
+        -------------------------------------------------------
+        """
+        return _UCursor(self)
+
+    def __iter__(self):
+        """
+        USE FOR TESTING ONLY
+        -------------------------------------------------------
+        Generates a Python iterator. Iterates through the list
+        from front to rear.
+        Use: for v in l:
+        -------------------------------------------------------
+        Postconditions:
+            yields
+            value - the next value in the list (?)
+        -------------------------------------------------------
+        """
+        node = self._front
+
+        while node is not None:
+            yield from node._values
+            node = node._next
@@ -9,25 +9,61 @@ Email:   dbrown@wlu.ca
 __updated__ = "2017-08-19"
 -------------------------------------------------------
 """
-from copy import deepcopy
+from heapq import heapify, heappop, heappush
+
+from copy_policy import copier
 
 
 class PriorityQueue:
 
-    def __init__(self):
+    def __init__(self, copy="deep"):
         """
         -------------------------------------------------------
-        Initializes an empty priority queue.
+        Initializes an empty priority queue. Data is stored in a list
+        as a binary min-heap of (value, sequence) pairs. The sequence
+        number records insertion order so that equal values are
+        removed first in, first out.
         Use: pq = PriorityQueue()
         -------------------------------------------------------
+        Preconditions:
+            copy - copy policy for values stored and returned: "deep",
+                "shallow", or "none" (str)
         Postconditions:
             Initializes an empty priority queue.
         -------------------------------------------------------
         """
         self._values = []
-        self._first = None
+        self._seq = 0
+        self._copy_policy = copy
+        self._copy = copier(copy)
         return
 
+    @classmethod
+    def from_iterable(cls, values, copy="deep"):
+        """
+        -------------------------------------------------------
+        Creates a priority queue from a batch of values in O(n) time.
+        Equal values are removed in the order they appear in values.
+        Use: pq = PriorityQueue.from_iterable(values)
+        -------------------------------------------------------
+        Preconditions:
+            values - an iterable of comparable values (iterable)
+            copy - copy policy passed to the new priority queue (str)
+        Postconditions:
+            returns
+            pq - a priority queue containing copies of values
+                (PriorityQueue)
+        -------------------------------------------------------
+        """
+        pq = cls(copy=copy)
+
+        for value in values:
+            pq._values.append((pq._copy(value), pq._seq))
+            pq._seq += 1
+
+        heapify(pq._values)
+        return pq
+
     def is_empty(self):
         """
         -------------------------------------------------------
@@ -57,7 +93,7 @@ class PriorityQueue:
     def insert(self, value):
         """
         -------------------------------------------------------
-        Inserts a copy of value into the priority queue.
+        Inserts a copy of value into the priority queue. O(log n).
         Use: pq.insert(value)
         -------------------------------------------------------
         Preconditions:
@@ -66,19 +102,14 @@ class PriorityQueue:
             a copy of value is added to the priority queue.
         -------------------------------------------------------
         """
-        self._values.append(deepcopy(value))
-        n = len(self._values)
-        
-        if n == 1:
-            self._first = 0
-        elif self._values[self._first] > value:
-            self._first = n - 1
+        heappush(self._values, (self._copy(value), self._seq))
+        self._seq += 1
         return
-    
+
     def remove(self):
         """
         -------------------------------------------------------
-        Removes and returns value from the priority queue.
+        Removes and returns value from the priority queue. O(log n).
         Use: v = pq.remove()
         -------------------------------------------------------
         Postconditions:
@@ -89,15 +120,8 @@ class PriorityQueue:
         """
         assert len(
             self._values) > 0, "Cannot remove from an empty priority queue"
- 
-        value = self._values.pop(self._first)
-        if len(self._values) > 0:
-            self._first = 0
-            for i in range(1,len(self._values)):
-                if self._values[i] < self._values[self._first]:
-                    self._first = i
-        else:
-            self._first = None
+
+        value, _ = heappop(self._values)
         return value
 
     def peek(self):
@@ -113,8 +137,8 @@ class PriorityQueue:
         -------------------------------------------------------
         """
         assert len(self._values) > 0, "Cannot peek at an empty priority queue"
-        
-        value = deepcopy(self._values[self._first])
+
+        value = self._copy(self._values[0][0])
 
         return value
 
@@ -122,7 +146,7 @@ class PriorityQueue:
         """
         -------------------------------------------------------
         Splits a priority queue into two depending on an external
-        priority key. The split is stable.
+        priority key. The split is stable. O(n).
         Use: pq2, pq3 = pq1.split(key)
         -------------------------------------------------------
         Preconditions:
@@ -136,36 +160,50 @@ class PriorityQueue:
             The current priority queue is empty
         -------------------------------------------------------
         """
-        pq2 = PriorityQueue()
-        pq3 = PriorityQueue()
-        while len(self._values) > 0:
-            if self._values[0] < key:
-                pq2._values.append(self._values.pop(0))
-            elif len(self._values) > 0 and self._values[0] >= key:
-                pq3._values.append(self._values.pop(0))
+        pq2 = PriorityQueue(copy=self._copy_policy)
+        pq3 = PriorityQueue(copy=self._copy_policy)
+
+        for entry in self._values:
+            if entry[0] < key:
+                pq2._values.append(entry)
+            else:
+                pq3._values.append(entry)
+
+        # Entries keep their sequence numbers, so ties stay in order.
+        heapify(pq2._values)
+        heapify(pq3._values)
+        pq2._seq = self._seq
+        pq3._seq = self._seq
+        self._values = []
         return pq2, pq3
 
     def combine(self, pq2):
         """
         -------------------------------------------------------
-        Combines contents of two priority queues into a new 
-        priority queue.
+        Combines contents of two priority queues into a new
+        priority queue. O(n + m).
         Use: pq3 = pq1.combine(pq2)
         -------------------------------------------------------
         Preconditions:
-            q2 - an array-based queue (Queue)
+            pq2 - an array-based priority queue (PriorityQueue)
         Postconditions:
             returns
-            pq3 - Contents of self and q2 are interlaced 
-                into pq3 (Queue)
+            pq3 - Contents of self and pq2 are combined into pq3. Equal
+                values from self come before those from pq2. self and
+                pq2 are empty. (PriorityQueue)
         -------------------------------------------------------
         """
-        pq3 = PriorityQueue()
-        while len(self._values) > 0 or len(pq2) > 0:
-            if len(self._values) > 0:
-                pq3.insert(self._values.pop())
-            if len(pq2) > 0:
-                pq3.insert(pq2.remove())
+        pq3 = PriorityQueue(copy=self._copy_policy)
+        pq3._values = self._values
+
+        for value, seq in pq2._values:
+            # Renumber pq2's values to follow all of self's values.
+            pq3._values.append((value, seq + self._seq))
+
+        heapify(pq3._values)
+        pq3._seq = self._seq + pq2._seq
+        self._values = []
+        pq2._values = []
         return pq3
 
     def __iter__(self):
@@ -181,7 +219,7 @@ class PriorityQueue:
             value - the next value in the priority queue (?)
         -------------------------------------------------------
         """
-        for value in self._values:
+        for value, _ in self._values:
             yield value
 
     def intersection(self, pq2):
@@ -198,13 +236,13 @@ class PriorityQueue:
             and s2. Values do not repeat. q1 and q2 are empty. (Queue)
         -------------------------------------------------------
         """
-        pq3 = PriorityQueue()
-        for i in self._values:
+        pq3 = PriorityQueue(copy=self._copy_policy)
+        for i in self:
             for v in pq2:
                 if i == v:
                     pq3.insert(i)
         return pq3
-    
+
     def clean(self):
         """
         ---------------------------------------------------------
@@ -216,16 +254,18 @@ class PriorityQueue:
             in the list. The first occurrence of each value is preserved.
         -------------------------------------------------------
         """
+        # Visit values in insertion order so the first occurrence is kept.
+        entries = sorted(self._values, key=lambda entry: entry[1])
         temp = []
-        n = len(self._values)
-
-        while not self._values == 0:
-            v = self._values.pop()
-            if v not in temp:
-                temp.append(v)
-        while not len(temp) == 0:
-            item = temp.pop()
-            self._values.append(item)
-            if item < self._first:
-                self._first = n-1
-        return
\ No newline at end of file
+
+        for entry in entries:
+            found = False
+            for kept in temp:
+                if kept[0] == entry[0]:
+                    found = True
+            if not found:
+                temp.append(entry)
+
+        heapify(temp)
+        self._values = temp
+        return
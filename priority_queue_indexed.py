@@ -0,0 +1,350 @@
+"""
+-------------------------------------------------------
+priority_queue_indexed.py
+Indexed (addressable) version of the Priority Queue ADT.
+-------------------------------------------------------
+Author:  David Brown
+ID:      999999999
+Email:   dbrown@wlu.ca
+__updated__ = "2026-10-18"
+-------------------------------------------------------
+"""
+from copy_policy import copier
+
+
+class IndexedPriorityQueue:
+
+    def __init__(self, copy="deep"):
+        """
+        -------------------------------------------------------
+        Initializes an empty indexed priority queue. Data is stored in
+        a list as a binary min-heap of [value, handle] entries, and a
+        dictionary maps each handle to its entry's position in the heap
+        so that a queued value can be changed or removed in O(log n).
+        Handles are issued in insertion order, so equal values are
+        removed first in, first out.
+        Use: pq = IndexedPriorityQueue()
+        -------------------------------------------------------
+        Preconditions:
+            copy - copy policy for values stored and returned: "deep",
+                "shallow", or "none" (str)
+        Postconditions:
+            Initializes an empty indexed priority queue.
+        -------------------------------------------------------
+        """
+        self._heap = []
+        self._position = {}
+        self._next_handle = 0
+        self._copy_policy = copy
+        self._copy = copier(copy)
+        return
+
+    def is_empty(self):
+        """
+        -------------------------------------------------------
+        Determines if the priority queue is empty.
+        Use: b = pq.is_empty()
+        -------------------------------------------------------
+        Postconditions:
+            returns
+            True if priority queue is empty, False otherwise.
+        -------------------------------------------------------
+        """
+        return len(self._heap) == 0
+
+    def __len__(self):
+        """
+        -------------------------------------------------------
+        Returns the length of the priority queue.
+        Use: n = len(pq)
+        -------------------------------------------------------
+        Postconditions:
+            returns
+            the number of values in the priority queue.
+        -------------------------------------------------------
+        """
+        return len(self._heap)
+
+    def __contains__(self, handle):
+        """
+        ---------------------------------------------------------
+        Determines if the value identified by handle is still queued.
+        Use: b = handle in pq
+        -------------------------------------------------------
+        Preconditions:
+            handle - a handle returned by insert (int)
+        Postconditions:
+            returns
+            True if the handle's value is in the priority queue,
+            False otherwise.
+        -------------------------------------------------------
+        """
+        return handle in self._position
+
+    def insert(self, value):
+        """
+        -------------------------------------------------------
+        Inserts a copy of value into the priority queue. O(log n).
+        Use: handle = pq.insert(value)
+        -------------------------------------------------------
+        Preconditions:
+            value - a data element (?)
+        Postconditions:
+            returns
+            handle - identifies the value for decrease_key, update,
+                discard, and get (int)
+            a copy of value is added to the priority queue.
+        -------------------------------------------------------
+        """
+        handle = self._next_handle
+        self._next_handle += 1
+        self._heap.append([self._copy(value), handle])
+        self._position[handle] = len(self._heap) - 1
+        self._sift_up(len(self._heap) - 1)
+        return handle
+
+    def remove(self):
+        """
+        -------------------------------------------------------
+        Removes and returns value from the priority queue. O(log n).
+        Use: v = pq.remove()
+        -------------------------------------------------------
+        Postconditions:
+            returns
+            value - the highest priority value in the priority queue -
+            the value is removed from the priority queue. (?)
+        -------------------------------------------------------
+        """
+        assert len(self._heap) > 0, "Cannot remove from an empty priority queue"
+
+        value = self._remove_at(0)
+        return value
+
+    def peek(self):
+        """
+        -------------------------------------------------------
+        Peeks at the highest priority value of the priority queue.
+        Use: v = pq.peek()
+        -------------------------------------------------------
+        Postconditions:
+            returns
+            value - a copy of the highest priority value in the priority queue -
+            the value is not removed from the priority queue. (?)
+        -------------------------------------------------------
+        """
+        assert len(self._heap) > 0, "Cannot peek at an empty priority queue"
+
+        value = self._copy(self._heap[0][0])
+        return value
+
+    def get(self, handle):
+        """
+        -------------------------------------------------------
+        Returns a copy of the value identified by handle.
+        Use: v = pq.get(handle)
+        -------------------------------------------------------
+        Preconditions:
+            handle - a handle of a queued value (int)
+        Postconditions:
+            returns
+            value - a copy of the value identified by handle (?)
+        -------------------------------------------------------
+        """
+        assert handle in self._position, "Invalid handle"
+
+        value = self._copy(self._heap[self._position[handle]][0])
+        return value
+
+    def decrease_key(self, handle, value):
+        """
+        -------------------------------------------------------
+        Raises the priority of a queued value by replacing it with a
+        smaller value. O(log n).
+        Use: pq.decrease_key(handle, value)
+        -------------------------------------------------------
+        Preconditions:
+            handle - a handle of a queued value (int)
+            value - a value <= the current value of handle (?)
+        Postconditions:
+            The value identified by handle is replaced by a copy of value.
+        -------------------------------------------------------
+        """
+        assert handle in self._position, "Invalid handle"
+        i = self._position[handle]
+        assert value <= self._heap[i][0], "New value must not be larger"
+
+        self._heap[i][0] = self._copy(value)
+        self._sift_up(i)
+        return
+
+    def update(self, handle, value):
+        """
+        -------------------------------------------------------
+        Replaces a queued value, raising or lowering its priority.
+        The value keeps its original insertion order among equal
+        values. O(log n).
+        Use: pq.update(handle, value)
+        -------------------------------------------------------
+        Preconditions:
+            handle - a handle of a queued value (int)
+            value - a data element (?)
+        Postconditions:
+            The value identified by handle is replaced by a copy of value.
+        -------------------------------------------------------
+        """
+        assert handle in self._position, "Invalid handle"
+        i = self._position[handle]
+
+        self._heap[i][0] = self._copy(value)
+        i = self._sift_up(i)
+        self._sift_down(i)
+        return
+
+    def discard(self, handle):
+        """
+        -------------------------------------------------------
+        Removes and returns the value identified by handle. O(log n).
+        Use: v = pq.discard(handle)
+        -------------------------------------------------------
+        Preconditions:
+            handle - a handle of a queued value (int)
+        Postconditions:
+            returns
+            value - the value identified by handle - the value is
+            removed from the priority queue (?)
+        -------------------------------------------------------
+        """
+        assert handle in self._position, "Invalid handle"
+
+        value = self._remove_at(self._position[handle])
+        return value
+
+    def _remove_at(self, i):
+        """
+        -------------------------------------------------------
+        Removes the heap entry at position i and restores the heap.
+        Private helper method - used only by other ADT methods.
+        Use: value = self._remove_at(i)
+        -------------------------------------------------------
+        Preconditions:
+            i - a position in the heap (0 <= int < len(pq))
+        Postconditions:
+            returns
+            value - the value that was at position i (?)
+        -------------------------------------------------------
+        """
+        last = len(self._heap) - 1
+        if i != last:
+            self._swap(i, last)
+
+        value, handle = self._heap.pop()
+        del self._position[handle]
+
+        if i < len(self._heap):
+            # The entry moved into i may belong above or below it.
+            i = self._sift_up(i)
+            self._sift_down(i)
+        return value
+
+    def _less(self, i, j):
+        """
+        -------------------------------------------------------
+        Determines if heap entry i has higher priority than entry j.
+        Ties are broken by handle, i.e. by insertion order.
+        Private helper method - used only by other ADT methods.
+        Use: b = self._less(i, j)
+        -------------------------------------------------------
+        Preconditions:
+            i, j - positions in the heap (int)
+        Postconditions:
+            returns
+            True if entry i comes before entry j, False otherwise.
+        -------------------------------------------------------
+        """
+        a = self._heap[i]
+        b = self._heap[j]
+        return a[0] < b[0] or (a[0] == b[0] and a[1] < b[1])
+
+    def _swap(self, i, j):
+        """
+        -------------------------------------------------------
+        Swaps heap entries i and j and updates their positions.
+        Private helper method - used only by other ADT methods.
+        Use: self._swap(i, j)
+        -------------------------------------------------------
+        Preconditions:
+            i, j - positions in the heap (int)
+        Postconditions:
+            The entries at i and j are exchanged.
+        -------------------------------------------------------
+        """
+        heap = self._heap
+        heap[i], heap[j] = heap[j], heap[i]
+        self._position[heap[i][1]] = i
+        self._position[heap[j][1]] = j
+        return
+
+    def _sift_up(self, i):
+        """
+        -------------------------------------------------------
+        Moves heap entry i up until its parent has higher priority.
+        Private helper method - used only by other ADT methods.
+        Use: i = self._sift_up(i)
+        -------------------------------------------------------
+        Preconditions:
+            i - a position in the heap (int)
+        Postconditions:
+            returns
+            i - the entry's final position (int)
+        -------------------------------------------------------
+        """
+        while i > 0 and self._less(i, (i - 1) // 2):
+            parent = (i - 1) // 2
+            self._swap(i, parent)
+            i = parent
+        return i
+
+    def _sift_down(self, i):
+        """
+        -------------------------------------------------------
+        Moves heap entry i down until both children have lower priority.
+        Private helper method - used only by other ADT methods.
+        Use: i = self._sift_down(i)
+        -------------------------------------------------------
+        Preconditions:
+            i - a position in the heap (int)
+        Postconditions:
+            returns
+            i - the entry's final position (int)
+        -------------------------------------------------------
+        """
+        n = len(self._heap)
+        done = False
+
+        while not done:
+            child = 2 * i + 1
+            if child + 1 < n and self._less(child + 1, child):
+                child += 1
+
+            if child < n and self._less(child, i):
+                self._swap(i, child)
+                i = child
+            else:
+                done = True
+        return i
+
+    def __iter__(self):
+        """
+        FOR TESTING ONLY
+        -------------------------------------------------------
+        Generates a Python iterator. Iterates through the priority queue
+        in heap order. Not in priority order.
+        Use: for v in pq:
+        -------------------------------------------------------
+        Postconditions:
+            yields
+            value - the next value in the priority queue (?)
+        -------------------------------------------------------
+        """
+        for value, _ in self._heap:
+            yield value
@@ -9,10 +9,13 @@ Email:   dbrown@wlu.ca
 __updated__ = "2018-03-07"
 -------------------------------------------------------
 """
-from copy import deepcopy
+from random import random
+
+from copy_policy import copier
 
 
 class _PQNode:
+    __slots__ = ('_data', '_next')
 
     def __init__(self, value, _next):
         """
@@ -22,31 +25,52 @@ class _PQNode:
         -------------------------------------------------------
         Preconditions:
             value - data value for node (?)
-            _next - another priority queue node (_PQNode)
+            _next - links to the next node at each level of the skip
+                list the node belongs to; _next[0] is the next node in
+                priority order (list of _PQNode)
         Postconditions:
-            Initializes a priority queue node that contains a copy of value
-            and a link to the next node in the priority queue.
+            Initializes a priority queue node that contains value
+            and links to the next nodes in the priority queue.
         -------------------------------------------------------
         """
-        self._data = deepcopy(value)
+        self._data = value
         self._next = _next
         return
 
 
 class PriorityQueue:
+    """
+    -------------------------------------------------------
+    Constants.
+    -------------------------------------------------------
+    """
+    _MAX_LEVEL = 32
+    _P = 0.5
 
-    def __init__(self):
+    def __init__(self, copy="deep"):
         """
         -------------------------------------------------------
-        Initializes an empty priority queue.
+        Initializes an empty priority queue. Values are kept in
+        priority order in a skip list: level 0 links every node, and
+        each higher level links a random half of the nodes of the level
+        below, so insert is expected O(log n) and remove is O(1).
+        A node stays where it is until its value is removed, so insert
+        returns it as a handle for get, update and discard.
         Use: pq = PriorityQueue()
         -------------------------------------------------------
+        Preconditions:
+            copy - copy policy for values stored and returned: "deep",
+                "shallow", or "none" (str)
         Postconditions:
             Initializes an empty priority queue.
         -------------------------------------------------------
         """
-        self._front = None
+        # _front[i] is the first node at level i.
+        self._front = [None] * self._MAX_LEVEL
+        self._level = 0
         self._count = 0
+        self._copy_policy = copy
+        self._copy = copier(copy)
         return
 
     def is_empty(self):
@@ -59,7 +83,7 @@ class PriorityQueue:
             Returns True if priority queue is empty, False otherwise.
         -------------------------------------------------------
         """
-        return self._front is None
+        return self._front[0] is None
 
     def __len__(self):
         """
@@ -73,39 +97,215 @@ class PriorityQueue:
         """
         return self._count
 
+    def _random_level(self):
+        """
+        -------------------------------------------------------
+        Chooses the number of levels for a new node.
+        Private helper method - used only by other ADT methods.
+        Use: level = self._random_level()
+        -------------------------------------------------------
+        Postconditions:
+            returns
+            level - number of levels, k with probability P^(k-1)(1-P)
+                (1 <= int <= _MAX_LEVEL)
+        -------------------------------------------------------
+        """
+        level = 1
+        while level < self._MAX_LEVEL and random() < self._P:
+            level += 1
+        return level
+
+    def _predecessors(self, key, inclusive):
+        """
+        -------------------------------------------------------
+        Finds, at each level, the last node that comes before key.
+        Private helper method - used only by other ADT methods.
+        Use: previous = self._predecessors(key, inclusive)
+        -------------------------------------------------------
+        Preconditions:
+            key - a data element (?)
+            inclusive - if True nodes equal to key count as before key
+                (boolean)
+        Postconditions:
+            returns
+            previous - previous[i] is the last node at level i whose
+                value is < key (<= key if inclusive), None if there is
+                no such node (list of _PQNode)
+        -------------------------------------------------------
+        """
+        previous = [None] * self._MAX_LEVEL
+        node = None
+        level = self._level - 1
+
+        while level >= 0:
+            if node is None:
+                current = self._front[level]
+            else:
+                current = node._next[level]
+
+            while current is not None and (current._data < key or
+                                           (inclusive and current._data == key)):
+                node = current
+                current = current._next[level]
+            previous[level] = node
+            level -= 1
+        return previous
+
+    def _link(self, node):
+        """
+        -------------------------------------------------------
+        Links node into the skip list after any values equal to its
+        value, at each of its levels. Expected O(log n).
+        Private helper method - used only by other ADT methods.
+        Use: self._link(node)
+        -------------------------------------------------------
+        Preconditions:
+            node - a node not in the priority queue (_PQNode)
+        Postconditions:
+            node is in the priority queue.
+        -------------------------------------------------------
+        """
+        previous = self._predecessors(node._data, True)
+        level = len(node._next)
+
+        for i in range(level):
+            if previous[i] is None:
+                node._next[i] = self._front[i]
+                self._front[i] = node
+            else:
+                node._next[i] = previous[i]._next[i]
+                previous[i]._next[i] = node
+
+        if level > self._level:
+            self._level = level
+        self._count += 1
+        return
+
+    def _unlink(self, node):
+        """
+        -------------------------------------------------------
+        Unlinks node from the skip list at each of its levels. Expected
+        O(log n) plus the number of values equal to node's value.
+        Private helper method - used only by other ADT methods.
+        Use: self._unlink(node)
+        -------------------------------------------------------
+        Preconditions:
+            node - a node in the priority queue (_PQNode)
+        Postconditions:
+            node is no longer in the priority queue.
+        -------------------------------------------------------
+        """
+        previous = self._predecessors(node._data, False)
+
+        for i in range(len(node._next)):
+            # node follows previous[i], possibly after equal values.
+            prior = previous[i]
+            if prior is None:
+                current = self._front[i]
+            else:
+                current = prior._next[i]
+
+            while current is not node:
+                prior = current
+                current = current._next[i]
+
+            if prior is None:
+                self._front[i] = node._next[i]
+            else:
+                prior._next[i] = node._next[i]
+
+        while self._level > 0 and self._front[self._level - 1] is None:
+            self._level -= 1
+        self._count -= 1
+        return
+
     def insert(self, value):
         """
         -------------------------------------------------------
-        Inserts a copy of value into the priority queue.
+        Inserts a copy of value into the priority queue. The insertion
+        is stable: value goes after any equal values. Expected O(log n).
         Use: pq.insert(value)
+        Use: handle = pq.insert(value)
         -------------------------------------------------------
         Preconditions:
             value - a data element (?)
         Postconditions:
+            returns
+            handle - identifies the value for get, update, and discard
+                until it is removed (_PQNode)
             a copy of value is added to the priority queue.
         -------------------------------------------------------
         """
-        node = _PQNode(value, None)
-        
-        if self._front is None:
-            self._front = node
-        
-        elif self._front._data < value:
-            self._front = node
-        
-        current = self._front
-        while current._next is not None:
-            current = current._next
-        current._next = node
-        
-        self._count += 1
-        
+        node = _PQNode(self._copy(value), [None] * self._random_level())
+        self._link(node)
+        return node
+
+    def get(self, handle):
+        """
+        -------------------------------------------------------
+        Returns a copy of the value identified by handle.
+        Use: v = pq.get(handle)
+        -------------------------------------------------------
+        Preconditions:
+            handle - a handle of a queued value (_PQNode)
+        Postconditions:
+            returns
+            value - a copy of the value identified by handle (?)
+        -------------------------------------------------------
+        """
+        assert handle._next is not None, "Invalid handle"
+
+        value = self._copy(handle._data)
+        return value
+
+    def update(self, handle, value):
+        """
+        -------------------------------------------------------
+        Replaces a queued value, raising or lowering its priority. The
+        value goes after any values equal to it, and handle still
+        identifies it. Expected O(log n).
+        Use: pq.update(handle, value)
+        -------------------------------------------------------
+        Preconditions:
+            handle - a handle of a queued value (_PQNode)
+            value - a data element (?)
+        Postconditions:
+            The value identified by handle is replaced by a copy of value.
+        -------------------------------------------------------
+        """
+        assert handle._next is not None, "Invalid handle"
+
+        self._unlink(handle)
+        handle._data = self._copy(value)
+        self._link(handle)
         return
 
+    def discard(self, handle):
+        """
+        -------------------------------------------------------
+        Removes and returns the value identified by handle. Expected
+        O(log n).
+        Use: v = pq.discard(handle)
+        -------------------------------------------------------
+        Preconditions:
+            handle - a handle of a queued value (_PQNode)
+        Postconditions:
+            returns
+            value - the value identified by handle - the value is
+            removed from the priority queue (?)
+        -------------------------------------------------------
+        """
+        assert handle._next is not None, "Invalid handle"
+
+        self._unlink(handle)
+        # A removed node is no longer a valid handle.
+        handle._next = None
+        return handle._data
+
     def remove(self):
         """
         -------------------------------------------------------
-        Removes and returns value from the priority queue.
+        Removes and returns value from the priority queue. O(1) expected.
         Use: v = pq.remove()
         -------------------------------------------------------
         Postconditions:
@@ -115,11 +315,18 @@ class PriorityQueue:
         -------------------------------------------------------
         """
         assert self._count > 0, "Cannot remove from an empty priority queue"
-        value = self._front._data
-        self._front = self._front._next
+
+        node = self._front[0]
+        # The first node is first at every level it belongs to.
+        for i in range(len(node._next)):
+            self._front[i] = node._next[i]
+
+        while self._level > 0 and self._front[self._level - 1] is None:
+            self._level -= 1
         self._count -= 1
-        
-        return value
+        # A removed node is no longer a valid handle.
+        node._next = None
+        return node._data
 
     def peek(self):
         """
@@ -135,15 +342,17 @@ class PriorityQueue:
         """
         assert self._count > 0, "Cannot peek at an empty priority queue"
 
-        value = deepcopy(self._front._data)
-        
+        value = self._copy(self._front[0]._data)
+
         return value
 
     def split(self, key):
         """
         -------------------------------------------------------
         Splits a priority queue into two depending on an external
-        priority key. The split is stable.
+        priority key. The split is stable. The skip list is cut at key,
+        so only the nodes before key are visited (to count them).
+        Handles move with their values to pq2 or pq3.
         Use: pq2, pq3 = pq1.split(key)
         -------------------------------------------------------
         Preconditions:
@@ -157,49 +366,33 @@ class PriorityQueue:
             The current priority queue is empty
         -------------------------------------------------------
         """
-#         current = self._front
-#         pq2 = PriorityQueue()
-#         pq3 = PriorityQueue()
-#         
-#         while current is not None:
-#             if pq2._front is None and current._data < key:
-#                 pq2._front = current
-#             elif current._data < key and pq2._front._next is None:
-#                 pq2._front._next = current
-#             pq2_curr = pq2._front._next
-#             if current._data < key:
-#                 pq2_curr._next = current
-#                 pq2_curr = pq2_curr._next
-#             if pq3._front is None and current._data >= key:
-#                 pq3._front = current
-#             elif current._data >= key and pq3._front._next is None:
-#                 pq3._front._next = current
-#             pq3_curr = pq3._front._next
-#             if current._data >= key:
-#                 pq3_curr._next = current
-#                 pq3_curr = pq2_curr._next
-#             current = current._next
-        pq2 = PriorityQueue()
-        pq3 = PriorityQueue()
-
-        prev = None
-        current = self._front
-
-        # Traverses and finds the location of where the split occurs
-        while current is not None and current._data < key:
-            prev = current
-            current = current._next
-            pq3._count += 1
-        pq2._front = current
-        pq2._count = self._count - pq3._count
-
-        if prev is not None:
-            pq3._front = self._front
-            prev._next = None
+        pq2 = PriorityQueue(copy=self._copy_policy)
+        pq3 = PriorityQueue(copy=self._copy_policy)
+        previous = self._predecessors(key, False)
 
-        self._count = 0
-        self._front = None
+        for i in range(self._level):
+            if previous[i] is None:
+                # Every node at this level is >= key.
+                pq3._front[i] = self._front[i]
+            else:
+                pq2._front[i] = self._front[i]
+                pq3._front[i] = previous[i]._next[i]
+                previous[i]._next[i] = None
+
+        for pq in (pq2, pq3):
+            pq._level = self._level
+            while pq._level > 0 and pq._front[pq._level - 1] is None:
+                pq._level -= 1
 
+        current = pq2._front[0]
+        while current is not None:
+            pq2._count += 1
+            current = current._next[0]
+        pq3._count = self._count - pq2._count
+
+        self._front = [None] * self._MAX_LEVEL
+        self._level = 0
+        self._count = 0
         return pq2, pq3
 
     def __iter__(self):
@@ -215,8 +408,8 @@ class PriorityQueue:
             value - the next value in the queue (?)
         -------------------------------------------------------
         """
-        current = self._front
+        current = self._front[0]
 
         while current is not None:
             yield current._data
-            current = current._next
\ No newline at end of file
+            current = current._next[0]
@@ -0,0 +1,319 @@
+"""
+-------------------------------------------------------
+priority_queue_pairing.py
+Pairing heap version of the Priority Queue ADT.
+-------------------------------------------------------
+Author:  David Brown
+ID:      999999999
+Email:   dbrown@wlu.ca
+__updated__ = "2026-10-18"
+-------------------------------------------------------
+"""
+from itertools import count
+
+from copy_policy import copier
+
+# Insertion sequence numbers shared by all queues, so that equal values
+# stay first in, first out even after queues are combined.
+_sequence = count()
+
+
+class _PairingNode:
+    __slots__ = ('_data', '_seq', '_child', '_sibling')
+
+    def __init__(self, value):
+        """
+        -------------------------------------------------------
+        Initializes a pairing heap node.
+        Use: node = _PairingNode(value)
+        -------------------------------------------------------
+        Preconditions:
+            value - data value for node (?)
+        Postconditions:
+            Initializes a node that contains value and the next
+            insertion sequence number, with no children or siblings.
+        -------------------------------------------------------
+        """
+        self._data = value
+        self._seq = next(_sequence)
+        self._child = None
+        self._sibling = None
+        return
+
+
+def _meld(a, b):
+    """
+    -------------------------------------------------------
+    Links two pairing heaps: the root with lower priority becomes the
+    first child of the other. O(1).
+    Use: node = _meld(a, b)
+    -------------------------------------------------------
+    Preconditions:
+        a - root of a pairing heap, or None (_PairingNode)
+        b - root of a pairing heap, or None (_PairingNode)
+    Postconditions:
+        returns
+        node - root of the combined heap (_PairingNode)
+    -------------------------------------------------------
+    """
+    if a is None:
+        node = b
+    elif b is None:
+        node = a
+    else:
+        if b._data < a._data or (b._data == a._data and b._seq < a._seq):
+            a, b = b, a
+        b._sibling = a._child
+        a._child = b
+        node = a
+    return node
+
+
+class PriorityQueue:
+
+    def __init__(self, copy="deep"):
+        """
+        -------------------------------------------------------
+        Initializes an empty priority queue. Data is stored in a
+        pairing heap, so combine is O(1), insert and peek are O(1), and
+        remove is O(log n) amortised.
+        Use: pq = PriorityQueue()
+        -------------------------------------------------------
+        Preconditions:
+            copy - copy policy for values stored and returned: "deep",
+                "shallow", or "none" (str)
+        Postconditions:
+            Initializes an empty priority queue.
+        -------------------------------------------------------
+        """
+        self._root = None
+        self._count = 0
+        self._copy_policy = copy
+        self._copy = copier(copy)
+        return
+
+    def is_empty(self):
+        """
+        -------------------------------------------------------
+        Determines if the priority queue is empty.
+        Use: b = pq.is_empty()
+        -------------------------------------------------------
+        Postconditions:
+            returns
+            True if priority queue is empty, False otherwise.
+        -------------------------------------------------------
+        """
+        return self._root is None
+
+    def __len__(self):
+        """
+        -------------------------------------------------------
+        Returns the length of the priority queue.
+        Use: n = len(pq)
+        -------------------------------------------------------
+        Postconditions:
+            returns
+            the number of values in the priority queue.
+        -------------------------------------------------------
+        """
+        return self._count
+
+    def insert(self, value):
+        """
+        -------------------------------------------------------
+        Inserts a copy of value into the priority queue. O(1).
+        Use: pq.insert(value)
+        -------------------------------------------------------
+        Preconditions:
+            value - a data element (?)
+        Postconditions:
+            a copy of value is added to the priority queue.
+        -------------------------------------------------------
+        """
+        self._root = _meld(self._root, _PairingNode(self._copy(value)))
+        self._count += 1
+        return
+
+    def remove(self):
+        """
+        -------------------------------------------------------
+        Removes and returns value from the priority queue.
+        O(log n) amortised.
+        Use: v = pq.remove()
+        -------------------------------------------------------
+        Postconditions:
+            returns
+            value - the highest priority value in the priority queue -
+            the value is removed from the priority queue. (?)
+        -------------------------------------------------------
+        """
+        assert self._root is not None, "Cannot remove from an empty priority queue"
+
+        value = self._root._data
+        self._root = self._merge_pairs(self._root._child)
+        self._count -= 1
+        return value
+
+    def _merge_pairs(self, first):
+        """
+        -------------------------------------------------------
+        Combines a list of sibling heaps into one heap using the
+        two-pass pairing method: siblings are melded in pairs from left
+        to right, then the pairs are melded from right to left.
+        Private helper method - used only by other ADT methods.
+        Use: root = self._merge_pairs(first)
+        -------------------------------------------------------
+        Preconditions:
+            first - the first of a list of sibling nodes (_PairingNode)
+        Postconditions:
+            returns
+            root - root of the combined heap, None if first is None
+                (_PairingNode)
+        -------------------------------------------------------
+        """
+        pairs = []
+        node = first
+
+        while node is not None:
+            a = node
+            b = a._sibling
+            if b is None:
+                node = None
+            else:
+                node = b._sibling
+                b._sibling = None
+            a._sibling = None
+            pairs.append(_meld(a, b))
+
+        root = None
+        while len(pairs) > 0:
+            root = _meld(pairs.pop(), root)
+        return root
+
+    def peek(self):
+        """
+        -------------------------------------------------------
+        Peeks at the highest priority value of the priority queue.
+        Use: v = pq.peek()
+        -------------------------------------------------------
+        Postconditions:
+            returns
+            value - a copy of the highest priority value in the priority queue -
+            the value is not removed from the priority queue. (?)
+        -------------------------------------------------------
+        """
+        assert self._root is not None, "Cannot peek at an empty priority queue"
+
+        value = self._copy(self._root._data)
+        return value
+
+    def combine(self, pq2):
+        """
+        -------------------------------------------------------
+        Combines contents of two priority queues into a new
+        priority queue. O(1).
+        Use: pq3 = pq1.combine(pq2)
+        -------------------------------------------------------
+        Preconditions:
+            pq2 - a pairing heap priority queue (PriorityQueue)
+        Postconditions:
+            returns
+            pq3 - Contents of self and pq2 are combined into pq3.
+                self and pq2 are empty. (PriorityQueue)
+        -------------------------------------------------------
+        """
+        pq3 = PriorityQueue(copy=self._copy_policy)
+        pq3._root = _meld(self._root, pq2._root)
+        pq3._count = self._count + pq2._count
+        self._root = None
+        self._count = 0
+        pq2._root = None
+        pq2._count = 0
+        return pq3
+
+    def split(self, key):
+        """
+        -------------------------------------------------------
+        Splits a priority queue into two depending on an external
+        priority key. The split is stable. O(n).
+        Use: pq2, pq3 = pq1.split(key)
+        -------------------------------------------------------
+        Preconditions:
+            key - a data object (?)
+        Postconditions:
+            returns
+            pq2 - a priority queue that contains all values
+                with priority less than key (PriorityQueue)
+            pq3 - priority queue that contains all values with
+                priority greater than or equal to key (PriorityQueue)
+            The current priority queue is empty
+        -------------------------------------------------------
+        """
+        pq2 = PriorityQueue(copy=self._copy_policy)
+        pq3 = PriorityQueue(copy=self._copy_policy)
+
+        for node in self._detach_nodes():
+            # Nodes keep their sequence numbers, so ties stay in order.
+            if node._data < key:
+                pq2._root = _meld(pq2._root, node)
+                pq2._count += 1
+            else:
+                pq3._root = _meld(pq3._root, node)
+                pq3._count += 1
+
+        self._root = None
+        self._count = 0
+        return pq2, pq3
+
+    def _detach_nodes(self):
+        """
+        -------------------------------------------------------
+        Generates every node in the heap as a single unlinked node.
+        The heap is left in an unusable state and must be reset.
+        Private helper method - used only by other ADT methods.
+        Use: for node in self._detach_nodes():
+        -------------------------------------------------------
+        Postconditions:
+            yields
+            node - the next node, with no children or siblings
+                (_PairingNode)
+        -------------------------------------------------------
+        """
+        stack = []
+        if self._root is not None:
+            stack.append(self._root)
+
+        while len(stack) > 0:
+            node = stack.pop()
+            if node._sibling is not None:
+                stack.append(node._sibling)
+            if node._child is not None:
+                stack.append(node._child)
+            node._child = None
+            node._sibling = None
+            yield node
+
+    def __iter__(self):
+        """
+        FOR TESTING ONLY
+        -------------------------------------------------------
+        Generates a Python iterator. Iterates through the priority queue
+        in heap order. Not in priority order.
+        Use: for v in pq:
+        -------------------------------------------------------
+        Postconditions:
+            yields
+            value - the next value in the priority queue (?)
+        -------------------------------------------------------
+        """
+        stack = []
+        if self._root is not None:
+            stack.append(self._root)
+
+        while len(stack) > 0:
+            node = stack.pop()
+            yield node._data
+            if node._sibling is not None:
+                stack.append(node._sibling)
+            if node._child is not None:
+                stack.append(node._child)
@@ -9,22 +9,89 @@ Email:   dbrown@wlu.ca
 __updated__ = "2017-08-19"
 -------------------------------------------------------
 """
-from copy import deepcopy
-from stack_array import Stack
+from copy_policy import copier
+
 
 class Queue:
+    """
+    -------------------------------------------------------
+    Constants.
+    -------------------------------------------------------
+    """
+    _INITIAL_CAPACITY = 8
 
-    def __init__(self):
+    def __init__(self, copy="deep"):
         """
         -------------------------------------------------------
-        Initializes an empty queue. Data is stored in a list.
+        Initializes an empty queue. Data is stored in a list used as a
+        ring buffer that doubles when full and halves when it is a
+        quarter full, so insert and remove are amortised O(1).
         Use: q = Queue()
         -------------------------------------------------------
+        Preconditions:
+            copy - copy policy for values stored and returned: "deep",
+                "shallow", or "none" (str)
         Postconditions:
             Initializes an empty queue.
         -------------------------------------------------------
         """
-        self._values = []
+        self._capacity = self._INITIAL_CAPACITY
+        self._values = [None] * self._capacity
+        self._front = 0
+        self._rear = 0
+        self._count = 0
+        self._copy_policy = copy
+        self._copy = copier(copy)
+        return
+
+    def _resize(self, capacity):
+        """
+        -------------------------------------------------------
+        Moves the queue values into a new list of size capacity,
+        with the front of the queue at index 0.
+        Private helper method - used only by other ADT methods.
+        Use: self._resize(capacity)
+        -------------------------------------------------------
+        Preconditions:
+            capacity - new size of the list (int >= len(self))
+        Postconditions:
+            _values has length capacity and holds the queue values in
+            order starting at _front = 0.
+        -------------------------------------------------------
+        """
+        values = [None] * capacity
+        j = self._front
+
+        for i in range(self._count):
+            values[i] = self._values[j]
+            j += 1
+            if j == self._capacity:
+                j = 0
+
+        self._values = values
+        self._capacity = capacity
+        self._front = 0
+        self._rear = self._count % capacity
+        return
+
+    def _load(self, values):
+        """
+        -------------------------------------------------------
+        Replaces the contents of the queue with values, without copying.
+        Private helper method - used only by other ADT methods.
+        Use: self._load(values)
+        -------------------------------------------------------
+        Preconditions:
+            values - values in front to rear order (list)
+        Postconditions:
+            The queue contains values in order.
+        -------------------------------------------------------
+        """
+        self._count = len(values)
+        self._capacity = max(self._INITIAL_CAPACITY, self._count)
+        self._values = values + [None] * (self._capacity - self._count)
+        self._front = 0
+        self._rear = self._count % self._capacity
         return
 
     def is_empty(self):
@@ -37,7 +104,7 @@ class Queue:
             Returns True if the queue is empty, False otherwise.
         -------------------------------------------------------
         """
-        return len(self._values) == 0
+        return self._count == 0
 
     def is_full(self):
         """
@@ -61,7 +128,7 @@ class Queue:
             Returns the number of values in the queue.
         -------------------------------------------------------
         """
-        return len(self._values)
+        return self._count
 
     def insert(self, value):
         """
@@ -75,7 +142,15 @@ class Queue:
             a copy of value is added to the rear of the queue.
         -------------------------------------------------------
         """
-        self._values.append(deepcopy(value))
+        if self._count == self._capacity:
+            # Grow the ring buffer.
+            self._resize(self._capacity * 2)
+
+        self._values[self._rear] = self._copy(value)
+        self._rear += 1
+        if self._rear == self._capacity:
+            self._rear = 0
+        self._count += 1
         return
 
     def remove(self):
@@ -90,9 +165,19 @@ class Queue:
             removed from the queue (?)
         -------------------------------------------------------
         """
-        assert len(self._values) > 0, "Cannot remove from an empty queue"
+        assert self._count > 0, "Cannot remove from an empty queue"
 
-        value = self._values.pop(0)
+        value = self._values[self._front]
+        self._values[self._front] = None
+        self._front += 1
+        if self._front == self._capacity:
+            self._front = 0
+        self._count -= 1
+
+        if self._capacity > self._INITIAL_CAPACITY and \
+                self._count <= self._capacity // 4:
+            # Shrink the ring buffer.
+            self._resize(max(self._capacity // 2, self._INITIAL_CAPACITY))
 
         return value
 
@@ -108,9 +193,9 @@ class Queue:
             the value is not removed from the queue (?)
         -------------------------------------------------------
         """
-        assert len(self._values) > 0, "Cannot peek at an empty queue"
+        assert self._count > 0, "Cannot peek at an empty queue"
 
-        value = deepcopy(self._values[0])
+        value = self._copy(self._values[self._front])
         return value
 
     def combine(self, q2):
@@ -168,22 +253,13 @@ class Queue:
                 Queues are unchanged. (boolean)
         ---------------
         """
-        q1_a = []
-        while len(self._values) > 0:
-            q1_a.insert(0,self._values.pop())
-        q2_a = []
-        while q2.is_empty() != True:
-            q2_a.insert(0,q2._values.pop())
-        if q1_a == q2_a:
-            is_identical = True
-        else:
-            is_identical = False
-        for _ in range(len(q1_a)):
-            value = q1_a.pop(0)
-            self._values.append(value)
-        for _ in range(len(q2_a)):
-            value = q2_a.pop(0)
-            q2.insert(value)
+        is_identical = self._count == q2._count
+
+        if is_identical:
+            for v1, v2 in zip(self, q2):
+                if v1 != v2:
+                    is_identical = False
+                    break
         return is_identical
     def __iter__(self):
         """
@@ -198,9 +274,14 @@ class Queue:
             value - the next value in the queue (?)
         -------------------------------------------------------
         """
-        for value in self._values:
-            yield value
- 
+        j = self._front
+
+        for _ in range(self._count):
+            yield self._values[j]
+            j += 1
+            if j == self._capacity:
+                j = 0
+
     def reverse(self):
         """
         -------------------------------------------------------
@@ -212,13 +293,9 @@ class Queue:
             to their order before the operation was called.
         -------------------------------------------------------
         """
-        s = Stack()
-        print('use')
-        while len(self._values) > 0:
-            v = self._values.pop(0)
-            s.push(v)
-        while not s.is_empty():
-            self._values.append(s.pop())
+        values = list(self)
+        values.reverse()
+        self._load(values)
         return
         
     def intersection(self, q2):
@@ -235,8 +312,8 @@ class Queue:
             and q2. Values do not repeat. q1 and q2 are empty. (Queue)
         -------------------------------------------------------
         """
-        q3 = Queue()
-        for i in self._values:
+        q3 = Queue(copy=self._copy_policy)
+        for i in self:
             for v in q2:
                 if i == v and i:
                     q3.insert(i)
@@ -254,12 +331,10 @@ class Queue:
         -------------------------------------------------------
         """
         temp = []
-        while not len(self._values) == 0:
-            v = self._values.pop()
+        for v in self:
             if v not in temp:
                 temp.append(v)
-        while not len(temp) == 0:
-            self._values.append(temp.pop())
+        self._load(temp)
         
     
     
\ No newline at end of file
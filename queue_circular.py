@@ -10,30 +10,52 @@ Email:   dbrown@wlu.ca
 __updated__ = "2017-08-20"
 -------------------------------------------------------
 """
-from copy import deepcopy
+from copy_policy import copier
 
 
 class CircularQueue:
+    """
+    -------------------------------------------------------
+    Constants: behaviour of insert when the queue is full.
+    FIXED - insert fails.
+    GROW - the queue doubles in size.
+    OVERWRITE - the value at the front of the queue is discarded.
+    -------------------------------------------------------
+    """
+    FIXED = "fixed"
+    GROW = "grow"
+    OVERWRITE = "overwrite"
+    MODES = (FIXED, GROW, OVERWRITE)
 
-    def __init__(self, max_size):
+    def __init__(self, max_size, copy="deep", mode=FIXED):
         """
         -------------------------------------------------------
         Initializes an empty queue. Data is stored in a list.
         Use: cq = CircularQueue(max_size)
+        Use: cq = CircularQueue(max_size, mode=CircularQueue.GROW)
         -------------------------------------------------------
         Preconditions:
-            max_size - maximum size of the queue (int > 0)
+            max_size - maximum size of the queue, or initial size in
+                GROW mode (int > 0)
+            copy - copy policy for values stored and returned: "deep",
+                "shallow", or "none" (str)
+            mode - what insert does when the queue is full: FIXED,
+                GROW, or OVERWRITE (str)
         Postconditions:
             Initializes an empty queue.
         -------------------------------------------------------
         """
         assert max_size > 0, "CircularQueue size must be > 0"
+        assert mode in self.MODES, "Invalid CircularQueue mode"
 
+        self._mode = mode
         self._max_size = max_size
         self._values = [None] * self._max_size
         self._front = 0
         self._rear = 0
         self._count = 0
+        self._copy_policy = copy
+        self._copy = copier(copy)
         return
 
     def is_empty(self):
@@ -57,9 +79,10 @@ class CircularQueue:
         -------------------------------------------------------
         Postconditions:
             Returns True if the queue is full, False otherwise.
+            A GROW mode queue is never full.
         -------------------------------------------------------
         """
-        return self._count == self._max_size
+        return self._mode != self.GROW and self._count == self._max_size
 
     def __len__(self):
         """
@@ -83,13 +106,52 @@ class CircularQueue:
             value - a data element (?)
         Postconditions:
             a copy of value is added to the rear of the queue.
+            If the queue is full, in GROW mode its size is doubled, and
+            in OVERWRITE mode the value at the front is discarded.
         -------------------------------------------------------
         """
-        assert self._count < self._max_size, "queue is full"
-        
-        self._values[self._rear] = deepcopy(value)
+        if self._count == self._max_size:
+            assert self._mode != self.FIXED, "queue is full"
+
+            if self._mode == self.GROW:
+                self._resize(self._max_size * 2)
+            else:
+                # Discard the oldest value: front moves up to make room.
+                self._front = (self._front + 1) % self._max_size
+                self._count -= 1
+
+        self._values[self._rear] = self._copy(value)
         self._rear = (self._rear + 1) % self._max_size
         self._count += 1
+        return
+
+    def _resize(self, max_size):
+        """
+        -------------------------------------------------------
+        Moves the queue values into a new list of size max_size in one
+        pass, with the front of the queue at index 0.
+        Private helper method - used only by other ADT methods.
+        Use: self._resize(max_size)
+        -------------------------------------------------------
+        Preconditions:
+            max_size - new size of the queue (int >= len(self))
+        Postconditions:
+            _values has length max_size and holds the queue values in
+            order starting at _front = 0.
+        -------------------------------------------------------
+        """
+        values = [None] * max_size
+        j = self._front
+
+        for i in range(self._count):
+            values[i] = self._values[j]
+            j = (j + 1) % self._max_size
+
+        self._values = values
+        self._max_size = max_size
+        self._front = 0
+        self._rear = self._count % max_size
+        return
         
     def remove(self):
         """
@@ -105,7 +167,7 @@ class CircularQueue:
         """
         assert self._count > 0, "Cannot remove from an empty queue"
 
-        value = deepcopy(self._values[self._front])
+        value = self._copy(self._values[self._front])
         self._values[self._front] = None
         self._front = (self._front + 1) % self._max_size
         self._count -= 1
@@ -126,7 +188,7 @@ class CircularQueue:
         """
         assert self._count > 0, "Cannot peek at an empty queue"
         
-        return deepcopy(self._values[self._front])
+        return self._copy(self._values[self._front])
     
     def __iter__(self):
         """
@@ -141,5 +203,8 @@ class CircularQueue:
             value - the next value in the queue (?)
         -------------------------------------------------------
         """
-        for value in self._values:
-            yield value
\ No newline at end of file
+        j = self._front
+
+        for _ in range(self._count):
+            yield self._values[j]
+            j = (j + 1) % self._max_size
\ No newline at end of file
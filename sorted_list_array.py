@@ -0,0 +1,668 @@
+"""
+-------------------------------------------------------
+sorted_list_array.py
+Array version of the SortedList ADT.
+-------------------------------------------------------
+Author:  David Brown
+ID:      999999999
+Email:   dbrown@wlu.ca
+__updated__ = "2026-10-18"
+-------------------------------------------------------
+"""
+# Imports
+from bisect import bisect_left, bisect_right, insort_right
+
+from copy_policy import copier
+from sorted_merge import merge_all, merge_distinct
+
+
+class SortedList:
+    """
+    -------------------------------------------------------
+    Constants.
+    -------------------------------------------------------
+    """
+    # Chunks are split above 2 * _LOAD values and merged below _LOAD // 2.
+    _LOAD = 1000
+
+    def __init__(self, copy="deep"):
+        """
+        -------------------------------------------------------
+        Initializes an empty sorted list. Values are stored in a list of
+        sorted Python lists (chunks) of at most 2 * _LOAD values, with
+        the largest value of each chunk kept in _maxes. Searching is
+        two binary searches, O(log n); insert and remove shift at most
+        one chunk and are O(sqrt(n))-ish; indexing sums chunk lengths.
+        Use: sl = SortedList()
+        -------------------------------------------------------
+        Preconditions:
+            copy - copy policy for values stored and returned: "deep",
+                "shallow", or "none" (str)
+        Postconditions:
+          Initializes an empty sorted list.
+        -------------------------------------------------------
+        """
+        self._lists = []
+        self._maxes = []
+        self._count = 0
+        self._copy_policy = copy
+        self._copy = copier(copy)
+        return
+
+    def is_empty(self):
+        """
+        -------------------------------------------------------
+        Determines if the list is empty.
+        Use: b = l.is_empty()
+        -------------------------------------------------------
+        Postconditions:
+          Returns True if the list is empty, False otherwise.
+        -------------------------------------------------------
+        """
+        return self._count == 0
+
+    def __len__(self):
+        """
+        -------------------------------------------------------
+        Returns the size of the list.
+        Use: n = len(l)
+        -------------------------------------------------------
+        Postconditions:
+            Returns the number of values in the list.
+        -------------------------------------------------------
+        """
+        return self._count
+
+    def _load(self, values):
+        """
+        -------------------------------------------------------
+        Replaces the contents of the list with values, without copying.
+        Private helper method - used only by other ADT methods.
+        Use: self._load(values)
+        -------------------------------------------------------
+        Preconditions:
+            values - values in sorted order (list)
+        Postconditions:
+            The list contains values in order, in chunks of _LOAD values.
+        -------------------------------------------------------
+        """
+        self._lists = [values[i:i + self._LOAD]
+                       for i in range(0, len(values), self._LOAD)]
+        self._maxes = [chunk[-1] for chunk in self._lists]
+        self._count = len(values)
+        return
+
+    def _values(self):
+        """
+        -------------------------------------------------------
+        Generates the values of the list from front to rear, without
+        copying.
+        Private helper method - used only by other ADT methods.
+        Use: for v in self._values():
+        -------------------------------------------------------
+        Postconditions:
+            yields
+            value - the next value in the list (?)
+        -------------------------------------------------------
+        """
+        for chunk in self._lists:
+            yield from chunk
+
+    def _split(self, pos):
+        """
+        -------------------------------------------------------
+        Splits chunk pos in half if it has grown too large.
+        Private helper method - used only by other ADT methods.
+        Use: self._split(pos)
+        -------------------------------------------------------
+        Preconditions:
+            pos - index of a chunk (int)
+        Postconditions:
+            chunk pos has at most 2 * _LOAD values.
+        -------------------------------------------------------
+        """
+        chunk = self._lists[pos]
+
+        if len(chunk) > 2 * self._LOAD:
+            half = chunk[self._LOAD:]
+            del chunk[self._LOAD:]
+            self._lists.insert(pos + 1, half)
+            self._maxes[pos] = chunk[-1]
+            self._maxes.insert(pos + 1, half[-1])
+        return
+
+    def _delete(self, pos, idx):
+        """
+        -------------------------------------------------------
+        Removes and returns the value at index idx of chunk pos, merging
+        the chunk with a neighbour if it has become too small.
+        Private helper method - used only by other ADT methods.
+        Use: value = self._delete(pos, idx)
+        -------------------------------------------------------
+        Preconditions:
+            pos - index of a chunk (int)
+            idx - index of a value in chunk pos (int)
+        Postconditions:
+            returns
+            value - the value removed (?)
+        -------------------------------------------------------
+        """
+        chunk = self._lists[pos]
+        value = chunk.pop(idx)
+        self._count -= 1
+
+        if not chunk:
+            del self._lists[pos]
+            del self._maxes[pos]
+        else:
+            self._maxes[pos] = chunk[-1]
+
+            if len(chunk) < self._LOAD // 2 and len(self._lists) > 1:
+                # Merge with the previous chunk, or the next for the first.
+                if pos == 0:
+                    pos = 1
+                self._lists[pos - 1].extend(self._lists[pos])
+                self._maxes[pos - 1] = self._maxes[pos]
+                del self._lists[pos]
+                del self._maxes[pos]
+                self._split(pos - 1)
+        return value
+
+    def _locate(self, i):
+        """
+        -------------------------------------------------------
+        Finds the chunk and chunk index of the value at index i.
+        Private helper method - used only by other ADT methods.
+        Use: pos, idx = self._locate(i)
+        -------------------------------------------------------
+        Preconditions:
+            i - a non-negative index (0 <= int < len(self))
+        Postconditions:
+            returns
+            pos - index of the chunk holding the value (int)
+            idx - index of the value in that chunk (int)
+        -------------------------------------------------------
+        """
+        pos = 0
+
+        for chunk in self._lists:
+            if i < len(chunk):
+                break
+            i -= len(chunk)
+            pos += 1
+        return pos, i
+
+    def insert(self, value):
+        """
+        -------------------------------------------------------
+        Inserts value at the proper place in the sorted list.
+        Must be a stable insertion, i.e. consecutive insertions
+        of the same value must keep their order preserved.
+        Use: sl.insert(value)
+        -------------------------------------------------------
+        Preconditions:
+            value - a data element (?)
+        Postconditions:
+            value inserted at its sorted position within the sorted list.
+        -------------------------------------------------------
+        """
+        value = self._copy(value)
+
+        if not self._lists:
+            self._lists.append([value])
+            self._maxes.append(value)
+        else:
+            # First chunk whose maximum is > value, after any equal values.
+            pos = bisect_right(self._maxes, value)
+
+            if pos == len(self._maxes):
+                pos -= 1
+                self._lists[pos].append(value)
+                self._maxes[pos] = value
+            else:
+                insort_right(self._lists[pos], value)
+            self._split(pos)
+
+        self._count += 1
+        return
+
+    def _search(self, key):
+        """
+        -------------------------------------------------------
+        Searches for the first occurrence of key in the sorted list.
+        Performs a stable search.
+        Private helper method - used only by other ADT methods.
+        Use: pos, idx = self._search(key)
+        -------------------------------------------------------
+        Preconditions:
+            key - a partial data element (?)
+        Postconditions:
+            returns
+            pos - index of the chunk containing key, -1 if key not found (int)
+            idx - index of key in that chunk, -1 if key not found (int)
+        -------------------------------------------------------
+        """
+        pos = bisect_left(self._maxes, key)
+
+        if pos == len(self._maxes):
+            pos = -1
+            idx = -1
+        else:
+            chunk = self._lists[pos]
+            idx = bisect_left(chunk, key)
+
+            if chunk[idx] != key:
+                pos = -1
+                idx = -1
+        return pos, idx
+
+    def remove(self, key):
+        """
+        -------------------------------------------------------
+        Finds, removes, and returns the value in the sorted list that matches key.
+        Use: value = sl.remove( key )
+        -------------------------------------------------------
+        Preconditions:
+            key - a partial data element (?)
+        Postconditions:
+            returns
+            value - the full value matching key, otherwise None (?)
+        -------------------------------------------------------
+        """
+        assert self._count > 0, "Cannot remove from an empty list"
+
+        pos, idx = self._search(key)
+
+        if pos == -1:
+            value = None
+        else:
+            value = self._delete(pos, idx)
+        return value
+
+    def find(self, key):
+        """
+        -------------------------------------------------------
+        Finds and returns a copy of value in list that matches key.
+        Use: value = l.find( key )
+        -------------------------------------------------------
+        Preconditions:
+            key - a partial data element (?)
+        Postconditions:
+            returns
+            value - a copy of the full value matching key, otherwise None (?)
+        -------------------------------------------------------
+        """
+        assert self._count > 0, "Cannot find in an empty list"
+
+        pos, idx = self._search(key)
+
+        if pos == -1:
+            value = None
+        else:
+            value = self._copy(self._lists[pos][idx])
+        return value
+
+    def peek(self):
+        """
+        -------------------------------------------------------
+        Returns a copy of the first value in list.
+        Use: value = l.peek()
+        -------------------------------------------------------
+        Postconditions:
+            returns
+            value - a copy of the first value in the list (?)
+        -------------------------------------------------------
+        """
+        assert self._count > 0, "Cannot peek at an empty list"
+
+        value = self._copy(self._lists[0][0])
+        return value
+
+    def index(self, key):
+        """
+        -------------------------------------------------------
+        Finds location of a value by key in list.
+        Use: n = l.index( key )
+        -------------------------------------------------------
+        Preconditions:
+            key - a partial data element (?)
+        Postconditions:
+            returns
+            i - the index of the location of key in the list, -1 if
+              key is not in the list.
+        -------------------------------------------------------
+        """
+        pos, idx = self._search(key)
+
+        if pos == -1:
+            i = -1
+        else:
+            i = idx
+
+            for chunk in self._lists[:pos]:
+                i += len(chunk)
+        return i
+
+    def _valid_index(self, i):
+        """
+        -------------------------------------------------------
+        Private helper method to validate an index value.
+        Python index values can be positive or negative and range from
+          -len(list) to len(list) - 1
+        Use: assert self._valid_index(i)
+        -------------------------------------------------------
+        Preconditions:
+            i - an index value (int)
+        Postconditions:
+            returns
+            True if i is a valid index, False otherwise.
+        -------------------------------------------------------
+        """
+        n = self._count
+        return -n <= i < n
+
+    def __getitem__(self, i):
+        """
+        ---------------------------------------------------------
+        Returns a copy of the nth element of the list.
+        Use: value = l[i]
+        -------------------------------------------------------
+        Preconditions:
+            i - index of the element to access (int)
+        Postconditions:
+            returns
+            value - the i-th element of list (?)
+        -------------------------------------------------------
+        """
+        assert self._valid_index(i), "Invalid index value"
+
+        if i < 0:
+            # negative index - convert to positive
+            i = self._count + i
+
+        pos, idx = self._locate(i)
+        value = self._copy(self._lists[pos][idx])
+        return value
+
+    def __contains__(self, key):
+        """
+        ---------------------------------------------------------
+        Determines if the list contains key.
+        Use: b = key in l
+        -------------------------------------------------------
+        Preconditions:
+            key - a partial data element (?)
+        Postconditions:
+            returns
+            True if the list contains key, False otherwise.
+        -------------------------------------------------------
+        """
+        pos, _ = self._search(key)
+        return pos != -1
+
+    def max(self):
+        """
+        -------------------------------------------------------
+        Finds the maximum value in the sorted list.
+        Use: value = sl.max()
+        -------------------------------------------------------
+        Postconditions:
+            returns
+            value - a copy of the maximum value in the sorted list (?)
+        -------------------------------------------------------
+        """
+        assert self._count > 0, "Cannot find maximum of an empty list"
+
+        value = self._copy(self._maxes[-1])
+        return value
+
+    def min(self):
+        """
+        -------------------------------------------------------
+        Finds the minimum value in the sorted list.
+        Use: value = sl.min()
+        -------------------------------------------------------
+        Postconditions:
+            returns
+            value - a copy of the minimum value in the sorted list (?)
+        -------------------------------------------------------
+        """
+        assert self._count > 0, "Cannot find minimum of an empty list"
+
+        value = self._copy(self._lists[0][0])
+        return value
+
+    def count(self, key):
+        """
+        -------------------------------------------------------
+        Determines the number of times key appears in the sorted list.
+        Use: n = sl.count(key)
+        -------------------------------------------------------
+        Preconditions:
+            key - a data element (?)
+        Postconditions:
+            returns
+            number - the number of times key appears in the sorted list (int)
+        -------------------------------------------------------
+        """
+        number = 0
+        pos, idx = self._search(key)
+
+        if pos != -1:
+            # Equal values are adjacent but may span several chunks.
+            while pos < len(self._lists):
+                chunk = self._lists[pos]
+                end = bisect_right(chunk, key)
+                number += end - idx
+
+                if end < len(chunk):
+                    break
+                pos += 1
+                idx = 0
+        return number
+
+    def clean(self):
+        """
+        ---------------------------------------------------------
+        Removes duplicates from the sorted list.
+        Use: sl.clean()
+        -------------------------------------------------------
+        Postconditions:
+            The list contains one and only one of each value formerly present
+            in the list. The first occurrence of each value is preserved.
+        -------------------------------------------------------
+        """
+        values = []
+
+        for value in self:
+            # Duplicates are adjacent in a sorted list.
+            if not values or value != values[-1]:
+                values.append(value)
+
+        if len(values) < self._count:
+            self._load(values)
+        return
+
+    def pop(self, *i):
+        """
+        -------------------------------------------------------
+        Finds, removes, and returns the value in list whose index matches i.
+        Use: value = l.remove(i)
+        -------------------------------------------------------
+        Preconditions:
+            i - an array of arguments (?)
+                i[0], if it exists, is the index
+        Postconditions:
+            returns
+            value - if i exists, the value at position i, otherwise the last
+                value in the list, value is removed from the list (?)
+        -------------------------------------------------------
+        """
+        assert self._count > 0, "Cannot pop from an empty list"
+        assert len(i) <= 1, "No more than 1 argument allowed"
+
+        if len(i) == 1:
+            assert self._valid_index(i[0]), "Invalid index value"
+            index = i[0]
+
+            if index < 0:
+                # index is negative
+                index = self._count + index
+            pos, idx = self._locate(index)
+        else:
+            # pop the last element
+            pos = len(self._lists) - 1
+            idx = len(self._lists[pos]) - 1
+
+        value = self._delete(pos, idx)
+        return value
+
+    def _merge(self, rs, left, both, right):
+        """
+        -------------------------------------------------------
+        Walks the current list and rs once in step with
+        sorted_merge.merge_distinct, keeping one copy of each distinct
+        value according to which lists it appears in. O(n + m).
+        Private helper method - used only by other ADT methods.
+        Use: new_list = self._merge(rs, left, both, right)
+        -------------------------------------------------------
+        Preconditions:
+            rs - another list (SortedList)
+            left - keep values found only in the current list (boolean)
+            both - keep values found in both lists (boolean)
+            right - keep values found only in rs (boolean)
+        Postconditions:
+            returns
+            new_list - one copy of each value kept, taken from the
+                current list where it appears in both (SortedList)
+        -------------------------------------------------------
+        """
+        values = merge_distinct(self._values(), rs._values(),
+                                left, both, right, self._copy)
+        new_list = SortedList(copy=self._copy_policy)
+        new_list._load(values)
+        return new_list
+
+    def intersection(self, rs):
+        """
+        -------------------------------------------------------
+        Copies only the values common to both the current list and rs
+        to a new list. O(n + m).
+        -------------------------------------------------------
+        Preconditions:
+            rs - another list (SortedList)
+        Postconditions:
+            returns
+            new_list - contains one copy of values common to current list
+                and rs (SortedList)
+        -------------------------------------------------------
+        """
+        return self._merge(rs, False, True, False)
+
+    def union(self, rs):
+        """
+        -------------------------------------------------------
+        Copies all of the values in both self and rs to
+        a new List. Each value appears only once. O(n + m).
+        -------------------------------------------------------
+        Preconditions:
+        rs - another List (SortedList)
+        Postconditions:
+        Returns:
+        new_list - a List containing one copy each of all values
+        in both self and rs. (SortedList)
+        -------------------------------------------------------
+        """
+        return self._merge(rs, True, True, True)
+
+    def difference(self, rs):
+        """
+        -------------------------------------------------------
+        Copies the values in the current list that are not in rs to
+        a new list. Each value appears only once. O(n + m).
+        Use: new_list = sl.difference(rs)
+        -------------------------------------------------------
+        Preconditions:
+            rs - another list (SortedList)
+        Postconditions:
+            returns
+            new_list - contains one copy of each value in the current
+                list but not in rs (SortedList)
+        -------------------------------------------------------
+        """
+        return self._merge(rs, True, False, False)
+
+    def symmetric_difference(self, rs):
+        """
+        -------------------------------------------------------
+        Copies the values that are in exactly one of the current list
+        and rs to a new list. Each value appears only once. O(n + m).
+        Use: new_list = sl.symmetric_difference(rs)
+        -------------------------------------------------------
+        Preconditions:
+            rs - another list (SortedList)
+        Postconditions:
+            returns
+            new_list - contains one copy of each value in only one of
+                the current list and rs (SortedList)
+        -------------------------------------------------------
+        """
+        return self._merge(rs, True, False, True)
+
+    @classmethod
+    def merge_many(cls, lists, copy="deep"):
+        """
+        -------------------------------------------------------
+        Merges any number of sorted lists into a new sorted list with
+        a k-way heap merge. Duplicates are kept; equal values keep the
+        order of the lists they came from. O(n log k) for n values in
+        k lists.
+        Use: sl = SortedList.merge_many(lists)
+        -------------------------------------------------------
+        Preconditions:
+            lists - sorted lists to merge (iterable of SortedList)
+            copy - copy policy of the new list: "deep", "shallow",
+                or "none" (str)
+        Postconditions:
+            returns
+            new_list - a copy of every value in lists, in sorted order.
+                lists are unchanged. (SortedList)
+        -------------------------------------------------------
+        """
+        new_list = cls(copy=copy)
+        values = merge_all([sl._values() for sl in lists], new_list._copy)
+        new_list._load(values)
+        return new_list
+
+    def remove_front(self):
+        """
+        -------------------------------------------------------
+        Removes first node in list.
+        Use: value = sl.remove_front()
+        -------------------------------------------------------
+        Postconditions:
+          Returns:
+          value - the first value in the list, None if the list is empty.
+        -------------------------------------------------------
+        """
+        if self._count == 0:
+            value = None
+        else:
+            value = self._delete(0, 0)
+        return value
+
+    def __iter__(self):
+        """
+        USE FOR TESTING ONLY
+        -------------------------------------------------------
+        Generates a Python iterator. Iterates through the list
+        from front to rear.
+        Use: for v in s:
+        -------------------------------------------------------
+        Postconditions:
+            yields
+            value - the next value in the list (?)
+        -------------------------------------------------------
+        """
+        for chunk in self._lists:
+            yield from chunk
@@ -10,44 +10,72 @@ __updated__ = "2017-02-24"
 -------------------------------------------------------
 """
 # Imports
-from copy import deepcopy
+from random import random
+
+from copy_policy import copier
+from sorted_merge import merge_all, merge_distinct
 
 
 class _SLNode:
+    __slots__ = ('_data', '_next', '_width')
 
-    def __init__(self, value, next_):
+    def __init__(self, value, _next, _width):
         """
         -------------------------------------------------------
         Initializes a sorted list node.
-        Use: node = _SLNode(value, _next)
+        Use: node = _SLNode(value, _next, _width)
         -------------------------------------------------------
         Preconditions:
             value - data value for node (?)
-            next_ - another sorted list node (_ListNode)
+            _next - links to the next node at each level of the skip
+                list the node belongs to; _next[0] is the next node in
+                sorted order (list of _SLNode)
+            _width - _width[i] is the number of positions _next[i] is
+                ahead of this node (list of int)
         Postconditions:
-            Initializes a list node that contains a copy of value
-            and a link to the next node in the list.
+            Initializes a list node that contains value
+            and links to the next nodes in the list.
         -------------------------------------------------------
         """
-        self._data = deepcopy(value)
-        self._next = next_
+        self._data = value
+        self._next = _next
+        self._width = _width
         return
 
 
 class SortedList:
-
-    def __init__(self):
-        """
-        -------------------------------------------------------
-        Initializes an empty sorted list.
+    """
+    -------------------------------------------------------
+    Constants.
+    -------------------------------------------------------
+    """
+    _MAX_LEVEL = 32
+    _P = 0.5
+
+    def __init__(self, copy="deep"):
+        """
+        -------------------------------------------------------
+        Initializes an empty sorted list. Values are kept in an
+        indexable skip list: level 0 links every node, each higher
+        level links a random half of the nodes of the level below, and
+        every link records how many positions it skips. Searching,
+        insert, remove and indexing are all expected O(log n).
         Use: sl = SortedList()
         -------------------------------------------------------
+        Preconditions:
+            copy - copy policy for values stored and returned: "deep",
+                "shallow", or "none" (str)
         Postconditions:
           Initializes an empty sorted list.
         -------------------------------------------------------
         """
-        self._front = None
+        # _head is a sentinel before the first node, at position 0.
+        self._head = _SLNode(None, [None] * self._MAX_LEVEL,
+                             [0] * self._MAX_LEVEL)
+        self._level = 0
         self._count = 0
+        self._copy_policy = copy
+        self._copy = copier(copy)
         return
 
     def is_empty(self):
@@ -60,7 +88,7 @@ class SortedList:
           Returns True if the list is empty, False otherwise.
         -------------------------------------------------------
         """
-        return self._front is None
+        return self._head._next[0] is None
 
     def __len__(self):
         """
@@ -74,6 +102,192 @@ class SortedList:
         """
         return self._count
 
+    def _random_level(self):
+        """
+        -------------------------------------------------------
+        Chooses the number of levels for a new node.
+        Private helper method - used only by other ADT methods.
+        Use: level = self._random_level()
+        -------------------------------------------------------
+        Postconditions:
+            returns
+            level - number of levels, k with probability P^(k-1)(1-P)
+                (1 <= int <= _MAX_LEVEL)
+        -------------------------------------------------------
+        """
+        level = 1
+        while level < self._MAX_LEVEL and random() < self._P:
+            level += 1
+        return level
+
+    def _predecessors(self, key, inclusive):
+        """
+        -------------------------------------------------------
+        Finds, at each level, the last node that comes before key.
+        Private helper method - used only by other ADT methods.
+        Use: previous, rank = self._predecessors(key, inclusive)
+        -------------------------------------------------------
+        Preconditions:
+            key - a partial data element (?)
+            inclusive - if True nodes equal to key count as before key
+                (boolean)
+        Postconditions:
+            returns
+            previous - previous[i] is the last node at level i whose
+                value is < key (<= key if inclusive), _head if there is
+                no such node (list of _SLNode)
+            rank - rank[i] is the position of previous[i], where _head
+                is at position 0 and the first node at position 1
+                (list of int)
+        -------------------------------------------------------
+        """
+        previous = [self._head] * self._MAX_LEVEL
+        rank = [0] * self._MAX_LEVEL
+        node = self._head
+        position = 0
+
+        for level in range(self._level - 1, -1, -1):
+            following = node._next[level]
+
+            if inclusive:
+                while following is not None and following._data <= key:
+                    position += node._width[level]
+                    node = following
+                    following = node._next[level]
+            else:
+                while following is not None and following._data < key:
+                    position += node._width[level]
+                    node = following
+                    following = node._next[level]
+            previous[level] = node
+            rank[level] = position
+        return previous, rank
+
+    def _index_predecessors(self, i):
+        """
+        -------------------------------------------------------
+        Finds, at each level, the last node that comes before index i.
+        Private helper method - used only by other ADT methods.
+        Use: previous = self._index_predecessors(i)
+        -------------------------------------------------------
+        Preconditions:
+            i - a non-negative index (0 <= int < len(self))
+        Postconditions:
+            returns
+            previous - previous[i] is the last node at level i before
+                the node at index i, _head if there is no such node;
+                previous[0]._next[0] is the node at index i
+                (list of _SLNode)
+        -------------------------------------------------------
+        """
+        previous = [self._head] * self._MAX_LEVEL
+        node = self._head
+        position = 0
+
+        for level in range(self._level - 1, -1, -1):
+            following = node._next[level]
+
+            while following is not None and \
+                    position + node._width[level] <= i:
+                position += node._width[level]
+                node = following
+                following = node._next[level]
+            previous[level] = node
+        return previous
+
+    def _unlink(self, previous, node):
+        """
+        -------------------------------------------------------
+        Removes node from the skip list.
+        Private helper method - used only by other ADT methods.
+        Use: self._unlink(previous, node)
+        -------------------------------------------------------
+        Preconditions:
+            previous - previous[i] is the last node at level i before
+                node (list of _SLNode)
+            node - the node to remove (_SLNode)
+        Postconditions:
+            node is unlinked at every level and the widths of the links
+            that passed over it are reduced by 1.
+        -------------------------------------------------------
+        """
+        for level in range(self._level):
+            before = previous[level]
+
+            if before._next[level] is node:
+                before._next[level] = node._next[level]
+                before._width[level] += node._width[level] - 1
+            else:
+                before._width[level] -= 1
+
+        while self._level > 0 and self._head._next[self._level - 1] is None:
+            self._level -= 1
+        self._count -= 1
+        return
+
+    def _load(self, values):
+        """
+        -------------------------------------------------------
+        Replaces the contents of the list with values, without copying,
+        by appending each new node at the tail of every level it
+        belongs to. O(n).
+        Private helper method - used only by other ADT methods.
+        Use: self._load(values)
+        -------------------------------------------------------
+        Preconditions:
+            values - values in sorted order (iterable)
+        Postconditions:
+            The list contains values in order.
+        -------------------------------------------------------
+        """
+        head = self._head
+        head._next = [None] * self._MAX_LEVEL
+        head._width = [0] * self._MAX_LEVEL
+        # rear[i] is the last node at level i, at position rear_rank[i].
+        rear = [head] * self._MAX_LEVEL
+        rear_rank = [0] * self._MAX_LEVEL
+        top = 0
+        position = 0
+
+        for value in values:
+            position += 1
+            level = self._random_level()
+            node = _SLNode(value, [None] * level, [0] * level)
+
+            for i in range(level):
+                rear[i]._next[i] = node
+                rear[i]._width[i] = position - rear_rank[i]
+                rear[i] = node
+                rear_rank[i] = position
+            if level > top:
+                top = level
+
+        for i in range(top):
+            # The last link at each level reaches just past the rear.
+            rear[i]._width[i] = position + 1 - rear_rank[i]
+        self._level = top
+        self._count = position
+        return
+
+    def _values(self):
+        """
+        -------------------------------------------------------
+        Generates the values of the list from front to rear, without
+        copying.
+        Private helper method - used only by other ADT methods.
+        Use: for v in self._values():
+        -------------------------------------------------------
+        Postconditions:
+            yields
+            value - the next value in the list (?)
+        -------------------------------------------------------
+        """
+        current = self._head._next[0]
+
+        while current is not None:
+            yield current._data
+            current = current._next[0]
+
     def insert(self, value):
         """
         -------------------------------------------------------
@@ -88,57 +302,62 @@ class SortedList:
             value inserted at its sorted position within the sorted list.
         -------------------------------------------------------
         """
-        previous = None
-        current = self._front
+        # Insert after any values equal to value.
+        previous, rank = self._predecessors(value, True)
+        level = self._random_level()
 
-        # Loop through the linked list to find the proper position for _data.
-        while current is not None and value >= current._data:
-            previous = current
-            current = current._next
+        if level > self._level:
+            for i in range(self._level, level):
+                # A new level: its head link reaches just past the rear.
+                self._head._next[i] = None
+                self._head._width[i] = self._count + 1
+            self._level = level
 
-        # Create the new node and link it to current.
-        node = _SLNode(deepcopy(value), current)
+        node = _SLNode(self._copy(value), [None] * level, [0] * level)
+        position = rank[0] + 1
 
-        if previous is None:
-            # The new node is the first node in the linked list.
-            self._front = node
-        else:
-            # The previous node is linked to the new node.
-            previous._next = node
+        for i in range(level):
+            before = previous[i]
+            node._next[i] = before._next[i]
+            node._width[i] = rank[i] + before._width[i] + 1 - position
+            before._next[i] = node
+            before._width[i] = position - rank[i]
+
+        for i in range(level, self._level):
+            # Links above the new node now pass over one more position.
+            previous[i]._width[i] += 1
 
-        # Increment the priority queue size.
+        # Increment the list size.
         self._count += 1
+        return
 
-    def _linear_search(self, key):
+    def _search(self, key):
         """
-        Cannot do a (simple) binary search on a linked structure. 
         -------------------------------------------------------
-        Searches for the first occurrence of key in the sorted list. 
+        Searches for the first occurrence of key in the sorted list.
         Performs a stable search.
         Private helper method - used only by other ADT methods.
-        Use: i = self._linear_search(key)
+        Use: previous, current, index = self._search(key)
         -------------------------------------------------------
         Preconditions:
             key - a partial data element (?)
         Postconditions:
             returns
-            previous - pointer to the node previous to the node containing key (_ListNode)
-            current - pointer to the node containing key (_ListNode)
+            previous - previous[i] is the last node at level i before
+                the node containing key (list of _SLNode)
+            current - pointer to the node containing key, None if key
+                not found (_SLNode)
             index - index of the node containing key, -1 if key not found (int)
         -------------------------------------------------------
         """
-        previous = None
-        current = self._front
-        index = 0
-  
-        while current is not None and current._data != key:
-            previous = current
-            current = current._next
-            index +=1
-        
-        if current is None:
+        previous, rank = self._predecessors(key, False)
+        current = previous[0]._next[0]
+
+        if current is not None and current._data == key:
+            index = rank[0]
+        else:
+            current = None
             index = -1
-        
         return previous, current, index
 
     def remove(self, key):
@@ -154,22 +373,15 @@ class SortedList:
             value - the full value matching key, otherwise None (?)
         -------------------------------------------------------
         """
-        assert self._front is not None, "Cannot remove from an empty list"
-       
-        previous, current, index = self._linear_search(key)
-        if index == -1:
+        assert self._count > 0, "Cannot remove from an empty list"
+
+        previous, current, _ = self._search(key)
+
+        if current is None:
             value = None
-        else: 
+        else:
             value = current._data
-            if previous is None:
-                self._front = current._next
-                #setting the new front to the next node if the first number is equal o key
-            else:
-                previous._next = current._next
-                #we're removing the node by skipping over the current current data npde
-             
-            self._count -=1
-            
+            self._unlink(previous, current)
         return value
 
     def find(self, key):
@@ -185,14 +397,14 @@ class SortedList:
             value - a copy of the full value matching key, otherwise None (?)
         -------------------------------------------------------
         """
-        assert self._front is not None, "Cannot find in an empty list"
-       
-        _,current,_ = self._linear_search(key)
+        assert self._count > 0, "Cannot find in an empty list"
+
+        _, current, _ = self._search(key)
+
         if current is not None:
-            value = deepcopy(current._data)
+            value = self._copy(current._data)
         else:
             value = None
-
         return value
 
     def peek(self):
@@ -206,10 +418,9 @@ class SortedList:
             value - a copy of the first value in the list (?)
         -------------------------------------------------------
         """
-        assert self._front is not None, "Cannot peek at an empty list"
-
-        value = deepcopy(self._front._data)
+        assert self._count > 0, "Cannot peek at an empty list"
 
+        value = self._copy(self._head._next[0]._data)
         return value
 
     def index(self, key):
@@ -226,8 +437,7 @@ class SortedList:
               key is not in the list.
         -------------------------------------------------------
         """
-        _, _, i = self._linear_search(key)
-
+        _, _, i = self._search(key)
         return i
 
     def _valid_index(self, i):
@@ -263,18 +473,12 @@ class SortedList:
         """
         assert self._valid_index(i), "Invalid index value"
 
-        current = self._front
-
         if i < 0:
             # negative index - convert to positive
             i = self._count + i
-        j = 0
-
-        while j < i:
-            current = current._next
-            j += 1
 
-        value = deepcopy(current._data)
+        previous = self._index_predecessors(i)
+        value = self._copy(previous[0]._next[0]._data)
         return value
 
     def __contains__(self, key):
@@ -290,8 +494,7 @@ class SortedList:
             True if the list contains key, False otherwise.
         -------------------------------------------------------
         """
-        _,current,_ = self._linear_search(key)
-
+        _, current, _ = self._search(key)
         return current is not None
 
     def max(self):
@@ -305,16 +508,15 @@ class SortedList:
             value - a copy of the maximum value in the sorted list (?)
         -------------------------------------------------------
         """
-        assert self._front is not None, "Cannot find maximum of an empty list"
+        assert self._count > 0, "Cannot find maximum of an empty list"
 
-        current = self._front
-        value = current._data
-        
-        while current is not None:
-            if current._data > value:
-                value = deepcopy(current._data)
-            current = current._next 
+        node = self._head
 
+        for level in range(self._level - 1, -1, -1):
+            while node._next[level] is not None:
+                node = node._next[level]
+
+        value = self._copy(node._data)
         return value
 
     def min(self):
@@ -328,16 +530,9 @@ class SortedList:
             value - a copy of the minimum value in the sorted list (?)
         -------------------------------------------------------
         """
-        assert self._front is not None, "Cannot find minimum of an empty list"
-
-        current = self._front
-        value = current._data
-        
-        while current is not None:
-            if current._data < value:
-                value = deepcopy(current._data)
-            current = current._next 
+        assert self._count > 0, "Cannot find minimum of an empty list"
 
+        value = self._copy(self._head._next[0]._data)
         return value
 
     def count(self, key):
@@ -353,13 +548,11 @@ class SortedList:
             number - the number of times key appears in the sorted list (int)
         -------------------------------------------------------
         """
-        current = self._front
-        number = 0
-        while current is not None:
-            if current._data == key:
-                number += 1
-            current = current._next
-            
+        # Equal values are adjacent: count the positions between the
+        # last value < key and the last value <= key.
+        _, before = self._predecessors(key, False)
+        _, through = self._predecessors(key, True)
+        number = through[0] - before[0]
         return number
 
     def clean(self):
@@ -373,27 +566,17 @@ class SortedList:
             in the list. The first occurrence of each value is preserved.
         -------------------------------------------------------
         """
-        key_node = self._front
-
-        while key_node is not None:
-            # Loop through every node - compare each node with the rest
-            previous = key_node
-            current = key_node._next
-
-            while current is not None:
-                # Always search to the end of the list (may have > 1 duplicate)
-                if current._data == key_node._data:
-                    # Remove the current node by connecting the node before it
-                    # to the node after it.
-                    previous._next = current._next
-                    self._count -= 1
-                else:
-                    previous = current
-                # Move to the _next node.
-                current = current._next
-            # Check for duplicates of the _next remaining node in the list
-            key_node = key_node._next
-        
+        values = []
+        current = self._head._next[0]
+
+        while current is not None:
+            # Duplicates are adjacent in a sorted list.
+            if not values or current._data != values[-1]:
+                values.append(current._data)
+            current = current._next[0]
+
+        if len(values) < self._count:
+            self._load(values)
         return
 
     def pop(self, *i):
@@ -411,48 +594,57 @@ class SortedList:
                 value in the list, value is removed from the list (?)
         -------------------------------------------------------
         """
-        assert self._front is not None, "Cannot pop from an empty list"
+        assert self._count > 0, "Cannot pop from an empty list"
         assert len(i) <= 1, "No more than 1 argument allowed"
 
-        previous = None
-        current = self._front
-
         if len(i) == 1:
+            assert self._valid_index(i[0]), "Invalid index value"
+            index = i[0]
 
-            if i[0] < 0:
+            if index < 0:
                 # index is negative
-                i[0] = self._count + i[0]
-            j = 0
-
-            while j < i[0]:
-                previous = current
-                current = current._next
-                j += 1
+                index = self._count + index
         else:
-            # find and pop the last element
-            j = 0
-
-            while j < (self._count - 1):
-                previous = current
-                current = current._next
-                j += 1
+            # pop the last element
+            index = self._count - 1
 
+        previous = self._index_predecessors(index)
+        current = previous[0]._next[0]
         value = current._data
-
-        if previous is None:
-            # Update the front
-            self._front = current._next
-        else:
-            # Update any other node
-            previous._next = current._next
-        self._count -= 1
+        self._unlink(previous, current)
         return value
 
+    def _merge(self, rs, left, both, right):
+        """
+        -------------------------------------------------------
+        Walks the current list and rs once in step with
+        sorted_merge.merge_distinct, keeping one copy of each distinct
+        value according to which lists it appears in. O(n + m).
+        Private helper method - used only by other ADT methods.
+        Use: new_list = self._merge(rs, left, both, right)
+        -------------------------------------------------------
+        Preconditions:
+            rs - another list (SortedList)
+            left - keep values found only in the current list (boolean)
+            both - keep values found in both lists (boolean)
+            right - keep values found only in rs (boolean)
+        Postconditions:
+            returns
+            new_list - one copy of each value kept, taken from the
+                current list where it appears in both (SortedList)
+        -------------------------------------------------------
+        """
+        values = merge_distinct(self._values(), rs._values(),
+                                left, both, right, self._copy)
+        new_list = SortedList(copy=self._copy_policy)
+        new_list._load(values)
+        return new_list
+
     def intersection(self, rs):
         """
         -------------------------------------------------------
         Copies only the values common to both the current list and rs
-        to a new list.
+        to a new list. O(n + m).
         -------------------------------------------------------
         Preconditions:
             rs - another list (SortedList)
@@ -462,29 +654,13 @@ class SortedList:
                 and rs (SortedList)
         -------------------------------------------------------
         """
-        new_list = SortedList()
-        temp = rs._front
-
-        while temp is not None:
-            _, current, _ = self._linear_search(temp._data)
-
-            if current is not None:
-                # Value exists in both lists.
-                _, current, _ = new_list._linear_search(temp._data)
-
-                if current is None:
-                    # Value does not appear in new list.
-                    new_list.insert(0, temp._data)
-
-            temp = temp._next
-
-        return new_list
+        return self._merge(rs, False, True, False)
 
     def union(self, rs):
         """
         -------------------------------------------------------
         Copies all of the values in both self and rs to
-        a new List. Each value appears only once. (iterative)
+        a new List. Each value appears only once. O(n + m).
         -------------------------------------------------------
         Preconditions:
         rs - another List (SortedList)
@@ -494,61 +670,86 @@ class SortedList:
         in both self and rs. (SortedList)
         -------------------------------------------------------
         """
-        new_list = SortedList()
-
-        temp = self._front
-        temp2 = rs._front
-        
-        while temp is not None:
-            _,_,in_nL = new_list._linear_search(temp._data)
-            if in_nL is -1:
-                new_list.insert(temp._data)
-            temp = temp._next
-        while temp2 is not None:
-            _,_,in_nL = new_list._linear_search(temp2._data)
-            if in_nL is -1:
-                new_list.insert(temp2._data)
-            temp2 = temp2._next
-        return new_list
+        return self._merge(rs, True, True, True)
 
-    def remove_front(self):
+    def difference(self, rs):
         """
         -------------------------------------------------------
-        Removes first node in list.
-        Use: value = sl.remove_front()
+        Copies the values in the current list that are not in rs to
+        a new list. Each value appears only once. O(n + m).
+        Use: new_list = sl.difference(rs)
         -------------------------------------------------------
+        Preconditions:
+            rs - another list (SortedList)
         Postconditions:
-          Returns:
-          value - the first value in the list, None if the list is empty.
+            returns
+            new_list - contains one copy of each value in the current
+                list but not in rs (SortedList)
         -------------------------------------------------------
         """
-        value = self._front._data
-        self._front = self._front._next
-        self._count -= 1
-        
-        return value
+        return self._merge(rs, True, False, False)
 
-    def _reverse(self):
+    def symmetric_difference(self, rs):
         """
         -------------------------------------------------------
-        Helper method - reverses the order of the elements in list.
-        Use: l._reverse()
+        Copies the values that are in exactly one of the current list
+        and rs to a new list. Each value appears only once. O(n + m).
+        Use: new_list = sl.symmetric_difference(rs)
         -------------------------------------------------------
+        Preconditions:
+            rs - another list (SortedList)
         Postconditions:
-            The contents of list are reversed in order with respect
-            to their order before the method was called.
+            returns
+            new_list - contains one copy of each value in only one of
+                the current list and rs (SortedList)
         -------------------------------------------------------
         """
-        new_front = None
+        return self._merge(rs, True, False, True)
 
-        while self._front is not None:
-            temp = self._front._next
-            self._front._next = new_front
-            new_front = self._front
-            self._front = temp
+    @classmethod
+    def merge_many(cls, lists, copy="deep"):
+        """
+        -------------------------------------------------------
+        Merges any number of sorted lists into a new sorted list with
+        a k-way heap merge. Duplicates are kept; equal values keep the
+        order of the lists they came from. O(n log k) for n values in
+        k lists.
+        Use: sl = SortedList.merge_many(lists)
+        -------------------------------------------------------
+        Preconditions:
+            lists - sorted lists to merge (iterable of SortedList)
+            copy - copy policy of the new list: "deep", "shallow",
+                or "none" (str)
+        Postconditions:
+            returns
+            new_list - a copy of every value in lists, in sorted order.
+                lists are unchanged. (SortedList)
+        -------------------------------------------------------
+        """
+        new_list = cls(copy=copy)
+        values = merge_all([sl._values() for sl in lists], new_list._copy)
+        new_list._load(values)
+        return new_list
 
-        self._front = new_front
-        return
+    def remove_front(self):
+        """
+        -------------------------------------------------------
+        Removes first node in list.
+        Use: value = sl.remove_front()
+        -------------------------------------------------------
+        Postconditions:
+          Returns:
+          value - the first value in the list, None if the list is empty.
+        -------------------------------------------------------
+        """
+        current = self._head._next[0]
+
+        if current is None:
+            value = None
+        else:
+            value = current._data
+            self._unlink([self._head] * self._MAX_LEVEL, current)
+        return value
 
     def __iter__(self):
         """
@@ -563,9 +764,8 @@ class SortedList:
             value - the next value in the list (?)
         -------------------------------------------------------
         """
-        current = self._front
+        current = self._head._next[0]
 
         while current is not None:
             yield current._data
-            current = current._next
-            
+            current = current._next[0]
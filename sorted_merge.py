@@ -0,0 +1,92 @@
+"""
+-------------------------------------------------------
+sorted_merge.py
+Merge walks shared by the SortedList implementations.
+-------------------------------------------------------
+Author:  David Brown
+ID:      999999999
+Email:   dbrown@wlu.ca
+__updated__ = "2026-10-18"
+-------------------------------------------------------
+"""
+# Imports
+from heapq import merge
+
+# Constants
+# Marks the end of a merged sequence.
+_END = object()
+
+
+def merge_distinct(source, target, left, both, right, copy):
+    """
+    -------------------------------------------------------
+    Walks two sorted sequences once in step, keeping one copy of each
+    distinct value according to which sequences it appears in. This
+    is the basis of the SortedList set operations. O(n + m).
+    Use: values = merge_distinct(source, target, left, both, right, copy)
+    -------------------------------------------------------
+    Preconditions:
+        source - values in ascending order (iterable)
+        target - values in ascending order (iterable)
+        left - keep values found only in source (boolean)
+        both - keep values found in both source and target (boolean)
+        right - keep values found only in target (boolean)
+        copy - function that returns a copy of a value (function)
+    Postconditions:
+        returns
+        values - a copy of each value kept in ascending order, taken
+            from source where it appears in both (list)
+    -------------------------------------------------------
+    """
+    values = []
+    source = iter(source)
+    target = iter(target)
+    v1 = next(source, _END)
+    v2 = next(target, _END)
+
+    while v1 is not _END or v2 is not _END:
+        if v2 is _END or v1 is not _END and not v2 < v1:
+            value = v1
+        else:
+            value = v2
+
+        # Skip every copy of value in both sequences.
+        in_left = False
+        while v1 is not _END and not value < v1:
+            in_left = True
+            v1 = next(source, _END)
+        in_right = False
+        while v2 is not _END and not value < v2:
+            in_right = True
+            v2 = next(target, _END)
+
+        if in_left and in_right:
+            keep = both
+        elif in_left:
+            keep = left
+        else:
+            keep = right
+
+        if keep:
+            values.append(copy(value))
+    return values
+
+
+def merge_all(sequences, copy):
+    """
+    -------------------------------------------------------
+    Merges any number of sorted sequences with a k-way heap merge.
+    Duplicates are kept; equal values keep the order of the sequences
+    they came from. O(n log k) for n values in k sequences.
+    Use: values = merge_all(sequences, copy)
+    -------------------------------------------------------
+    Preconditions:
+        sequences - values in ascending order (iterable of iterable)
+        copy - function that returns a copy of a value (function)
+    Postconditions:
+        returns
+        values - a copy of every value in sequences in ascending
+            order (list)
+    -------------------------------------------------------
+    """
+    return [copy(value) for value in merge(*sequences)]
@@ -68,6 +68,7 @@ class Sorts:
             # Move the next max node to the front of the sorted list.
             max_node._next = a._front
             a._front = max_node
+        a._set_rear()
         return
 
     @staticmethod
@@ -207,6 +208,7 @@ class Sorts:
             else:
                 node._next = current
                 previous._next = node
+        a._set_rear()
         return
 
     @staticmethod
@@ -223,6 +225,7 @@ class Sorts:
         -------------------------------------------------------
         """
         a._front = Sorts._merge_sort_aux(a._front)
+        a._set_rear()
         return
 
     @staticmethod
@@ -346,6 +349,7 @@ class Sorts:
         -------------------------------------------------------
         """
         a._front = Sorts._quick_sort_aux(a._front)
+        a._set_rear()
         return
 
     @staticmethod
@@ -9,22 +9,27 @@ Email:   dbrown@wlu.ca
 __updated__ = "2017-08-19"
 -------------------------------------------------------
 """
-from copy import deepcopy
+from copy_policy import copier
 
 
 class Stack:
 
-    def __init__(self):
+    def __init__(self, copy="deep"):
         """
         -------------------------------------------------------
         Initializes an empty stack. Data is stored in a list.
         Use: s = Stack()
         -------------------------------------------------------
+        Preconditions:
+            copy - copy policy for values stored and returned: "deep",
+                "shallow", or "none" (str)
         Postconditions:
             Initializes an empty stack.
         -------------------------------------------------------
         """
         self._values = []
+        self._copy_policy = copy
+        self._copy = copier(copy)
         return
 
     def is_empty(self):
@@ -55,7 +60,7 @@ class Stack:
             a copy of value is added to the top of the stack.
         -------------------------------------------------------
         """
-        self._values.append(deepcopy(value))
+        self._values.append(self._copy(value))
         return
 
     def pop(self):
@@ -90,7 +95,7 @@ class Stack:
         """
         assert len(self._values) > 0, "Cannot peek at an empty stack"
 
-        value = deepcopy(self._values[-1])
+        value = self._copy(self._values[-1])
 
         return value
  
@@ -110,7 +115,7 @@ class Stack:
                 are empty (Stack)
         -------------------------------------------------------
         """
-        s3 = Stack()
+        s3 = Stack(copy=self._copy_policy)
         while len(self._values) > 0 or len(s2._values) > 0:
             if len(self._values) > 0 == False:
                 s3._values.append(self._values.pop())
@@ -131,8 +136,8 @@ class Stack:
             s3 - contains other alternating values from current stack (Stack)
         -------------------------------------------------------
         """
-        s2 = Stack()
-        s3 = Stack()
+        s2 = Stack(copy=self._copy_policy)
+        s3 = Stack(copy=self._copy_policy)
         
         while len(self._values) > 0 != True:
             s2._values.append(self._values.pop())
@@ -170,7 +175,7 @@ class Stack:
             and s2. Values do not repeat. q1 and q2 are empty. (Queue)
         -------------------------------------------------------
         """
-        s3 = Stack()
+        s3 = Stack(copy=self._copy_policy)
         for i in self._values:
             for v in s2:
                 if i == v and i not in s3:
@@ -0,0 +1,208 @@
+"""
+-------------------------------------------------------
+top_k.py
+Bounded tracker of the K largest values in a stream.
+-------------------------------------------------------
+Author:  David Brown
+ID:      999999999
+Email:   dbrown@wlu.ca
+__updated__ = "2026-10-18"
+-------------------------------------------------------
+"""
+from copy_policy import copier
+from priority_queue_array import PriorityQueue
+
+
+class TopK:
+
+    def __init__(self, k, key=None, copy="deep"):
+        """
+        -------------------------------------------------------
+        Initializes an empty top-K tracker. The K largest values seen
+        so far are kept in a PriorityQueue of (key, order, value)
+        entries whose front is the smallest value kept, so each offer
+        is O(log k) and memory is O(k) however long the stream is.
+        Among values with equal keys the earliest offered are kept.
+        Use: top = TopK(k)
+        Use: top = TopK(k, key=lambda f: f.calories)
+        -------------------------------------------------------
+        Preconditions:
+            k - number of values to keep (int > 0)
+            key - function that returns the comparison key of a value,
+                None to compare values directly. Use a key such as
+                lambda v: -v to keep the K smallest values. (function)
+            copy - copy policy for values stored and returned: "deep",
+                "shallow", or "none" (str)
+        Postconditions:
+            Initializes an empty top-K tracker.
+        -------------------------------------------------------
+        """
+        assert k > 0, "k must be > 0"
+
+        self._k = k
+        self._key = key
+        self._pq = PriorityQueue(copy="none")
+        self._offered = 0
+        self._copy_policy = copy
+        self._copy = copier(copy)
+        return
+
+    def __len__(self):
+        """
+        -------------------------------------------------------
+        Returns the number of values kept.
+        Use: n = len(top)
+        -------------------------------------------------------
+        Postconditions:
+            returns
+            the number of values kept, at most k (int)
+        -------------------------------------------------------
+        """
+        return len(self._pq)
+
+    def is_empty(self):
+        """
+        -------------------------------------------------------
+        Determines if no values are kept.
+        Use: b = top.is_empty()
+        -------------------------------------------------------
+        Postconditions:
+            returns
+            True if no values are kept, False otherwise.
+        -------------------------------------------------------
+        """
+        return self._pq.is_empty()
+
+    def offer(self, value):
+        """
+        -------------------------------------------------------
+        Offers a value to the tracker. O(log k).
+        Use: kept = top.offer(value)
+        -------------------------------------------------------
+        Preconditions:
+            value - a data element (?)
+        Postconditions:
+            returns
+            kept - True if a copy of value is now one of the K largest
+                values, False otherwise. If the tracker was full the
+                smallest value kept is discarded to make room. (boolean)
+        -------------------------------------------------------
+        """
+        if self._key is None:
+            key = value
+        else:
+            key = self._key(value)
+        return self._offer_keyed(value, key)
+
+    def _offer_keyed(self, value, key):
+        """
+        -------------------------------------------------------
+        Offers a value whose comparison key is already known. O(log k).
+        Private helper method - used only by other ADT methods.
+        Use: kept = self._offer_keyed(value, key)
+        -------------------------------------------------------
+        Preconditions:
+            value - a data element (?)
+            key - the comparison key of value (?)
+        Postconditions:
+            returns
+            kept - True if a copy of value is now one of the K largest
+                values, False otherwise (boolean)
+        -------------------------------------------------------
+        """
+        # Negated order: of two equal keys the later one is smaller.
+        entry = (key, -self._offered, value)
+        self._offered += 1
+
+        if len(self._pq) < self._k:
+            kept = True
+        else:
+            kept = self._pq.peek() < entry
+            if kept:
+                self._pq.remove()
+
+        if kept:
+            self._pq.insert((key, entry[1], self._copy(value)))
+        return kept
+
+    def offer_many(self, values):
+        """
+        -------------------------------------------------------
+        Offers every value in an iterable to the tracker. Values that
+        cannot be kept are rejected with a single comparison against
+        the smallest value kept.
+        Use: n = top.offer_many(values)
+        -------------------------------------------------------
+        Preconditions:
+            values - an iterable of data elements (iterable)
+        Postconditions:
+            returns
+            number - the number of values kept when offered (int)
+        -------------------------------------------------------
+        """
+        number = 0
+        key_func = self._key
+        pq = self._pq
+        threshold = None
+
+        for value in values:
+            if key_func is None:
+                key = value
+            else:
+                key = key_func(value)
+
+            if len(pq) < self._k:
+                number += self._offer_keyed(value, key)
+            else:
+                if threshold is None:
+                    threshold = pq.peek()
+
+                if key <= threshold[0]:
+                    # Equal keys lose to the earlier value already kept.
+                    self._offered += 1
+                elif self._offer_keyed(value, key):
+                    number += 1
+                    threshold = None
+        return number
+
+    def extract(self):
+        """
+        -------------------------------------------------------
+        Returns copies of the values kept, largest first. Equal keys
+        are in the order their values were offered. The entries are
+        removed from the priority queue smallest first and then
+        rebuilt into it. O(k log k). The tracker is unchanged.
+        Use: values = top.extract()
+        -------------------------------------------------------
+        Postconditions:
+            returns
+            values - the K largest values offered, largest first (list)
+        -------------------------------------------------------
+        """
+        entries = []
+
+        while not self._pq.is_empty():
+            entries.append(self._pq.remove())
+
+        self._pq = PriorityQueue.from_iterable(entries, copy="none")
+        values = []
+
+        for entry in reversed(entries):
+            values.append(self._copy(entry[2]))
+        return values
+
+    def __iter__(self):
+        """
+        FOR TESTING ONLY
+        -------------------------------------------------------
+        Generates a Python iterator. Iterates through copies of the
+        values kept, largest first.
+        Use: for v in top:
+        -------------------------------------------------------
+        Postconditions:
+            yields
+            value - the next value kept (?)
+        -------------------------------------------------------
+        """
+        for value in self.extract():
+            yield value
@@ -9,12 +9,15 @@ Email: assa7370@mylaurier.ca
 _updated_="2018-01-12"
 ----------------------------------------------------
 """
+import io
+from contextlib import redirect_stdout
 from food import Food
 from stack_array import Stack
 from queue_array import Queue
 from list_array import List
 from priority_queue_array import PriorityQueue
 from queue_circular import CircularQueue
+from hash_set_array import HashSet
 
 def array_to_stack(s, a):
     """
@@ -249,4 +252,91 @@ def queue_circular_test(a):
     print("Remove test: {}".format(cq.remove()))
     print("Peek test: {}".format(cq.peek()))
     for i in cq:
-        print(i)
\ No newline at end of file
+        print(i)
+
+
+def hash_set_incremental_test(n=3000):
+    """
+    -------------------------------------------------------
+    Tests the incremental rehash mode of the array HashSet. The keys
+    are multiples of 3, so when the final number of slots is also a
+    multiple of 3, as it is for the default n, most slots are never
+    used and stay unallocated.
+    Use: hash_set_incremental_test()
+    -------------------------------------------------------
+    Preconditions:
+        n - number of keys to insert (int > 0)
+    Postconditions:
+        insert, find, __contains__, remove and iteration agree with a
+        Python set throughout, and each operation moves a rehash on by
+        at most one bounded step; an AssertionError is raised otherwise.
+    -------------------------------------------------------
+    """
+    hs = HashSet(1, copy="none", incremental=True)
+    keys = set()
+    rehashed = False
+    remaining = 0
+
+    def step(remaining):
+        # While the new table is allocated rehash_remaining() holds
+        # steady, then each operation moves _MIGRATE_SLOTS old slots.
+        now = hs.rehash_remaining()
+
+        if not hs.is_rehashing():
+            assert now == 0, "Rehash remaining test failed"
+        elif remaining > 0:
+            assert now in (remaining, remaining - HashSet._MIGRATE_SLOTS), \
+                "Rehash step test failed: {} to {}".format(remaining, now)
+        else:
+            assert now > 0, "Rehash start test failed"
+        return now
+
+    for i in range(n):
+        key = 3 * i
+        assert hs.insert(key), "Insert test failed: {}".format(key)
+        keys.add(key)
+        remaining = step(remaining)
+        rehashed = rehashed or hs.is_rehashing()
+        assert key in hs, "Contains test failed: {}".format(key)
+        remaining = step(remaining)
+        assert hs.find(key) == key, "Find test failed: {}".format(key)
+        remaining = step(remaining)
+        # Keys that are not multiples of 3 are never inserted.
+        assert key + 1 not in hs, "Missing key test failed: {}".format(key + 1)
+        remaining = step(remaining)
+        assert hs.find(key + 1) is None, \
+            "Missing key test failed: {}".format(key + 1)
+        remaining = step(remaining)
+        assert len(hs) == len(keys), "Length test failed"
+
+    assert rehashed, "No incremental rehash took place"
+    assert sorted(hs) == sorted(keys), "Iteration test failed"
+
+    # Finish any rehash with lookups, which must step it to the end.
+    while hs.is_rehashing():
+        assert hs.find(-1) is None, "Missing key test failed: -1"
+        remaining = step(remaining)
+
+    # Looking up missing keys must not allocate slots.
+    out = io.StringIO()
+    with redirect_stdout(out):
+        hs.debug()
+    unallocated = out.getvalue().count("(unallocated)")
+    assert unallocated > 0, "No unallocated slots to test"
+
+    for i in range(n):
+        assert hs.find(3 * n + 3 * i + 1) is None, "Missing key test failed"
+
+    out = io.StringIO()
+    with redirect_stdout(out):
+        hs.debug()
+    assert out.getvalue().count("(unallocated)") == unallocated, \
+        "Lookup allocated slots"
+
+    for i in range(0, n, 2):
+        assert hs.remove(3 * i) == 3 * i, "Remove test failed: {}".format(3 * i)
+        keys.discard(3 * i)
+        remaining = step(remaining)
+
+    assert sorted(hs) == sorted(keys), "Iteration after remove failed"
+    return